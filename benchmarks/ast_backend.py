@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+AST Backend Benchmark
+=====================
+
+Compares three ways of getting a converted program from text to a ground
+program: adding the text to a clingo.Control, adding statements parsed into
+a fresh StatementCache (cold), and adding the statements of a cache that
+already holds the program's chunks (warm, as when a rule set is solved
+again). The times cover loading and grounding, not conversion.
+
+Usage:
+    python benchmarks/ast_backend.py [sleec_dir] [repeats]
+
+Example:
+    python benchmarks/ast_backend.py sleec_files/case_studies 7
+"""
+
+import os
+import sys
+import warnings
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.satisfaction_encoding import best_time
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+    from converter.program_ast import StatementCache, add_program
+except ImportError:
+    clingo = None
+
+MODES = ("text", "cold", "warm")
+
+
+def load_and_ground(chunks, mode: str, cache=None) -> None:
+    """Load a chunked program in the given mode and ground it"""
+    control = clingo.Control(["--warn=none"], logger=lambda code, message: None)
+    if mode == "text":
+        control.add("base", [], "".join(chunks))
+    else:
+        add_program(control, chunks, StatementCache() if mode == "cold" else cache)
+    control.ground([("base", [])])
+
+
+def main():
+    if clingo is None:
+        print("❌ The clingo Python module is required for this benchmark")
+        sys.exit(1)
+
+    corpus = Path(sys.argv[1] if len(sys.argv) > 1 else "sleec_files/case_studies")
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    warnings.simplefilter("ignore")
+
+    print(f"{'file':<24} {'text ms':>9} {'cold ms':>9} {'warm ms':>9}")
+    totals = dict.fromkeys(MODES, 0.0)
+    for path in sorted(corpus.rglob("*.sleec")):
+        try:
+            chunks = list(SleecToClingoConverter().iter_convert_file(str(path)))
+            cache = StatementCache()
+            load_and_ground(chunks, "warm", cache)
+        except (ValueError, RuntimeError) as e:
+            print(f"{path.name:<24} skipped: {str(e).splitlines()[0]}")
+            continue
+        row = {mode: best_time(lambda: load_and_ground(chunks, mode, cache), repeats) for mode in MODES}
+        for mode in MODES:
+            totals[mode] += row[mode]
+        print(f"{path.name:<24} " + " ".join(f"{row[mode] * 1000:>9.2f}" for mode in MODES))
+
+    print(f"\nTotal text-to-ground: text {totals['text'] * 1000:.1f} ms, "
+          f"cold {totals['cold'] * 1000:.1f} ms, warm {totals['warm'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Conflict Analysis Benchmark
+===========================
+
+Checks every rule pair of a SLEEC file for conflicts twice: naively, by
+converting, grounding and solving a separate program for every rule and
+every pair, and with a ConflictAnalyzer that grounds the rule set once and
+solves under assumptions. Reports the wall time of both and checks that they
+find the same conflicts.
+
+Usage:
+    python benchmarks/conflicts.py [sleec_file] [max_time]
+
+Example:
+    python benchmarks/conflicts.py sleec_files/case_studies/CSICobot.sleec 3
+"""
+
+import os
+import sys
+import time
+import warnings
+from itertools import combinations
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from converter.config import ConverterConfig
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+    from converter.conflicts import ConflictAnalyzer, activation_program
+except ImportError:
+    clingo = None
+
+
+def satisfiable(content: str, config: ConverterConfig, active, triggered) -> bool:
+    """Convert the rule set and solve a program with only the given rules active and triggered"""
+    converter = SleecToClingoConverter(config)
+    program = activation_program(converter.convert_sleec_string(content), converter.rules)
+    facts = [f"active({rule_id})." for rule_id in active]
+    facts.extend(f":- not triggered({rule_id})." for rule_id in triggered)
+    control = clingo.Control(logger=lambda code, message: None)
+    control.add("base", [], program + "\n".join(facts))
+    control.ground([("base", [])])
+    return control.solve().satisfiable
+
+
+def naive_conflicts(content: str, config: ConverterConfig, rules):
+    """Conflicting pairs found with one program per rule and per pair"""
+    candidates = [rule_id for rule_id in rules
+                  if satisfiable(content, config, [], [rule_id])
+                  and satisfiable(content, config, [rule_id], [rule_id])]
+    return [pair for pair in combinations(candidates, 2)
+            if not satisfiable(content, config, pair, pair) and satisfiable(content, config, [], pair)]
+
+
+def main():
+    if clingo is None:
+        print("❌ The clingo Python module is required for this benchmark")
+        sys.exit(1)
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else "sleec_files/case_studies/CSICobot.sleec"
+    config = ConverterConfig(max_time=int(sys.argv[2]) if len(sys.argv) > 2 else 3)
+    warnings.simplefilter("ignore")
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    start = time.perf_counter()
+    analyzer = ConflictAnalyzer(content, config)
+    report = analyzer.analyse()
+    analyzer_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = naive_conflicts(content, config, analyzer.rules)
+    naive_seconds = time.perf_counter() - start
+
+    print(f"{os.path.basename(filename)}: {len(report.rules)} rules, {report.pairs_checked} pairs, "
+          f"{len(report.conflicts)} conflicts")
+    print(f"one program per rule and pair:        {naive_seconds * 1000:9.1f} ms")
+    print(f"ground once, solve under assumptions: {analyzer_seconds * 1000:9.1f} ms ({report.solves} solves)")
+    if [conflict.rules for conflict in report.conflicts] != expected:
+        print("❌ The two approaches disagree")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Event Reference Micro-Benchmark
+===============================
+
+Compares the old event substitution, which ran one re.sub per declared event
+over every condition, with the current approach where ConditionParser
+resolves event names in the same single pass that parses the condition.
+
+Usage:
+    python benchmarks/event_substitution.py [sleec_dir] [repeats]
+
+Example:
+    python benchmarks/event_substitution.py sleec_files/case_studies 20
+"""
+
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from converter.parser import SleecParser
+from converter.conditions import ConditionParser
+
+
+def per_event_substitution(conditions, event_names):
+    """The removed _replace_event_references: one regex scan per event"""
+    for condition in conditions:
+        condition = condition.lower()
+        for event_name in event_names:
+            condition = re.sub(rf'\b{event_name}\b', f'happens({event_name}, T, T)', condition)
+
+
+def single_pass_resolution(conditions, event_names):
+    """Current behaviour: events resolved while parsing the condition once"""
+    parser = ConditionParser(event_names)
+    for condition in conditions:
+        parser.parse_string(condition)
+
+
+def load_conditions(path: Path):
+    """Return (event names, condition texts) for a SLEEC file"""
+    events, _, _, rules = SleecParser().parse_file(str(path))
+    conditions = [rule.condition for rule in rules]
+    for rule in rules:
+        conditions.extend(clause.condition for clause in rule.unless_clauses or [])
+    return [event.name.lower() for event in events], conditions
+
+
+def best_time(function, *args, repeats: int) -> float:
+    """Best wall time of several runs, in seconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    corpus = Path(sys.argv[1] if len(sys.argv) > 1 else "sleec_files/case_studies")
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f"{'file':<20} {'events':>6} {'conds':>6} {'per-event ms':>13} {'single-pass ms':>15} {'speedup':>8}")
+    total_old = total_new = 0.0
+
+    for path in sorted(corpus.glob("*.sleec")):
+        try:
+            event_names, conditions = load_conditions(path)
+        except ValueError as e:
+            print(f"{path.name:<20} skipped: {str(e).splitlines()[0]}")
+            continue
+
+        old = best_time(per_event_substitution, conditions, event_names, repeats=repeats)
+        new = best_time(single_pass_resolution, conditions, event_names, repeats=repeats)
+        total_old += old
+        total_new += new
+        print(f"{path.name:<20} {len(event_names):>6} {len(conditions):>6} "
+              f"{old * 1000:>13.3f} {new * 1000:>15.3f} {old / new:>7.1f}x")
+
+    if total_new:
+        print(f"\nTotal: {total_old * 1000:.3f} ms → {total_new * 1000:.3f} ms ({total_old / total_new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Incremental Horizon Benchmark
+=============================
+
+Checks the consistency of a SLEEC file at every horizon 0..N twice: with an
+IncrementalSolver that grounds one more time point per step into the same
+clingo.Control, and by converting, grounding and solving time(0..h) from
+scratch for every horizon h. Reports the total time of both and checks that
+they agree on which horizons are consistent.
+
+Usage:
+    python benchmarks/incremental.py [sleec_file] [max_horizon]
+
+Example:
+    python benchmarks/incremental.py sleec_files/case_studies/CSICobot.sleec 10
+"""
+
+import os
+import sys
+import time
+import warnings
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from converter.config import ConverterConfig
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+    from converter.multishot import IncrementalSolver
+except ImportError:
+    clingo = None
+
+
+def consistent_from_scratch(content: str, horizon: int) -> bool:
+    """Convert, ground and solve the rule set over time(0..horizon)"""
+    program = SleecToClingoConverter(ConverterConfig(max_time=horizon)).convert_sleec_string(content)
+    control = clingo.Control(logger=lambda code, message: None)
+    control.add("base", [], program)
+    control.ground([("base", [])])
+    return control.solve().satisfiable
+
+
+def main():
+    if clingo is None:
+        print("❌ The clingo Python module is required for this benchmark")
+        sys.exit(1)
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else "sleec_files/case_studies/CSICobot.sleec"
+    max_horizon = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    warnings.simplefilter("ignore")
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    start = time.perf_counter()
+    solver = IncrementalSolver(content)
+    incremental = [solver.step() is not None for _ in range(max_horizon + 1)]
+    incremental_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [consistent_from_scratch(content, horizon) for horizon in range(max_horizon + 1)]
+    scratch_seconds = time.perf_counter() - start
+
+    print(f"{os.path.basename(filename)}: horizons 0..{max_horizon}, {sum(expected)} consistent")
+    print(f"reconvert + reground per horizon: {scratch_seconds * 1000:9.1f} ms")
+    print(f"incremental steps:                {incremental_seconds * 1000:9.1f} ms")
+    if incremental != expected:
+        print("❌ The two approaches disagree")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Satisfaction Encoding Benchmark
+===============================
+
+Compares the expanded rule satisfaction logic, which writes holds_nv/holds_v
+rules for every rule id, with the compact encoding, which forbids
+antecedent/consequent disagreement once for all rules. For each SLEEC file of
+a corpus and each synthetic document size it reports the size of the
+generated program, the time clingo needs to parse it and to ground it, and
+the size of the ground program.
+
+Usage:
+    python benchmarks/satisfaction_encoding.py [sleec_dir] [repeats] [synthetic sizes]
+
+Example:
+    python benchmarks/satisfaction_encoding.py sleec_files 5 100,1000
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import WorkloadSpec, generate_sleec
+from converter.config import ConverterConfig
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+except ImportError:
+    clingo = None
+
+ENCODINGS = ("expanded", "compact")
+
+
+def best_time(function, repeats: int) -> float:
+    """Best wall time of several runs, in seconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure_program(program: str, repeats: int) -> dict:
+    """Parse and ground time and ground size of a program"""
+    def control():
+        return clingo.Control(["--warn=none", "--solve-limit=0"], logger=lambda code, message: None)
+
+    def parse():
+        control().add("base", [], program)
+
+    def ground():
+        grounder = control()
+        grounder.add("base", [], program)
+        grounder.ground([("base", [])])
+        return grounder
+
+    parse_seconds = best_time(parse, repeats)
+    ground_seconds = best_time(ground, repeats)
+
+    # Statistics are only filled in by a solve call; the solve limit keeps it trivial
+    grounder = ground()
+    grounder.solve()
+    return {"parse": parse_seconds, "ground": max(ground_seconds - parse_seconds, 0.0),
+            "rules": int(grounder.statistics["problem"]["lp"]["rules"])}
+
+
+def compare(name: str, source: str, repeats: int, totals: dict) -> None:
+    """Print one line comparing both encodings of a SLEEC document"""
+    row = {}
+    for encoding in ENCODINGS:
+        config = ConverterConfig(satisfaction_encoding=encoding)
+        program = SleecToClingoConverter(config).convert_sleec_string(source)
+        row[encoding] = {"kib": len(program) / 1024, **measure_program(program, repeats)}
+        for key, value in row[encoding].items():
+            totals[encoding][key] = totals[encoding].get(key, 0) + value
+
+    old, new = row["expanded"], row["compact"]
+    print(f"{name:<24} {old['kib']:>8.1f} {new['kib']:>8.1f} "
+          f"{old['parse'] * 1000:>9.2f} {new['parse'] * 1000:>9.2f} "
+          f"{old['ground'] * 1000:>9.2f} {new['ground'] * 1000:>9.2f} "
+          f"{old['rules']:>8} {new['rules']:>8}")
+
+
+def main():
+    if clingo is None:
+        print("❌ The clingo Python module is required for this benchmark")
+        sys.exit(1)
+
+    corpus = Path(sys.argv[1] if len(sys.argv) > 1 else "sleec_files")
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    sizes = [int(size) for size in sys.argv[3].split(",")] if len(sys.argv) > 3 else []
+
+    print(f"{'':<24} {'text KiB':>17} {'parse ms':>19} {'ground ms':>19} {'ground rules':>17}")
+    print(f"{'file':<24} {'expanded':>8} {'compact':>8} {'expanded':>9} {'compact':>9} "
+          f"{'expanded':>9} {'compact':>9} {'expanded':>8} {'compact':>8}")
+    totals = {encoding: {} for encoding in ENCODINGS}
+
+    documents = [(path.name, path.read_text()) for path in sorted(corpus.rglob("*.sleec"))]
+    documents.extend((f"synthetic-{size}", generate_sleec(WorkloadSpec.scaled(size))) for size in sizes)
+    for name, source in documents:
+        try:
+            compare(name, source, repeats, totals)
+        except (ValueError, RuntimeError) as e:
+            print(f"{name:<24} skipped: {str(e).splitlines()[0]}")
+
+    old, new = totals["expanded"], totals["compact"]
+    if old:
+        print(f"\nTotal: {old['kib']:.1f} → {new['kib']:.1f} KiB, "
+              f"parse {old['parse'] * 1000:.1f} → {new['parse'] * 1000:.1f} ms, "
+              f"ground {old['ground'] * 1000:.1f} → {new['ground'] * 1000:.1f} ms, "
+              f"{old['rules']} → {new['rules']} ground rules")
+
+
+if __name__ == "__main__":
+    main()
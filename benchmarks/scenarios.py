@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Scenario Throughput Benchmark
+=============================
+
+Answers the same random scenarios against a SLEEC file twice: by appending
+each scenario to the converted program and converting, grounding and solving
+again, and with a ScenarioEngine that grounds once and solves under
+assumptions. Reports scenarios per second for both and checks that the
+answers agree.
+
+Usage:
+    python benchmarks/scenarios.py [sleec_file] [scenarios] [max_time] [seed]
+
+Example:
+    python benchmarks/scenarios.py sleec_files/case_studies/CSICobot.sleec 200 3 42
+"""
+
+import os
+import random
+import sys
+import time
+import warnings
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from converter.config import ConverterConfig
+from converter.parser import MeasureType
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+    from converter.scenarios import Scenario, ScenarioEngine, ScenarioResult
+except ImportError:
+    clingo = None
+
+
+def random_scenarios(engine, count: int, seed: int):
+    """Random trigger times and measure values for the engine's rule set"""
+    rng = random.Random(seed)
+    time_points = list(engine._time_points)
+    scenarios = []
+    for _ in range(count):
+        events = {event: [t for t in time_points if rng.random() < 0.3] for event in engine._triggering_events}
+        measures = {}
+        for name, measure in engine._measures.items():
+            if measure.type == MeasureType.NUMERIC:
+                measures[name] = [rng.randint(engine.config.numeric_min, engine.config.numeric_max) for _ in time_points]
+            elif measure.type == MeasureType.SCALE and measure.scale_values:
+                measures[name] = [rng.choice(measure.scale_values) for _ in time_points]
+            else:
+                measures[name] = [rng.random() < 0.5 for _ in time_points]
+        scenarios.append(Scenario(events=events, measures=measures))
+    return scenarios
+
+
+def solve_from_scratch(content: str, config: ConverterConfig, engine, scenario) -> "ScenarioResult":
+    """Reconvert, reground and solve with the scenario appended as constraints"""
+    program = SleecToClingoConverter(config).convert_sleec_string(content)
+    constraints = [f":- {'not ' if value else ''}{symbol}." for symbol, value in engine.assumptions(scenario)]
+    control = clingo.Control(["--enum-mode=cautious", "--models=0"], logger=lambda code, message: None)
+    control.add("base", [], program + "\n" + "\n".join(constraints))
+    control.ground([("base", [])])
+    required = None
+    with control.solve(yield_=True) as handle:
+        for model in handle:
+            required = [str(symbol) for symbol in model.symbols(shown=True)
+                        if symbol.name == "happens" and symbol.arguments[0].name in engine._action_events]
+    if required is None:
+        return ScenarioResult(consistent=False)
+    return ScenarioResult(consistent=True, required=sorted(required))
+
+
+def main():
+    if clingo is None:
+        print("❌ The clingo Python module is required for this benchmark")
+        sys.exit(1)
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else "sleec_files/case_studies/CSICobot.sleec"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    config = ConverterConfig(max_time=int(sys.argv[3]) if len(sys.argv) > 3 else 3)
+    seed = int(sys.argv[4]) if len(sys.argv) > 4 else 42
+    warnings.simplefilter("ignore")
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    start = time.perf_counter()
+    engine = ScenarioEngine(content, config)
+    scenarios = random_scenarios(engine, count, seed)
+    answers = engine.query_all(scenarios)
+    engine_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [solve_from_scratch(content, config, engine, scenario) for scenario in scenarios]
+    scratch_seconds = time.perf_counter() - start
+
+    consistent = sum(answer.consistent for answer in answers)
+    print(f"{os.path.basename(filename)}: {count} scenarios over time(0..{config.max_time}), {consistent} consistent")
+    print(f"reconvert + reground per scenario: {count / scratch_seconds:9.1f} scenarios/s ({scratch_seconds:.2f} s)")
+    print(f"ground once, solve under assumptions: {count / engine_seconds:6.1f} scenarios/s ({engine_seconds:.2f} s, "
+          f"grounding {engine.ground_seconds * 1000:.1f} ms)")
+    if answers != expected:
+        print("❌ The two approaches disagree")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Solver Throughput Benchmark
+===========================
+
+Solves the programs generated for a corpus of SLEEC files over and over with
+each available SleecSolver backend and reports programs solved per second.
+The in-process backend adds the program text to a clingo.Control directly;
+the subprocess backend pipes it to a clingo executable.
+
+Usage:
+    python benchmarks/solver_throughput.py [sleec_dir] [rounds] [max_time]
+
+Example:
+    python benchmarks/solver_throughput.py sleec_files 20 2
+"""
+
+import os
+import shutil
+import sys
+import time
+import warnings
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from converter.config import ConverterConfig
+from converter.sleec_converter import SleecToClingoConverter
+from converter.solver import SleecSolver, clingo
+
+
+def main():
+    corpus = Path(sys.argv[1] if len(sys.argv) > 1 else "sleec_files")
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    config = ConverterConfig(max_time=int(sys.argv[3]) if len(sys.argv) > 3 else 2)
+
+    backends = [backend for backend, available in (("python", clingo is not None),
+                                                    ("subprocess", shutil.which("clingo") is not None))
+                if available]
+    if not backends:
+        print("❌ Neither the clingo Python module nor a clingo executable is available")
+        sys.exit(1)
+
+    # Horizon warnings for short benchmark horizons are expected
+    warnings.simplefilter("ignore")
+    programs = []
+    for path in sorted(corpus.rglob("*.sleec")):
+        try:
+            programs.append(SleecToClingoConverter(config).convert_file(str(path)))
+        except ValueError as e:
+            print(f"{path.name:<24} skipped: {str(e).splitlines()[0]}")
+
+    for backend in backends:
+        solver = SleecSolver(config, backend=backend)
+        solved = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for program in programs:
+                try:
+                    solver.solve(program, models=1)
+                except ValueError:
+                    continue
+                solved += 1
+        seconds = time.perf_counter() - start
+        print(f"{backend:<12} {solved:>6} solves in {seconds:7.2f} s  {solved / seconds:8.1f} programs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+SLEEC Benchmark Suite
+=====================
+
+Runs every SLEEC file of a corpus through parsing, conversion and, when the
+clingo Python module is installed, grounding and solving. For each phase it
+records the best wall time over several repeats and the peak memory of one
+more run, together with the size of the generated program and of the
+ground program. Peak memory is the growth of the maximum resident set size
+of a forked child process, so it includes clingo's native allocations;
+where fork is not available it falls back to the Python heap as traced by
+tracemalloc, and the results' meta section says which one was measured. Results are written as JSON and can be compared against a
+stored baseline to flag regressions.
+
+With --scaling, synthetic documents of the given rule counts (see
+benchmarks/synthetic.py) are measured instead, to show how parse, convert and
+ground time grow with input size.
+
+Usage:
+    python benchmarks/suite.py [paths...] [--repeats N] [--output results.json]
+                               [--baseline baseline.json] [--update-baseline]
+    python benchmarks/suite.py --scaling 100,1000,10000,100000 [--plot scaling.png]
+
+Example:
+    python benchmarks/suite.py --update-baseline                # record benchmarks/baseline.json
+    python benchmarks/suite.py --baseline                       # compare against benchmarks/baseline.json
+    python benchmarks/suite.py --scaling 1000,10000,100000 --repeats 1
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from converter.batch import collect_sources
+from converter.config import ConverterConfig
+from converter.parser import SleecParser
+from converter.sleec_converter import SleecToClingoConverter
+from benchmarks.synthetic import WorkloadSpec, generate_sleec
+
+try:
+    import clingo
+except ImportError:  # grounding and solving are skipped
+    clingo = None
+
+try:
+    import resource
+except ImportError:  # not on Windows; peak memory is traced with tracemalloc
+    resource = None
+
+DEFAULT_CORPUS = ["sleec_files"]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+PHASES = ("parse", "convert", "ground", "solve")
+SIZES = ("output_bytes", "ground_rules", "ground_atoms")
+
+
+MEMORY_MEASURE = ("max resident set growth of a forked run" if resource is not None and hasattr(os, "fork")
+                  else "Python heap peak (tracemalloc)")
+"""What peak_kib means on this platform"""
+
+
+def peak_memory_kib(function: Callable[[], object]) -> float:
+    """Peak memory of one run of function, in KiB
+
+    The run happens in a forked child, whose maximum resident set size starts
+    near zero and also counts memory allocated outside Python (clingo's
+    grounder and solver). Without fork, only the Python heap is traced.
+    """
+    if resource is None or not hasattr(os, "fork"):
+        tracemalloc.start()
+        try:
+            function()
+            return tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        try:
+            # Keep the collector from touching (and so copying) every inherited object
+            gc.freeze()
+            before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            function()
+            os.write(write_end, str(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_end)
+    with os.fdopen(read_end) as pipe:
+        growth = pipe.read()
+    os.waitpid(pid, 0)
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return float(growth or 0) / (1024 if sys.platform == "darwin" else 1)
+
+
+def measure(function: Callable[[], object], repeats: int) -> Tuple[object, Dict[str, float]]:
+    """Run function repeatedly; return its result, best wall time and peak memory"""
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+
+    # Memory is measured in a separate run so it does not distort timings
+    return result, {"seconds": min(timings), "peak_kib": peak_memory_kib(function)}
+
+
+def ground_program(program: str, models: int = 1) -> "clingo.Control":
+    """Ground a program with the clingo module, discarding its log messages"""
+    control = clingo.Control([f"--models={models}", "--warn=none"], logger=lambda code, message: None)
+    control.add("base", [], program)
+    control.ground([("base", [])])
+    return control
+
+
+def ground_and_solve(program: str, models: int, repeats: int) -> Dict[str, object]:
+    """Ground and solve a program with the clingo module, timing both phases"""
+    def ground() -> "clingo.Control":
+        return ground_program(program, models)
+
+    def solve() -> "clingo.SolveResult":
+        return ground().solve()
+
+    _, ground_stats = measure(ground, repeats)
+    solve_result, total_stats = measure(solve, repeats)
+
+    control = ground()
+    control.solve()
+    lp = control.statistics["problem"]["lp"]
+
+    return {
+        "ground": ground_stats,
+        # Solving always needs a grounded program; report its share only
+        "solve": {"seconds": max(total_stats["seconds"] - ground_stats["seconds"], 0.0),
+                  "peak_kib": total_stats["peak_kib"]},
+        "ground_rules": int(lp["rules"]),
+        "ground_atoms": int(lp["atoms"]),
+        "satisfiable": bool(solve_result.satisfiable)
+    }
+
+
+def benchmark_file(path: str, repeats: int = 5, models: int = 1,
+                   config: Optional[ConverterConfig] = None) -> Dict[str, object]:
+    """Benchmark every phase for one SLEEC file"""
+    entry: Dict[str, object] = {}
+    try:
+        _, entry["parse"] = measure(lambda: SleecParser().parse_file(path), repeats)
+        program, entry["convert"] = measure(lambda: SleecToClingoConverter(config).convert_file(path), repeats)
+    except (OSError, ValueError) as e:
+        entry["error"] = str(e).splitlines()[0]
+        return entry
+
+    entry["output_bytes"] = len(program.encode())
+    if clingo is not None:
+        try:
+            entry.update(ground_and_solve(program, models, repeats))
+        except RuntimeError as e:
+            entry["error"] = f"clingo: {str(e).splitlines()[0]}"
+    return entry
+
+
+def run_suite(paths: List[str], repeats: int = 5, models: int = 1,
+              config: Optional[ConverterConfig] = None) -> Dict[str, object]:
+    """Benchmark every SLEEC file found under paths"""
+    files = {}
+    for source in collect_sources(paths):
+        files[source] = benchmark_file(source, repeats, models, config)
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "clingo": clingo.__version__ if clingo is not None else None,
+            "repeats": repeats,
+            "models": models,
+            "peak_memory": MEMORY_MEASURE
+        },
+        "files": files
+    }
+
+
+def run_scaling(sizes: List[int], repeats: int = 1, seed: int = 0,
+                max_ground_rules: int = 2000) -> List[Dict[str, object]]:
+    """Measure parse, convert and ground time on synthetic documents of growing size"""
+    points = []
+    for size in sizes:
+        content = generate_sleec(WorkloadSpec.scaled(size, seed))
+        point: Dict[str, object] = {"rules": size, "source_bytes": len(content.encode())}
+
+        _, point["parse"] = measure(lambda: SleecParser().parse_sleec_string(content), repeats)
+        program, point["convert"] = measure(lambda: SleecToClingoConverter().convert_sleec_string(content), repeats)
+        point["output_bytes"] = len(program.encode())
+
+        if clingo is not None and size <= max_ground_rules:
+            control, point["ground"] = measure(lambda: ground_program(program), repeats)
+            control.solve()
+            point["ground_rules"] = int(control.statistics["problem"]["lp"]["rules"])
+
+        points.append(point)
+        print(f"{size:>8} rules: parse {point['parse']['seconds']:.3f}s, convert {point['convert']['seconds']:.3f}s"
+              + (f", ground {point['ground']['seconds']:.3f}s" if "ground" in point else ""))
+    return points
+
+
+def plot_scaling(points: List[Dict[str, object]], destination: str) -> bool:
+    """Plot phase time against rule count on log-log axes; False without matplotlib"""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+
+    figure, axes = plt.subplots()
+    for phase in ("parse", "convert", "ground"):
+        measured = [point for point in points if phase in point]
+        if measured:
+            axes.plot([point["rules"] for point in measured],
+                      [point[phase]["seconds"] for point in measured], marker="o", label=phase)
+    axes.set_xscale("log")
+    axes.set_yscale("log")
+    axes.set_xlabel("rules")
+    axes.set_ylabel("seconds")
+    axes.legend()
+    figure.savefig(destination)
+    return True
+
+
+def compare(results: Dict[str, object], baseline: Dict[str, object],
+            threshold: float = 1.25, min_seconds: float = 0.002) -> List[str]:
+    """List regressions of results against a baseline
+
+    A phase regresses when it is slower than threshold times its baseline and
+    the difference exceeds min_seconds (to ignore timer noise). Any growth of
+    the generated or ground program size, and files that stopped converting,
+    are regressions too.
+    """
+    regressions = []
+    baseline_files = baseline.get("files", {})
+
+    for source, entry in results["files"].items():
+        old = baseline_files.get(source)
+        if old is None:
+            continue
+
+        if "error" in entry and "error" not in old:
+            regressions.append(f"{source}: now fails ({entry['error']})")
+            continue
+
+        for phase in PHASES:
+            if phase not in entry or phase not in old:
+                continue
+            new_seconds = entry[phase]["seconds"]
+            old_seconds = old[phase]["seconds"]
+            if new_seconds > old_seconds * threshold and new_seconds - old_seconds > min_seconds:
+                regressions.append(f"{source}: {phase} {old_seconds * 1000:.2f} ms → {new_seconds * 1000:.2f} ms "
+                                   f"({new_seconds / old_seconds:.2f}x)")
+
+        for size in SIZES:
+            if size in entry and size in old and entry[size] > old[size]:
+                regressions.append(f"{source}: {size} {old[size]} → {entry[size]}")
+
+    return regressions
+
+
+def print_table(results: Dict[str, object]) -> None:
+    print(f"{'file':<48} {'parse ms':>9} {'convert ms':>11} {'ground ms':>10} {'solve ms':>9} "
+          f"{'peak KiB':>9} {'out KiB':>8} {'rules':>7}")
+
+    for source, entry in results["files"].items():
+        name = source if len(source) <= 48 else "…" + source[-47:]
+        if "parse" not in entry:
+            print(f"{name:<48} skipped: {entry['error']}")
+            continue
+
+        def ms(phase):
+            return f"{entry[phase]['seconds'] * 1000:.2f}" if phase in entry else "-"
+
+        peak = max(entry[phase]["peak_kib"] for phase in PHASES if phase in entry)
+        print(f"{name:<48} {ms('parse'):>9} {ms('convert'):>11} {ms('ground'):>10} {ms('solve'):>9} "
+              f"{peak:>9.0f} {entry.get('output_bytes', 0) / 1024:>8.1f} {entry.get('ground_rules', '-'):>7}")
+        if "error" in entry:
+            print(f"{'':<48} {entry['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing, conversion, grounding and solving")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_CORPUS,
+                        help="SLEEC files, directories or glob patterns (default: sleec_files)")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per phase, best is kept")
+    parser.add_argument("--models", type=int, default=1, help="models to enumerate when solving")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", nargs="?", const=DEFAULT_BASELINE,
+                        help="compare against this results file (default: "
+                             f"{os.path.relpath(DEFAULT_BASELINE)}) and exit 1 on regressions")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help=f"store the results as the baseline ({os.path.relpath(DEFAULT_BASELINE)})")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown factor that counts as a regression (default: %(default)s)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                        help="ignore slowdowns smaller than this, in milliseconds (default: %(default)s)")
+    parser.add_argument("--scaling", help="comma-separated rule counts of synthetic documents to measure instead")
+    parser.add_argument("--seed", type=int, default=0, help="seed for synthetic documents")
+    parser.add_argument("--max-ground-rules", type=int, default=2000,
+                        help="skip grounding synthetic documents larger than this (default: %(default)s)")
+    parser.add_argument("--plot", help="with --scaling, save a time-vs-size plot here (needs matplotlib)")
+    args = parser.parse_args()
+
+    if clingo is None:
+        print("⚠️  clingo Python module not installed: grounding and solving are skipped")
+
+    if args.scaling:
+        sizes = [int(size) for size in args.scaling.split(",")]
+        results = {"scaling": run_scaling(sizes, args.repeats, args.seed, args.max_ground_rules)}
+        if args.plot:
+            if plot_scaling(results["scaling"], args.plot):
+                print(f"\n📈 Plot written to {args.plot}")
+            else:
+                print("\n⚠️  matplotlib not installed: no plot written")
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+            print(f"\n📄 Results written to {args.output}")
+        return
+
+    if args.baseline and not args.update_baseline and not os.path.exists(args.baseline):
+        print(f"❌ No baseline at {args.baseline}; record one on this machine with --update-baseline first")
+        sys.exit(1)
+
+    results = run_suite(args.paths, args.repeats, args.models)
+    print_table(results)
+
+    for destination in filter(None, [args.output, DEFAULT_BASELINE if args.update_baseline else None]):
+        with open(destination, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results written to {destination}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms / 1000)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression{'s' if len(regressions) != 1 else ''} against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\n✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
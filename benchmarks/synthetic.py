@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Synthetic SLEEC Workloads
+=========================
+
+Generates valid SLEEC documents of any size from a seed, for stress tests and
+scaling benchmarks. The counts of events, measures, constants, rules and of
+rules using unless chains, otherwise clauses and within constraints are all
+configurable, as is the nesting depth of conditions. The same specification
+and seed always produce the same document.
+
+Usage:
+    python benchmarks/synthetic.py <rules> [seed] > workload.sleec
+
+    from benchmarks.synthetic import WorkloadSpec, generate_sleec
+    content = generate_sleec(WorkloadSpec.scaled(10000, seed=7))
+"""
+
+import os
+import random
+import sys
+from dataclasses import dataclass
+from typing import List, TextIO
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from converter.config import ConverterConfig
+
+
+@dataclass
+class WorkloadSpec:
+    """Shape of a synthetic SLEEC document
+
+    Rules with unless chains, otherwise clauses and within constraints are
+    disjoint groups; the remaining rules are plain 'when ... then ...' rules.
+    """
+    events: int = 20
+    boolean_measures: int = 5
+    numeric_measures: int = 3
+    scale_measures: int = 2
+    scale_size: int = 3
+    constants: int = 2
+    rules: int = 50
+    unless_rules: int = 10
+    max_unless_chain: int = 3
+    otherwise_rules: int = 10
+    within_rules: int = 10
+    max_within: int = 3
+    nesting_depth: int = 2
+    seed: int = 0
+
+    @classmethod
+    def scaled(cls, rules: int, seed: int = 0) -> "WorkloadSpec":
+        """Specification whose vocabulary and clause counts grow with the rule count"""
+        return cls(
+            events=max(4, rules // 2),
+            boolean_measures=max(1, rules // 10),
+            numeric_measures=max(1, rules // 20),
+            scale_measures=max(1, rules // 25),
+            constants=max(1, rules // 50),
+            rules=rules,
+            unless_rules=rules // 5,
+            otherwise_rules=rules // 5,
+            within_rules=rules // 5,
+            seed=seed
+        )
+
+    def validate(self) -> None:
+        """Check that the specification describes a valid document"""
+        if self.events < 2:
+            raise ValueError("events must be at least 2")
+        if min(self.boolean_measures, self.numeric_measures, self.scale_measures, self.constants,
+               self.rules, self.unless_rules, self.otherwise_rules, self.within_rules,
+               self.nesting_depth) < 0:
+            raise ValueError("counts must be non-negative")
+        if self.scale_size < 2:
+            raise ValueError("scale_size must be at least 2")
+        if self.max_unless_chain < 1 or self.max_within < 1:
+            raise ValueError("max_unless_chain and max_within must be positive")
+        if self.unless_rules + self.otherwise_rules + self.within_rules > self.rules:
+            raise ValueError("unless_rules + otherwise_rules + within_rules must not exceed rules")
+
+
+class _Generator:
+    """Draws names, conditions and rules from one seeded random stream"""
+
+    def __init__(self, spec: WorkloadSpec, config: ConverterConfig):
+        self.spec = spec
+        self.random = random.Random(spec.seed)
+        self.numeric_min = config.numeric_min
+        self.numeric_max = config.numeric_max
+        self.events = [f"Event{i}" for i in range(spec.events)]
+        self.booleans = [f"flag{i}" for i in range(spec.boolean_measures)]
+        self.numerics = [f"level{i}" for i in range(spec.numeric_measures)]
+        self.scales = [f"mode{i}" for i in range(spec.scale_measures)]
+        self.scale_values = [f"v{j}" for j in range(spec.scale_size)]
+        self.constants = {f"Limit{i}": self.random.randint(self.numeric_min, self.numeric_max)
+                          for i in range(spec.constants)}
+
+    def definitions(self) -> List[str]:
+        lines = [f"event {event}" for event in self.events]
+        lines.extend(f"measure {name}: boolean" for name in self.booleans)
+        lines.extend(f"measure {name}: numeric" for name in self.numerics)
+        lines.extend(f"measure {name}: scale({', '.join(self.scale_values)})" for name in self.scales)
+        lines.extend(f"constant {name} = {value}" for name, value in self.constants.items())
+        return lines
+
+    def rules(self) -> List[str]:
+        spec = self.spec
+        kinds = (["unless"] * spec.unless_rules + ["otherwise"] * spec.otherwise_rules
+                 + ["within"] * spec.within_rules)
+        kinds += ["plain"] * (spec.rules - len(kinds))
+        self.random.shuffle(kinds)
+        return [self.rule(number, kind) for number, kind in enumerate(kinds, 1)]
+
+    def rule(self, number: int, kind: str) -> str:
+        trigger, response = self.random.sample(self.events, 2)
+        condition = trigger
+        if self.spec.nesting_depth > 0 and self.random.random() < 0.7:
+            condition += f" and {self.condition(self.spec.nesting_depth)}"
+        text = f"R{number} when {condition} then {response}"
+
+        if kind == "within":
+            unit = self.random.choice(["seconds", "minutes"])
+            text += f" within {self.random.randint(1, self.spec.max_within)} {unit}"
+        elif kind == "otherwise":
+            text += f" otherwise {self.random.choice(self.events)}"
+        elif kind == "unless":
+            for _ in range(self.random.randint(1, self.spec.max_unless_chain)):
+                text += f"\n        unless {self.condition(self.spec.nesting_depth - 1)}"
+                choice = self.random.random()
+                if choice < 0.6:
+                    text += f" then {self.random.choice(self.events)}"
+                elif choice < 0.8:
+                    text += f" then not {self.random.choice(self.events)}"
+        return text
+
+    def condition(self, depth: int) -> str:
+        """Random condition with at most depth levels of parenthesized nesting"""
+        if depth <= 0 or self.random.random() < 0.4:
+            return self.atom()
+
+        operator = self.random.choice(["and", "or", "not"])
+        if operator == "not":
+            return f"not ({self.condition(depth - 1)})"
+        operands = [self.condition(depth - 1) for _ in range(self.random.randint(2, 3))]
+        return "(" + f" {operator} ".join(operands) + ")"
+
+    def atom(self) -> str:
+        choices = [lambda: self.random.choice(self.events)]
+        if self.booleans:
+            choices.append(lambda: f"{{{self.random.choice(self.booleans)}}}")
+        if self.numerics:
+            choices.append(self.numeric_comparison)
+        if self.scales:
+            choices.append(lambda: f"{{{self.random.choice(self.scales)}}} "
+                                   f"{self.random.choice(['=', '>=', '<'])} {self.random.choice(self.scale_values)}")
+        return self.random.choice(choices)()
+
+    def numeric_comparison(self) -> str:
+        measure = self.random.choice(self.numerics)
+        operator = self.random.choice(["<", "<=", ">", ">=", "="])
+        if self.constants and self.random.random() < 0.3:
+            bound = self.random.choice(list(self.constants))
+        else:
+            bound = self.random.randint(self.numeric_min, self.numeric_max)
+        return f"{{{measure}}} {operator} {bound}"
+
+
+def write_sleec(spec: WorkloadSpec, writer: TextIO, config: ConverterConfig = None) -> None:
+    """Write a synthetic SLEEC document to a file object"""
+    spec.validate()
+    generator = _Generator(spec, config or ConverterConfig.create_default())
+
+    writer.write(f"// Synthetic SLEEC workload: {spec}\n")
+    writer.write("def_start\n")
+    for line in generator.definitions():
+        writer.write(f"    {line}\n")
+    writer.write("def_end\n\nrule_start\n")
+    for rule in generator.rules():
+        writer.write(f"    {rule}\n")
+    writer.write("rule_end\n")
+
+
+def generate_sleec(spec: WorkloadSpec, config: ConverterConfig = None) -> str:
+    """Return a synthetic SLEEC document"""
+    import io
+
+    buffer = io.StringIO()
+    write_sleec(spec, buffer, config)
+    return buffer.getvalue()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(f"Usage: python {sys.argv[0]} <rules> [seed] > workload.sleec", file=sys.stderr)
+        sys.exit(1)
+
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    write_sleec(WorkloadSpec.scaled(int(sys.argv[1]), seed), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
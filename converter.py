@@ -7,52 +7,138 @@ Converts SLEEC files to Clingo format using an antecedent/consequent approach.
 
 Usage:
     python converter.py <input.sleec> [output.lp]
+    python converter.py --batch <file|directory|glob>... [--workers N] [--output-dir DIR]
+    python converter.py --watch <input.sleec>... [--output-dir DIR]
+    python converter.py --conflicts <input.sleec>
+
+    Add --cache-dir DIR to any invocation to reuse unchanged conversions, and
+    --max-time N, --auto-horizon or --time-units to choose the time domain.
 
 Example:
     python converter.py sleec_files/simple_rules/lightswitch.sleec
+    python converter.py --batch sleec_files/ --workers 4
 """
 
+import argparse
 import sys
 import os
+import warnings
 from pathlib import Path
 
-from converter import SleecToClingoConverter, DEFAULT_CONFIG
+from converter import SleecToClingoConverter, ConverterConfig, DEFAULT_CONFIG
+from converter.batch import convert_batch
+from converter.cache import ConversionCache, DEFAULT_MAX_BYTES
+from converter.config import SATISFACTION_ENCODINGS
+from converter.conflicts import ConflictAnalyzer
+from converter.watch import watch_files
 
-def main():
-    if len(sys.argv) < 2:
-        print("❌ Error: Please provide a SLEEC file to convert")
-        print()
-        print("Usage:")
-        print(f"  python {sys.argv[0]} <input.sleec> [output.lp]")
-        print()
-        print("Example:")
-        print(f"  python {sys.argv[0]} sleec_files/simple_rules/lightswitch.sleec")
-        sys.exit(1)
-    
-    input_file = sys.argv[1]
-    
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Convert SLEEC files to Clingo format",
+        usage="%(prog)s <input.sleec> [output.lp]\n"
+              "       %(prog)s --batch <file|directory|glob>... [--workers N] [--output-dir DIR]\n"
+              "       %(prog)s --watch <input.sleec>... [--output-dir DIR]\n"
+              "       %(prog)s --conflicts <input.sleec>"
+    )
+    parser.add_argument("inputs", nargs="*", help="SLEEC file (and optional output file), or batch inputs")
+    parser.add_argument("--batch", action="store_true",
+                        help="convert every file, directory (recursively) and glob pattern given")
+    parser.add_argument("--watch", action="store_true",
+                        help="reconvert the given files whenever they are saved, until interrupted")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                        help="number of worker processes in batch mode (default: CPU count)")
+    parser.add_argument("--conflicts", action="store_true",
+                        help="check every pair of rules for conflicts instead of converting (needs clingo); "
+                             "benchmarks/conflicts.py compares its time with solving one program per pair")
+    parser.add_argument("--output-dir", default=None,
+                        help="write batch and watch outputs here instead of next to each source")
+    parser.add_argument("--cache-dir", default=None,
+                        help="reuse converted programs stored in this directory when neither "
+                             "the source, the configuration nor the converter changed")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="cache size bound in MiB; least recently used entries are evicted (default: %(default)s)")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="print cache hit/miss statistics after converting")
+    parser.add_argument("--max-time", type=int, default=None,
+                        help=f"last time point of the time domain (default: {DEFAULT_CONFIG.max_time})")
+    parser.add_argument("--auto-horizon", action="store_true",
+                        help="derive the time domain from the longest chain of within deadlines")
+    parser.add_argument("--single-step", action="store_true",
+                        help="solve one generic time step when no rule has a within constraint")
+    parser.add_argument("--incremental", action="store_true",
+                        help="emit #program base/step(t)/check(t) parts for multi-shot solving over a growing horizon")
+    parser.add_argument("--time-units", action="store_true",
+                        help="convert within units to seconds and use their greatest common divisor as the time step")
+    parser.add_argument("--numeric-abstraction", action="store_true",
+                        help="give numeric measures one value per range the rules' thresholds distinguish")
+    parser.add_argument("--satisfaction-encoding", choices=SATISFACTION_ENCODINGS, default="expanded",
+                        help="per-rule holds_nv/holds_v logic (expanded) or shared schemas (compact)")
+    parser.add_argument("--inertial", action="append", default=[], metavar="MEASURE[:EVENT,...]",
+                        help="keep a measure's value between time points unless one of the events happens "
+                             "(repeatable; without events the measure is constant)")
+    parser.add_argument("--show", default=None, metavar="PRED/N,...",
+                        help=f"predicates to show (default: {','.join(DEFAULT_CONFIG.show_predicates)})")
+    parser.add_argument("--project", default=None, metavar="SYMBOL,...",
+                        help="events and measures to project answer sets on (run clingo with --project)")
+    parser.add_argument("--external-inputs", action="store_true",
+                        help="declare triggering events and measures as #external atoms for scenario solving")
+    parser.add_argument("--keep-unused", action="store_true",
+                        help="keep events, measures and constants that no rule refers to")
+    return parser
+
+
+def print_usage():
+    print("Usage:")
+    print(f"  python {sys.argv[0]} <input.sleec> [output.lp]")
+    print(f"  python {sys.argv[0]} --batch <file|directory|glob>... [--workers N] [--output-dir DIR]")
+    print(f"  python {sys.argv[0]} --watch <input.sleec>... [--output-dir DIR]")
+    print(f"  python {sys.argv[0]} --conflicts <input.sleec>")
+    print()
+    print("Example:")
+    print(f"  python {sys.argv[0]} sleec_files/simple_rules/lightswitch.sleec")
+
+
+def split_list(value):
+    """Split a comma-separated option value, or return None if it was not given"""
+    return [item.strip() for item in value.split(",") if item.strip()] if value is not None else None
+
+
+def parse_inertial_measures(specs):
+    """Turn --inertial MEASURE[:EVENT,...] options into ConverterConfig.inertial_measures"""
+    inertial_measures = {}
+    for spec in specs:
+        measure, _, events = spec.partition(":")
+        inertial_measures[measure.strip()] = [event.strip() for event in events.split(",") if event.strip()]
+    return inertial_measures
+
+
+def convert_single(input_file, output_file=None, cache=None, config=None):
     # Generate output filename if not provided
-    if len(sys.argv) >= 3:
-        output_file = sys.argv[2]
-    else:
+    if output_file is None:
         # Replace .sleec with _converted.lp
         input_path = Path(input_file)
         output_file = str(input_path.with_name(input_path.stem + '_converted.lp'))
-    
+
     try:
         # Convert the file
-        converter = SleecToClingoConverter()
-        clingo_code = converter.convert_file(input_file)
-        
-        # Write output
+        if cache is not None:
+            chunks = iter([cache.convert_file(input_file, config)])
+        else:
+            converter = SleecToClingoConverter(config)
+            chunks = converter.iter_convert_file(input_file)
+
+        # Parse and validate before creating the output file, then stream the rest
+        first_chunk = next(chunks)
         with open(output_file, 'w') as f:
-            f.write(clingo_code)
-        
+            f.write(first_chunk)
+            f.writelines(chunks)
+
         print(f"✅ Successfully converted: {input_file} → {output_file}")
         print()
         print("To run the generated file:")
-        print(f"  clingo {output_file} {DEFAULT_CONFIG.clingo_suggestion} or however many models you want")
-        
+        print(f"  clingo {output_file} {(config or DEFAULT_CONFIG).clingo_suggestion} or however many models you want")
+
     except FileNotFoundError:
         print(f"❌ Error: Input file '{input_file}' not found")
         sys.exit(1)
@@ -64,5 +150,127 @@ def main():
         print(f"❌ Unexpected error: {e}")
         sys.exit(1)
 
+
+def run_batch(patterns, workers=None, output_dir=None, cache=None, config=None):
+    report = convert_batch(patterns, workers=workers, output_dir=output_dir, config=config, cache=cache)
+
+    if not report.results:
+        print("❌ Error: No SLEEC files matched the given inputs")
+        sys.exit(1)
+
+    for result in report.results:
+        if result.ok:
+            timing = "cached" if result.cached else f"{result.seconds:.3f}s"
+            print(f"✅ {result.source} → {result.output} ({timing})")
+        else:
+            print(f"❌ {result.source}:")
+            print(f"   {result.error}".replace("\n", "\n   "))
+
+    converted = len(report.results) - len(report.failures)
+    print()
+    print(f"Converted {converted}/{len(report.results)} files in {report.wall_time:.2f}s "
+          f"({report.workers} worker{'s' if report.workers != 1 else ''})")
+
+    if report.failures:
+        sys.exit(1)
+
+
+def run_watch(inputs, output_dir=None, config=None):
+    print(f"👀 Watching {len(inputs)} file{'s' if len(inputs) != 1 else ''} (Ctrl+C to stop)")
+    try:
+        watch_files(inputs, output_dir, config)
+    except KeyboardInterrupt:
+        print()
+        print("Stopped watching")
+
+
+def run_conflicts(input_file, config=None):
+    try:
+        report = ConflictAnalyzer.from_file(input_file, config).analyse()
+    except FileNotFoundError:
+        print(f"❌ Error: Input file '{input_file}' not found")
+        sys.exit(1)
+    except (ValueError, RuntimeError) as e:
+        print("❌ Conflict analysis failed:")
+        print(str(e))
+        sys.exit(1)
+
+    print(report.format())
+    if report.conflicts or report.unsatisfiable:
+        sys.exit(1)
+
+
+def print_cache_stats(cache):
+    if cache is not None:
+        print()
+        print(cache.report())
+
+
+def format_warning(message, category, filename, lineno, line=None):
+    return f"⚠️  {message}\n"
+
+
+def main():
+    args = build_arg_parser().parse_args()
+    warnings.formatwarning = format_warning
+
+    if not args.inputs:
+        print("❌ Error: Please provide a SLEEC file to convert")
+        print()
+        print_usage()
+        sys.exit(1)
+
+    if args.workers is not None and args.workers < 1:
+        print("❌ Error: --workers must be at least 1")
+        sys.exit(1)
+
+    if args.cache_size < 1:
+        print("❌ Error: --cache-size must be at least 1")
+        sys.exit(1)
+
+    config = ConverterConfig(auto_horizon=args.auto_horizon, single_step=args.single_step, time_units=args.time_units,
+                             incremental=args.incremental,
+                             numeric_abstraction=args.numeric_abstraction,
+                             keep_unused_definitions=args.keep_unused,
+                             external_inputs=args.external_inputs,
+                             satisfaction_encoding=args.satisfaction_encoding,
+                             inertial_measures=parse_inertial_measures(args.inertial),
+                             show_predicates=split_list(args.show),
+                             project_symbols=split_list(args.project))
+    if args.max_time is not None:
+        config.max_time = args.max_time
+    try:
+        config.validate()
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    cache = ConversionCache(args.cache_dir, args.cache_size * 1024 * 1024) if args.cache_dir else None
+
+    if args.batch and args.watch:
+        print("❌ Error: --batch and --watch cannot be combined")
+        sys.exit(1)
+
+    try:
+        if args.conflicts:
+            if len(args.inputs) != 1:
+                print("❌ Error: --conflicts takes exactly one SLEEC file")
+                sys.exit(1)
+            run_conflicts(args.inputs[0], config)
+        elif args.watch:
+            run_watch(args.inputs, args.output_dir, config)
+        elif args.batch:
+            run_batch(args.inputs, args.workers, args.output_dir, cache, config)
+        elif len(args.inputs) > 2:
+            print("❌ Error: Too many arguments (use --batch to convert several files)")
+            print()
+            print_usage()
+            sys.exit(1)
+        else:
+            convert_single(*args.inputs, cache=cache, config=config)
+    finally:
+        if args.cache_stats:
+            print_cache_stats(cache)
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
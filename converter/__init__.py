@@ -6,18 +6,36 @@ This package contains SLEEC to Clingo converters and shared parsing utilities.
 
 Available converters:
 - SleecToClingoConverter: SLEEC to Clingo converter (antecedent/consequent structure)
+- SleecSolver: Solves the generated programs in-process with the clingo Python API
+- StatementCache: Parsed clingo.ast statements of generated program chunks
+- ScenarioEngine: Grounds a rule set once and answers scenarios under assumptions
+- IncrementalSolver: Grows the time horizon one step at a time with multi-shot solving
+- ConflictAnalyzer: Grounds a rule set once and checks rule pairs for conflicts
 
 Shared utilities:
 - SleecParser: Shared SLEEC parsing functionality
+- SleecLexer: Single-pass tokenizer used by the parser
+- ConditionParser: Builds condition expression trees
 - Data classes: Event, Measure, Constant, Rule, MeasureType
 """
 
+from .lexer import SleecLexer, Token, TokenType
+from .conditions import ConditionParser
 from .parser import SleecParser, MeasureType, Measure, Event, Constant, Rule, UnlessClause
 from .sleec_converter import SleecToClingoConverter
 from .config import ConverterConfig, DEFAULT_CONFIG
+from .program_ast import StatementCache
+from .solver import SleecSolver, SolveResult
+from .scenarios import Scenario, ScenarioEngine, ScenarioResult
+from .multishot import HorizonResult, IncrementalSolver
+from .conflicts import Conflict, ConflictAnalyzer, ConflictReport
 
 __all__ = [
     'SleecParser',
+    'SleecLexer',
+    'Token',
+    'TokenType',
+    'ConditionParser',
     'MeasureType', 
     'Measure',
     'Event', 
@@ -26,5 +44,16 @@ __all__ = [
     'UnlessClause',
     'SleecToClingoConverter',
     'ConverterConfig',
-    'DEFAULT_CONFIG'
+    'DEFAULT_CONFIG',
+    'SleecSolver',
+    'SolveResult',
+    'StatementCache',
+    'Scenario',
+    'ScenarioEngine',
+    'ScenarioResult',
+    'HorizonResult',
+    'IncrementalSolver',
+    'Conflict',
+    'ConflictAnalyzer',
+    'ConflictReport'
 ] 
\ No newline at end of file
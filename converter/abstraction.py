@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+SLEEC Numeric Value Abstraction
+===============================
+
+Rules usually compare a numeric measure against one or two thresholds, yet
+every value of the numeric range is a separate choice at every time point.
+This module splits each measure's range into the classes of values that every
+comparison in the rules treats alike. One representative per class (its
+lowest value) is enough to decide every rule, and the class bounds map an
+answer set back to the concrete values it stands for.
+
+Classes:
+    ValueClass: Interval of values that no rule can tell apart
+
+Functions:
+    numeric_value_classes: Value classes of every numeric measure that can be abstracted
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from converter.analysis import SymbolIndex
+from converter.conditions import Comparison, ConstantRef, MeasureRef, Value, walk
+from converter.parser import MeasureType, Rule
+
+
+_OPERATORS = {"==": "=", "<>": "!="}
+_FLIPPED = {"<": ">", ">": "<", "<=": ">=", ">=": "<="}
+
+_CUTS = {"<": (0,), ">=": (0,), ">": (1,), "<=": (1,), "=": (0, 1), "!=": (0, 1)}
+"""Where V <op> c can change its truth value: between c-1 and c (offset 0)
+and/or between c and c+1 (offset 1)"""
+
+
+@dataclass(frozen=True)
+class ValueClass:
+    """Interval low..high of values that no rule can tell apart"""
+    representative: int
+    low: int
+    high: int
+
+
+def numeric_value_classes(rules: List[Rule], index: SymbolIndex,
+                          numeric_min: int, numeric_max: int) -> Dict[str, List[ValueClass]]:
+    """Split the range of each numeric measure at the thresholds rules compare it with
+
+    Measures compared with other measures, or with values that are not
+    numbers or numeric constants, keep their full range and are left out.
+    """
+    cuts: Dict[str, Set[int]] = {name: set() for name, measure in index.measures.items()
+                                 if measure.type is MeasureType.NUMERIC}
+    concrete: Set[str] = set()
+
+    for rule in rules:
+        conditions = [index.condition_of(rule)]
+        conditions.extend(index.condition_of(clause) for clause in rule.unless_clauses or ())
+        for node in (node for condition in conditions for node in walk(condition)):
+            if not isinstance(node, Comparison):
+                continue
+            measures = [operand.name.lower() for operand in (node.left, node.right) if isinstance(operand, MeasureRef)]
+            if len(measures) != 1:
+                concrete.update(measures)
+                continue
+            operator = _OPERATORS.get(node.operator, node.operator)
+            if isinstance(node.left, MeasureRef):
+                other = node.right
+            else:
+                other, operator = node.left, _FLIPPED.get(operator, operator)
+            value = _numeric_value(other, index)
+            if value is None or operator not in _CUTS:
+                concrete.add(measures[0])
+            elif measures[0] in cuts:
+                cuts[measures[0]].update(value + offset for offset in _CUTS[operator])
+
+    return {name: _split(starts, numeric_min, numeric_max)
+            for name, starts in cuts.items() if name not in concrete}
+
+
+def _numeric_value(operand, index: SymbolIndex) -> Optional[int]:
+    """Return the integer a comparison operand stands for, if any"""
+    if isinstance(operand, ConstantRef):
+        constant = index.constants.get(operand.name.lower())
+        text = constant.value if constant else operand.name
+    elif isinstance(operand, Value):
+        text = operand.text
+    else:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def _split(cuts: Set[int], numeric_min: int, numeric_max: int) -> List[ValueClass]:
+    """Split numeric_min..numeric_max into classes starting at each cut"""
+    starts = {numeric_min} | {cut for cut in cuts if numeric_min < cut <= numeric_max}
+    bounds = sorted(starts) + [numeric_max + 1]
+    return [ValueClass(low, low, high - 1) for low, high in zip(bounds, bounds[1:])]
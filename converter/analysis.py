@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+SLEEC Symbol Analysis
+=====================
+
+This module builds the lookup structures the code generators need, once per
+conversion, instead of rescanning every rule and event each time a generator
+asks a question about the rule set.
+
+Classes:
+    SymbolIndex: Indexed view of the events, measures, constants and rules
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Tuple
+
+from converter.parser import Event, Measure, MeasureType, Constant, Rule
+from converter.conditions import Condition, ConditionParser, EventRef, MeasureRef, walk
+
+
+@dataclass
+class SymbolIndex:
+    """Per-conversion index of symbols and how the rules use them
+
+    All event, measure and constant keys are lower case. Ordered collections
+    follow first appearance in the rule set so generated output is stable.
+    """
+
+    events: Dict[str, Event] = field(default_factory=dict)
+    measures: Dict[str, Measure] = field(default_factory=dict)
+    constants: Dict[str, Constant] = field(default_factory=dict)
+
+    within_events: Dict[str, str] = field(default_factory=dict)
+    """Events produced under a within constraint, mapped to that constraint"""
+
+    action_events_with_within: List[Tuple[str, str]] = field(default_factory=list)
+    action_events_without_within: List[str] = field(default_factory=list)
+    action_events: List[str] = field(default_factory=list)
+    triggering_events: List[str] = field(default_factory=list)
+
+    rule_events: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    """Rule id -> events referenced by its condition and unless conditions"""
+
+    rule_measures: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    """Rule id -> measures referenced by its condition and unless conditions"""
+
+    condition_parser: ConditionParser = field(default_factory=ConditionParser)
+
+    @classmethod
+    def build(cls, events: List[Event], measures: List[Measure],
+              constants: List[Constant], rules: List[Rule]) -> "SymbolIndex":
+        """Build the index in one pass over the definitions and rules
+
+        Rules whose condition has not been parsed yet (e.g. built by hand)
+        get their condition_expr filled in.
+        """
+        index = cls(
+            events={event.name.lower(): event for event in events},
+            measures={measure.name.lower(): measure for measure in measures},
+            constants={constant.name.lower(): constant for constant in constants},
+            condition_parser=ConditionParser((event.name for event in events),
+                                             (constant.name for constant in constants))
+        )
+
+        condition_events: Dict[str, None] = {}
+        action_events: Dict[str, None] = {}
+        without_within: Dict[str, None] = {}
+
+        for rule in rules:
+            condition = index.condition_of(rule)
+            for node in walk(condition):
+                if isinstance(node, EventRef):
+                    condition_events[node.name.lower()] = None
+
+            # Primary action with possible within constraint
+            if rule.action and rule.within_constraint:
+                index.within_events[rule.action.lower()] = rule.within_constraint
+            if rule.action and not rule.action.strip().startswith("not "):
+                action_events[rule.action.lower()] = None
+                if rule.within_constraint:
+                    index.action_events_with_within.append((rule.action.lower(), rule.within_constraint))
+                else:
+                    without_within[rule.action.lower()] = None
+
+            # Otherwise and unless actions (no within constraints)
+            extra_actions = [rule.otherwise_action]
+            extra_actions.extend(clause.action for clause in rule.unless_clauses or [])
+            for action in extra_actions:
+                if action and not action.strip().startswith("not "):
+                    action_events[action.lower()] = None
+                    without_within[action.lower()] = None
+
+            conditions = [condition]
+            conditions.extend(index.condition_of(clause) for clause in rule.unless_clauses or [])
+            referenced = [node for expression in conditions for node in walk(expression)]
+            # Rules sharing a duplicate id share one entry
+            index.rule_events[rule.id] = index.rule_events.get(rule.id, frozenset()) | frozenset(
+                node.name.lower() for node in referenced if isinstance(node, EventRef))
+            index.rule_measures[rule.id] = index.rule_measures.get(rule.id, frozenset()) | frozenset(
+                node.name.lower() for node in referenced if isinstance(node, MeasureRef))
+
+        index.action_events = list(action_events)
+        index.action_events_without_within = list(without_within)
+        # Triggering events are those in conditions but not in actions
+        index.triggering_events = [event for event in condition_events if event not in action_events]
+        return index
+
+    def condition_of(self, item) -> Condition:
+        """Return the parsed condition of a rule or unless clause, parsing it if needed"""
+        if item.condition_expr is None:
+            item.condition_expr = self.condition_parser.parse_string(item.condition)
+        return item.condition_expr
+
+    def scale_values(self, measure_name: str) -> List[str]:
+        """Return the ordered values of a scale measure (empty for other types)"""
+        measure = self.measures.get(measure_name)
+        if measure is None or measure.type != MeasureType.SCALE or not measure.scale_values:
+            return []
+        return [value.lower() for value in measure.scale_values]
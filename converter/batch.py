@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+SLEEC Batch Conversion
+======================
+
+This module converts many SLEEC files in one process tree instead of paying
+interpreter startup and package import once per file. Inputs may be files,
+directories (searched recursively for .sleec files) or glob patterns, and
+files are converted concurrently on a process pool.
+
+Usage:
+    report = convert_batch(["sleec_files/", "tests/test_cases/*.sleec"], workers=4)
+    print(f"{len(report.failures)} failures in {report.wall_time:.2f}s")
+
+Classes:
+    BatchResult: Outcome of converting a single file
+    BatchReport: Outcome of a whole batch
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from converter.cache import ConversionCache
+from converter.config import ConverterConfig
+from converter.sleec_converter import SleecToClingoConverter
+
+
+@dataclass
+class BatchResult:
+    """Outcome of converting a single file"""
+    source: str
+    output: Optional[str]
+    error: Optional[str] = None
+    seconds: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    """Outcome of a batch conversion, results in input order"""
+    results: List[BatchResult] = field(default_factory=list)
+    wall_time: float = 0.0
+    workers: int = 1
+
+    @property
+    def failures(self) -> List[BatchResult]:
+        return [result for result in self.results if not result.ok]
+
+
+def collect_sources(patterns: Iterable[str]) -> List[str]:
+    """Expand files, directories and glob patterns into a list of SLEEC files
+
+    Paths that match nothing are kept so that they are reported as failures
+    instead of being dropped silently. Duplicates are removed, order is kept.
+    """
+    sources = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(str(path) for path in Path(pattern).rglob("*.sleec"))
+        elif glob.has_magic(pattern):
+            matches = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+        else:
+            matches = [pattern]
+        for match in matches:
+            sources.setdefault(os.path.normpath(match), None)
+    return list(sources)
+
+
+def output_path(source: str, output_dir: Optional[str] = None, base_dir: Optional[str] = None) -> str:
+    """Return where the converted program for source is written
+
+    Without an output directory the program is written next to the source as
+    <stem>_converted.lp, like single-file mode. With one, the layout below
+    base_dir is mirrored so equally named files do not collide.
+    """
+    source_path = Path(source)
+    name = source_path.stem + "_converted.lp"
+    if output_dir is None:
+        return str(source_path.with_name(name))
+
+    relative_dir = Path(os.path.relpath(source_path.parent, base_dir)) if base_dir else Path()
+    if relative_dir.parts and relative_dir.parts[0] == os.pardir:
+        relative_dir = Path()
+    return str(Path(output_dir) / relative_dir / name)
+
+
+def convert_one(job: Tuple[str, str, Optional[ConverterConfig], Optional[ConversionCache]]) -> BatchResult:
+    """Convert one file and write its output; never raises"""
+    source, output, config, cache = job
+    start = time.perf_counter()
+    cached = False
+
+    try:
+        if cache is not None:
+            hits = cache.stats.hits
+            chunks = iter([cache.convert_file(source, config)])
+            cached = cache.stats.hits > hits
+        else:
+            chunks = SleecToClingoConverter(config).iter_convert_file(source)
+        # Parse and validate before creating the output file
+        first_chunk = next(chunks)
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "w") as f:
+            f.write(first_chunk)
+            f.writelines(chunks)
+    except FileNotFoundError:
+        error = f"Input file '{source}' not found"
+    except ValueError as e:
+        error = str(e)
+    except Exception as e:
+        error = f"Unexpected error: {e}"
+    else:
+        error = None
+
+    return BatchResult(source, None if error else output, error, time.perf_counter() - start, cached)
+
+
+def convert_batch(patterns: Iterable[str], workers: Optional[int] = None,
+                  output_dir: Optional[str] = None,
+                  config: Optional[ConverterConfig] = None,
+                  cache: Optional[ConversionCache] = None) -> BatchReport:
+    """Convert every SLEEC file matched by patterns, concurrently
+
+    Args:
+        patterns: Files, directories or glob patterns
+        workers: Number of worker processes (default: CPU count). With one
+            worker, files are converted in the calling process.
+        output_dir: Directory for the converted programs (default: next to each source)
+        config: Converter configuration used for every file
+        cache: Optional conversion cache shared by all workers
+
+    Returns:
+        BatchReport with one result per file, in input order
+    """
+    start = time.perf_counter()
+    sources = collect_sources(patterns)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(sources) or 1))
+
+    base_dir = os.path.commonpath([os.path.abspath(os.path.dirname(source)) for source in sources]) if sources else None
+    jobs = [(source, output_path(source, output_dir, base_dir), config, cache) for source in sources]
+
+    if workers == 1:
+        results = [convert_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            results = list(executor.map(convert_one, jobs, chunksize=chunksize))
+
+        # Workers count hits on their own copies of the cache
+        if cache is not None:
+            hits = sum(result.cached for result in results)
+            cache.stats.hits += hits
+            cache.stats.misses += len(results) - hits
+
+    return BatchReport(results, time.perf_counter() - start, workers)
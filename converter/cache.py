@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+SLEEC Conversion Cache
+======================
+
+This module provides an opt-in, content-addressed on-disk cache for converted
+Clingo programs. Entries are keyed by a hash of the normalized SLEEC source,
+the converter configuration and the converter's own source code, so a hit is
+served without parsing and any change to one of the three is a miss.
+
+Usage:
+    cache = ConversionCache(".sleec_cache", max_bytes=64 * 1024 * 1024)
+    clingo_code = cache.convert_file("example.sleec")
+    print(cache.report())
+
+Classes:
+    CacheStats: Hit/miss/eviction counters and current cache size
+    ConversionCache: Size-bounded LRU cache of generated programs
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from converter.config import ConverterConfig
+from converter.sleec_converter import SleecToClingoConverter
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache instance plus the current on-disk size"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+@lru_cache(maxsize=None)
+def converter_fingerprint() -> str:
+    """Hash of the converter package sources, so any code change invalidates entries"""
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).resolve().parent
+    for path in sorted(package_dir.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def normalize_source(content: str) -> str:
+    """Normalize line endings and trailing whitespace, which never affect the output"""
+    lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+class ConversionCache:
+    """Content-addressed cache of converted programs with LRU eviction
+
+    Entries are plain .lp files; recency is tracked through their modification
+    time, so the cache can be shared by concurrent processes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def key(self, content: str, config: Optional[ConverterConfig] = None) -> str:
+        """Return the cache key for a source under a configuration"""
+        config = config or ConverterConfig.create_default()
+        digest = hashlib.sha256()
+        digest.update(converter_fingerprint().encode())
+        digest.update(json.dumps(asdict(config), sort_keys=True).encode())
+        digest.update(normalize_source(content).encode())
+        return digest.hexdigest()
+
+    def convert_file(self, filename: str, config: Optional[ConverterConfig] = None) -> str:
+        """Convert a SLEEC file, serving the program from the cache when possible"""
+        with open(filename, 'r') as f:
+            content = f.read()
+        return self.convert_sleec_string(content, config)
+
+    def convert_sleec_string(self, content: str, config: Optional[ConverterConfig] = None) -> str:
+        """Convert SLEEC content, serving the program from the cache when possible"""
+        key = self.key(content, config)
+        program = self.get(key)
+        if program is None:
+            program = SleecToClingoConverter(config).convert_sleec_string(content)
+            self.put(key, program)
+        return program
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached program for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            program = path.read_text()
+            os.utime(path)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return program
+
+    def put(self, key: str, program: str) -> None:
+        """Store a program and evict least recently used entries over the size bound"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write atomically so concurrent readers never see a partial entry
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            f.write(program)
+        os.replace(temp_name, path)
+        self.stats.stores += 1
+
+        self._evict(keep=path)
+
+    def clear(self) -> None:
+        """Remove every cache entry"""
+        for path, _, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+    def report(self) -> str:
+        """Summarize hits, misses and size of the cache"""
+        entries = self._entries()
+        self.stats.entries = len(entries)
+        self.stats.size_bytes = sum(size for _, size, _ in entries)
+        lookups = self.stats.hits + self.stats.misses
+        hit_rate = f"{100 * self.stats.hits / lookups:.0f}%" if lookups else "n/a"
+        return (f"Cache {self.directory}: {self.stats.hits} hits, {self.stats.misses} misses "
+                f"(hit rate {hit_rate}), {self.stats.evictions} evictions, "
+                f"{self.stats.entries} entries, {self.stats.size_bytes / 1024:.1f} KiB "
+                f"of {self.max_bytes / 1024:.0f} KiB")
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.lp"
+
+    def _entries(self) -> List[Tuple[Path, int, float]]:
+        """List entries as (path, size, last use), least recently used first"""
+        entries = []
+        for path in self.directory.glob("*/*.lp"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry[2])
+        return entries
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used entries until the cache fits, sparing keep"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
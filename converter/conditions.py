@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+SLEEC Condition Expressions
+===========================
+
+Immutable expression trees for rule and unless conditions. Conditions are
+parsed once (normally by SleecParser) and every code generator works from the
+tree instead of rewriting the condition text.
+
+Classes:
+    EventRef, MeasureRef, NameRef: Boolean leaf nodes
+    ConstantRef, Value: Comparison operands
+    Comparison, And, Or, Not: Composite nodes
+    ConditionParser: Builds expression trees from condition tokens
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from converter.lexer import SleecLexer, Token, TokenType
+
+
+@dataclass(frozen=True)
+class EventRef:
+    """Occurrence of a declared event"""
+    name: str
+
+
+@dataclass(frozen=True)
+class MeasureRef:
+    """Measure reference written as {name}"""
+    name: str
+
+
+@dataclass(frozen=True)
+class NameRef:
+    """Bare identifier that is not a declared event, emitted as a plain atom"""
+    name: str
+
+
+@dataclass(frozen=True)
+class ConstantRef:
+    """Declared constant used as a comparison operand"""
+    name: str
+
+
+@dataclass(frozen=True)
+class Value:
+    """Literal comparison operand: a number or a symbolic (scale) value"""
+    text: str
+
+
+@dataclass(frozen=True)
+class Comparison:
+    left: "Operand"
+    operator: str
+    right: "Operand"
+
+
+@dataclass(frozen=True)
+class And:
+    operands: Tuple["Condition", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    operands: Tuple["Condition", ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: "Condition"
+
+
+Operand = Union[MeasureRef, ConstantRef, Value]
+Condition = Union[EventRef, MeasureRef, NameRef, Comparison, And, Or, Not]
+
+
+def walk(condition: Condition) -> Iterator[Union[Condition, Operand]]:
+    """Yield every node of a condition tree in depth-first order"""
+    stack = [condition]
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, (And, Or)):
+            stack.extend(reversed(node.operands))
+        elif isinstance(node, Not):
+            stack.append(node.operand)
+        elif isinstance(node, Comparison):
+            stack.extend((node.right, node.left))
+
+
+class ConditionParser:
+    """Recursive-descent parser for SLEEC conditions
+
+    Grammar (keywords are case-insensitive):
+        or_expr  := and_expr ('or' and_expr)*
+        and_expr := unary ('and' unary)*
+        unary    := 'not' unary | '(' or_expr ')' | operand [<op> operand]
+        operand  := '{' <measure> '}' | <name> | <number>
+    """
+
+    def __init__(self, event_names: Iterable[str] = (), constant_names: Iterable[str] = ()):
+        self.event_names = {name.lower() for name in event_names}
+        self.constant_names = {name.lower() for name in constant_names}
+        self.lexer = SleecLexer()
+        self._tokens: List[Token] = []
+        self._index = 0
+
+    def parse_string(self, condition: str) -> Condition:
+        """Parse a condition given as text"""
+        tokens = [t for t in self.lexer.tokenize(condition) if t.type is not TokenType.NEWLINE]
+        return self.parse(tokens)
+
+    def parse(self, tokens: List[Token]) -> Condition:
+        """Parse a condition from its tokens"""
+        if not tokens:
+            raise ValueError("❌ Syntax Error: Empty condition")
+
+        self._tokens = tokens
+        self._index = 0
+        expression = self._parse_or()
+
+        if self._index < len(tokens):
+            raise self._syntax_error(tokens[self._index], f"Unexpected '{tokens[self._index].value}' in condition")
+        return expression
+
+    def _peek(self) -> Optional[Token]:
+        return self._tokens[self._index] if self._index < len(self._tokens) else None
+
+    def _advance(self) -> Token:
+        token = self._peek()
+        if token is None:
+            raise self._syntax_error(self._tokens[-1], "Condition ends unexpectedly")
+        self._index += 1
+        return token
+
+    def _at_keyword(self, keyword: str) -> bool:
+        token = self._peek()
+        return token is not None and token.type is TokenType.WORD and token.value.lower() == keyword
+
+    def _expect(self, token_type: TokenType, description: str) -> Token:
+        token = self._advance()
+        if token.type is not token_type:
+            raise self._syntax_error(token, f"Expected {description} but found '{token.value}'")
+        return token
+
+    def _parse_or(self) -> Condition:
+        operands = [self._parse_and()]
+        while self._at_keyword("or"):
+            self._advance()
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def _parse_and(self) -> Condition:
+        operands = [self._parse_unary()]
+        while self._at_keyword("and"):
+            self._advance()
+            operands.append(self._parse_unary())
+
+        if len(operands) == 1:
+            return operands[0]
+
+        # Flatten nested conjunctions so emitters see one flat list
+        flat = []
+        for operand in operands:
+            flat.extend(operand.operands if isinstance(operand, And) else (operand,))
+        return And(tuple(flat))
+
+    def _parse_unary(self) -> Condition:
+        if self._at_keyword("not"):
+            self._advance()
+            operand = self._parse_unary()
+            # Double negation is equivalent to the operand inside a rule body
+            return operand.operand if isinstance(operand, Not) else Not(operand)
+
+        token = self._peek()
+        if token is not None and token.type is TokenType.LPAREN:
+            self._advance()
+            expression = self._parse_or()
+            self._expect(TokenType.RPAREN, "')'")
+            return expression
+
+        start = self._index
+        left = self._parse_operand()
+        operator = self._peek()
+        if operator is not None and operator.type is TokenType.OPERATOR:
+            self._advance()
+            return Comparison(left, operator.value, self._parse_operand())
+
+        # A lone operand must be a boolean reference
+        if isinstance(left, MeasureRef):
+            return left
+        name_token = self._tokens[start]
+        if name_token.type is not TokenType.WORD:
+            raise self._syntax_error(name_token, f"'{name_token.value}' is not a boolean condition")
+        if name_token.value.lower() in self.event_names:
+            return EventRef(name_token.value)
+        return NameRef(name_token.value)
+
+    def _parse_operand(self) -> Operand:
+        token = self._advance()
+
+        if token.type is TokenType.LBRACE:
+            name = self._expect(TokenType.WORD, "a measure name")
+            self._expect(TokenType.RBRACE, "'}'")
+            return MeasureRef(name.value)
+
+        if token.type is TokenType.NUMBER:
+            return Value(token.value)
+
+        if token.type is TokenType.WORD and token.value.lower() not in ("and", "or", "not"):
+            if token.value.lower() in self.constant_names:
+                return ConstantRef(token.value)
+            return Value(token.value)
+
+        raise self._syntax_error(token, f"Unexpected '{token.value}' in condition")
+
+    def _syntax_error(self, token: Token, message: str) -> ValueError:
+        return ValueError(f"❌ Syntax Error at line {token.line}, column {token.column}: {message}")
@@ -8,7 +8,13 @@ centralizing all configuration values in one place for better maintainability.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+WITHIN_ENCODINGS = ("pairwise", "window")
+"""Supported encodings of choice rules for actions with within constraints"""
+
+SATISFACTION_ENCODINGS = ("expanded", "compact")
+"""Supported encodings of the rule satisfaction logic"""
 
 
 @dataclass
@@ -19,11 +25,49 @@ class ConverterConfig:
     max_time: int = 10
     """Maximum time value for the time domain (generates time(0..max_time))"""
     
+    auto_horizon: bool = False
+    """Derive the time domain from the rules instead of max_time: the smallest
+    horizon in which every chain of triggers and within deadlines fits"""
+    
+    time_units: bool = False
+    """Read within units (seconds, minutes, hours, ...) and make one time step
+    the greatest common divisor of all deadlines; otherwise a deadline is its
+    number of time steps, whatever its unit"""
+    
+    single_step: bool = False
+    """Solve a single generic time step, time(0..0), when no rule has a within
+    constraint: every time point then has the same independent answer sets,
+    which converter.locality.expand_to_horizon assembles over any horizon.
+    This applies to the whole program only; if any rule has a within
+    constraint, the time-local parts are named in a warning but still
+    converted over the full horizon"""
+    
+    incremental: bool = False
+    """Emit #program base/step(t)/check(t) parts for multi-shot solving instead
+    of a fixed time(0..max_time) domain, so the horizon can grow one step at a
+    time (see converter.multishot)"""
+    
     # Numeric measure configuration  
     numeric_min: int = 0
     numeric_max: int = 10
     """Range for numeric measures (generates V = numeric_min..numeric_max)"""
     
+    numeric_abstraction: bool = False
+    """Instantiate numeric measures with one representative value per class
+    of values that the rules' comparisons cannot tell apart; value_class/4
+    facts map each representative back to its interval"""
+    
+    inertial_measures: Optional[Dict[str, List[str]]] = None
+    """Measures that keep their value from one time point to the next, mapped
+    to the events that may change them. A measure is chosen freely at time 0
+    and whenever one of its change events happens; an empty list keeps it
+    constant over the whole horizon. Other measures change freely."""
+    
+    external_inputs: bool = False
+    """Declare triggering events and non-inertial measures as #external atoms
+    instead of choices, so a ScenarioEngine can ground the program once and
+    fix them per scenario; externals left unassigned stay free choices"""
+    
     # Clingo execution configuration
     default_models: int = 3
     """Default number of models to suggest when running clingo"""
@@ -42,16 +86,49 @@ class ConverterConfig:
     
     # Output formatting configuration
     show_predicates: Optional[List[str]] = None
-    """List of predicates to show in clingo output"""
+    """List of predicates to show in clingo output (holds_at/2 is only shown
+    when the SLEEC file declares measures)"""
+    
+    project_symbols: Optional[List[str]] = None
+    """Events and measures whose behaviour tells answer sets apart. #project
+    directives restrict projected enumeration (clingo --project) to their
+    atoms, so answer sets that differ only in other symbols count once."""
     
     # Template configuration
     section_separator: str = "\n\n"
     """Separator between generated code sections"""
     
+    # Encoding configuration
+    within_encoding: str = "pairwise"
+    """Choice rules for actions with within constraints: "pairwise" binds both
+    time points over the whole time domain (O(max_time^2) ground instances),
+    "window" enumerates only the k+1 end points after each start time
+    (O(max_time * k)). Both have the same answer sets."""
+    
+    within_deadline_predicates: bool = False
+    """Route references to events produced with within constraints through
+    per-event occurred_at/2 and satisfied_by_deadline/2 predicates, so rules
+    that share such an event do not each join over its request and
+    completion times. Answer sets are unchanged."""
+    
+    satisfaction_encoding: str = "expanded"
+    """Rule satisfaction logic: "expanded" writes holds_nv/holds_v rules for
+    every rule id, "compact" writes two constraints over exp/1 that forbid
+    antecedent/consequent disagreement directly and derives no holds atoms.
+    Both have the same answer sets over the shown predicates."""
+    
+    keep_unused_definitions: bool = False
+    """Keep events, measures and constants that no rule refers to; by default
+    they are left out of the generated program and listed in its header"""
+    
     def __post_init__(self):
         """Initialize default values that can't be set in field defaults"""
         if self.show_predicates is None:
             self.show_predicates = ["holds_at/2", "happens/3"]
+        if self.inertial_measures is None:
+            self.inertial_measures = {}
+        if self.project_symbols is None:
+            self.project_symbols = []
     
     @property
     def time_domain(self) -> str:
@@ -66,7 +143,10 @@ class ConverterConfig:
     @property
     def clingo_suggestion(self) -> str:
         """Generate the clingo command suggestion string"""
-        return f"--models={self.default_models}"
+        suggestion = f"--models={self.default_models}"
+        if self.project_symbols:
+            suggestion += " --project"
+        return suggestion
     
     @classmethod
     def create_default(cls) -> "ConverterConfig":
@@ -99,6 +179,15 @@ class ConverterConfig:
         
         if self.test_timeout <= 0:
             raise ValueError("test_timeout must be positive")
+        
+        if self.within_encoding not in WITHIN_ENCODINGS:
+            raise ValueError(f"within_encoding must be one of {', '.join(WITHIN_ENCODINGS)}")
+        
+        if self.satisfaction_encoding not in SATISFACTION_ENCODINGS:
+            raise ValueError(f"satisfaction_encoding must be one of {', '.join(SATISFACTION_ENCODINGS)}")
+        
+        if self.incremental and self.within_deadline_predicates:
+            raise ValueError("within_deadline_predicates cannot be combined with incremental")
 
 
 # Global default configuration instance
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+SLEEC Conflict Analysis
+=======================
+
+This module looks for pairs of rules that cannot both be satisfied when they
+are triggered together. Checking every pair with its own program means
+O(rules²) conversions and groundings. Instead, the rule set is converted and
+grounded once, with one activation literal per rule: every exp/1 fact of a
+rule (including its unless and otherwise parts) is derived from an external
+active(R) atom, and triggered(R) holds when the rule is triggered at time 0.
+Each pair is then one solve under assumptions that activate the two rules,
+deactivate all others and require both to be triggered.
+
+A pair conflicts if both rules can be triggered together but no answer set
+satisfies both when they are. The witness is a situation that triggers both:
+the triggering events and measure values their conditions refer to, taken
+from an answer set with the rules deactivated.
+
+Classes:
+    Conflict: Two rules that cannot both be satisfied, with a witness
+    ConflictReport: Conflicts and per-rule findings of one analysis
+    ConflictAnalyzer: Grounds a rule set once and checks rule pairs under assumptions
+
+Functions:
+    activation_program: Guard the rules of a generated program by active/1 atoms
+
+Usage:
+    analyzer = ConflictAnalyzer(sleec_content)
+    print(analyzer.analyse().format())
+"""
+
+import re
+import time
+from dataclasses import dataclass, field, replace
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from converter.config import ConverterConfig
+from converter.parser import MeasureType, Rule
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+except ImportError:  # pragma: no cover - depends on the environment
+    clingo = None
+
+_EXP_FACT = re.compile(r"^exp\((\w+)\)\.$", re.MULTILINE)
+
+
+@dataclass
+class Conflict:
+    """Two rules that cannot both be satisfied when triggered together"""
+    rules: Tuple[str, str]
+    witness: List[str] = field(default_factory=list)
+    """Trigger atoms at time 0 under which both rules are triggered, e.g.
+    "happens(request,0,0)" or "not holds_at(isadmin,0)" """
+
+
+@dataclass
+class ConflictReport:
+    """Outcome of a pairwise conflict analysis"""
+    rules: List[str]
+    conflicts: List[Conflict] = field(default_factory=list)
+    never_triggered: List[str] = field(default_factory=list)
+    """Rules whose condition cannot hold at time 0"""
+    unsatisfiable: List[str] = field(default_factory=list)
+    """Rules that cannot be satisfied when triggered, even on their own"""
+    pairs_checked: int = 0
+    solves: int = 0
+    ground_seconds: float = 0.0
+    solve_seconds: float = 0.0
+
+    def format(self) -> str:
+        """Render the report for the command line"""
+        lines = [f"Checked {self.pairs_checked} rule pairs of {len(self.rules)} rules with {self.solves} solves "
+                 f"(grounding {self.ground_seconds * 1000:.1f} ms, solving {self.solve_seconds * 1000:.1f} ms)"]
+        for rule_id in self.never_triggered:
+            lines.append(f"⚠️  {rule_id} can never be triggered")
+        for rule_id in self.unsatisfiable:
+            lines.append(f"❌ {rule_id} cannot be satisfied when triggered")
+        for conflict in self.conflicts:
+            lines.append(f"❌ {conflict.rules[0]} conflicts with {conflict.rules[1]} when "
+                         f"{', '.join(conflict.witness) or 'both are triggered'}")
+        if not (self.conflicts or self.unsatisfiable):
+            lines.append("✅ No conflicting rule pairs")
+        return "\n".join(lines)
+
+
+def _rule_ids(rule: Rule) -> Tuple[List[str], List[str]]:
+    """exp/1 ids generated for a rule, and the ids whose antecedent means the rule is triggered"""
+    rule_id = rule.id.lower()
+    if rule.unless_clauses:
+        # Unless clauses with a negated action get no rule of their own
+        triggers = [f"{rule_id}_primary"] + [f"{rule_id}_unless{i}" for i, clause in enumerate(rule.unless_clauses, 1)
+                                             if not clause.action.strip().startswith("not ")]
+        return triggers, triggers
+    if rule.otherwise_action:
+        return [rule_id, f"{rule_id}_otherwise"], [rule_id]
+    return [rule_id], [rule_id]
+
+
+def activation_program(program: str, rules: Iterable[Rule]) -> str:
+    """Guard the rules of a generated program by one active/1 atom per rule
+
+    Every exp/1 fact becomes a rule with body active(R) for the SLEEC rule R
+    it belongs to, and triggered(R) is derived when R's condition holds at
+    time 0. The active/1 atoms are declared #external.
+    """
+    owners: Dict[str, str] = {}
+    lines = []
+    for rule in rules:
+        rule_id = rule.id.lower()
+        exp_ids, trigger_ids = _rule_ids(rule)
+        if rule_id not in owners.values():
+            lines.append(f"#external active({rule_id}).")
+        owners.update((exp_id, rule_id) for exp_id in exp_ids)
+        lines.extend(f"triggered({rule_id}) :- antecedent({trigger_id}, 0)." for trigger_id in trigger_ids)
+
+    def guard(match: "re.Match") -> str:
+        return f"exp({match.group(1)}) :- active({owners[match.group(1)]})."
+
+    return _EXP_FACT.sub(guard, program) + "\n% Conflict analysis: rule activation\n" + "\n".join(lines) + "\n"
+
+
+class ConflictAnalyzer:
+    """Grounds a SLEEC rule set once and checks rule pairs for conflicts under assumptions
+
+    Args:
+        content: SLEEC source
+        config: Converter configuration; incremental and external_inputs are
+            turned off
+        arguments: Extra clingo command line options
+    """
+
+    def __init__(self, content: str, config: Optional[ConverterConfig] = None, arguments: Sequence[str] = ()):
+        if clingo is None:
+            raise RuntimeError("❌ The clingo Python module is not installed")
+        self.config = replace(config or ConverterConfig.create_default(), incremental=False, external_inputs=False)
+        self.converter = SleecToClingoConverter(self.config)
+        self.program = activation_program(self.converter.convert_sleec_string(content), self.converter.rules)
+        # Rules sharing a duplicate id are activated together
+        self.rules = list(dict.fromkeys(rule.id.lower() for rule in self.converter.rules))
+
+        index = self.converter._get_symbol_index()
+        self._references = {}
+        for rule in self.converter.rules:
+            self._references[rule.id.lower()] = (self._references.get(rule.id.lower(), frozenset())
+                                                 | index.rule_events[rule.id] | index.rule_measures[rule.id])
+        self._boolean_measures = {name for name, measure in index.measures.items()
+                                  if measure.type == MeasureType.BOOLEAN}
+
+        self.solves = 0
+        self.solve_seconds = 0.0
+        start = time.perf_counter()
+        self._control = clingo.Control(list(arguments), logger=lambda code, message: None)
+        self._control.add("base", [], self.program)
+        self._control.ground([("base", [])])
+        # Externals are false until assigned; free ones can be fixed either way by assumptions
+        for rule_id in self.rules:
+            self._control.assign_external(clingo.Function("active", [clingo.Function(rule_id)]), None)
+        self.ground_seconds = time.perf_counter() - start
+
+    @classmethod
+    def from_file(cls, filename: str, config: Optional[ConverterConfig] = None,
+                  arguments: Sequence[str] = ()) -> "ConflictAnalyzer":
+        """Create an analyzer for a SLEEC file"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            return cls(f.read(), config, arguments)
+
+    def solve(self, active: Iterable[str], triggered: Iterable[str]) -> Optional[List["clingo.Symbol"]]:
+        """Solve with only the given rules active and triggered
+
+        Returns:
+            The atoms of an answer set, or None if there is none
+        """
+        active = set(active)
+        assumptions = [(clingo.Function("active", [clingo.Function(rule_id)]), rule_id in active)
+                       for rule_id in self.rules]
+        assumptions.extend((clingo.Function("triggered", [clingo.Function(rule_id)]), True) for rule_id in triggered)
+        start = time.perf_counter()
+        atoms = None
+        with self._control.solve(assumptions=assumptions, yield_=True) as handle:
+            for model in handle:
+                atoms = model.symbols(atoms=True)
+                break
+        self.solve_seconds += time.perf_counter() - start
+        self.solves += 1
+        return atoms
+
+    def check_pair(self, first: str, second: str) -> Optional[Conflict]:
+        """Return the conflict between two rules, or None if they do not conflict"""
+        pair = (first.lower(), second.lower())
+        if self.solve(pair, pair) is not None:
+            return None
+        situation = self.solve((), pair)
+        if situation is None:
+            # The two rules are never triggered together
+            return None
+        return Conflict(pair, self._witness(situation, pair))
+
+    def analyse(self) -> ConflictReport:
+        """Check every rule on its own, then every pair of rules that can each be satisfied"""
+        report = ConflictReport(rules=list(self.rules))
+        satisfiable = []
+        for rule_id in self.rules:
+            if self.solve((), [rule_id]) is None:
+                report.never_triggered.append(rule_id)
+            elif self.solve([rule_id], [rule_id]) is None:
+                report.unsatisfiable.append(rule_id)
+            else:
+                satisfiable.append(rule_id)
+
+        for first, second in combinations(satisfiable, 2):
+            report.pairs_checked += 1
+            conflict = self.check_pair(first, second)
+            if conflict is not None:
+                report.conflicts.append(conflict)
+
+        report.solves = self.solves
+        report.ground_seconds = self.ground_seconds
+        report.solve_seconds = self.solve_seconds
+        return report
+
+    def _witness(self, atoms: List["clingo.Symbol"], pair: Tuple[str, str]) -> List[str]:
+        """Trigger atoms at time 0 that the conditions of the pair refer to"""
+        names = self._references[pair[0]] | self._references[pair[1]]
+        witness, true_measures = [], set()
+        for atom in atoms:
+            if atom.name not in ("happens", "holds_at") or atom.arguments[-1] != clingo.Number(0):
+                continue
+            name = atom.arguments[0].name
+            if name in names:
+                witness.append(str(atom))
+                true_measures.add(name)
+        witness.extend(f"not holds_at({name},0)" for name in sorted(names & self._boolean_measures - true_measures))
+        return sorted(witness)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+SLEEC Time Horizon Analysis
+===========================
+
+This module derives the smallest time horizon in which every rule's chain of
+triggers and within deadlines fits. Rules form a graph over events: a rule
+leads from each event in its conditions to each event it produces, weighted
+by its within deadline (0 for immediate responses). The horizon is the
+longest path through that graph. Rules that trigger each other in a cycle
+with deadlines can repeat without end, so no horizon fits their chains; they
+are reported separately and their deadlines left out of the longest path.
+
+Classes:
+    Horizon: Derived horizon and the rule chain that needs it
+    HorizonWarning: Warning raised when a fixed time domain truncates a chain
+
+Functions:
+    analyse_horizon: Compute the horizon of a rule set
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from converter.analysis import SymbolIndex
+from converter.conditions import EventRef, walk
+from converter.parser import Rule, UnlessClause
+from converter.timescale import TimeScale
+
+
+class HorizonWarning(UserWarning):
+    """Raised when max_time is too short for a rule's deadlines"""
+
+
+@dataclass
+class Horizon:
+    """Smallest time horizon that fits every trigger-plus-deadline chain"""
+    horizon: int = 0
+    chain: List[str] = field(default_factory=list)
+    """Rule ids along the longest chain, in trigger order"""
+    unresolved: List[str] = field(default_factory=list)
+    """Rule ids whose within constraint is not a number or numeric constant (with a known unit)"""
+    cycle: List[str] = field(default_factory=list)
+    """Rule ids with deadlines on cycles of rules that trigger each other;
+    chains through them are unbounded and not counted in horizon"""
+
+    def describe(self, limit: int = 8) -> str:
+        """Human readable chain, e.g. 'R1 -> R2'
+
+        Chains longer than limit show their first and last limit // 2 rules
+        and how many are left out in between.
+        """
+        if not self.chain:
+            return "no within deadlines"
+        return _abbreviate(self.chain, " -> ", limit)
+
+    def describe_cycle(self, limit: int = 8) -> str:
+        """Human readable rules on deadline cycles, e.g. 'R2, R3'"""
+        return _abbreviate(self.cycle, ", ", limit)
+
+
+def _abbreviate(rule_ids: List[str], separator: str, limit: int) -> str:
+    """Join rule ids, keeping the first and last limit // 2 of long lists"""
+    if len(rule_ids) <= limit:
+        return separator.join(rule_ids)
+    head, tail = rule_ids[:limit // 2], rule_ids[-(limit // 2):]
+    return (f"{separator.join(head)}{separator}... ({len(rule_ids) - len(head) - len(tail)} more) ..."
+            f"{separator}{separator.join(tail)}")
+
+
+_Edge = Tuple[str, str, int, str]
+"""(source event, produced event, deadline, rule id)"""
+
+_ROOT = ""
+"""Pseudo event that triggers rules without event conditions"""
+
+
+def _events_of(index: SymbolIndex, item: Union[Rule, UnlessClause]) -> Set[str]:
+    return {node.name.lower() for node in walk(index.condition_of(item)) if isinstance(node, EventRef)}
+
+
+def analyse_horizon(rules: List[Rule], index: SymbolIndex, scale: Optional[TimeScale] = None) -> Horizon:
+    """Compute the horizon, in time steps of scale, needed to exhibit every rule's chain of deadlines
+
+    Chains through cycles of rules with deadlines have no bound; the rules on
+    such cycles are listed in Horizon.cycle and the horizon covers the
+    longest chain that passes through each cycle without its deadlines.
+    """
+    scale = scale or TimeScale()
+    result = Horizon()
+    edges: List[_Edge] = []
+
+    for rule in rules:
+        deadline = 0
+        if rule.within_constraint:
+            deadline = scale.steps(rule.within_constraint, index)
+            if deadline is None:
+                result.unresolved.append(rule.id)
+                deadline = 0
+
+        triggers = _events_of(index, rule)
+        responses = [(rule.action, deadline, triggers), (rule.otherwise_action, 0, triggers)]
+        responses.extend((clause.action, 0, triggers | _events_of(index, clause)) for clause in rule.unless_clauses or ())
+
+        for action, weight, sources in responses:
+            if not action or action.strip().startswith("not "):
+                continue
+            for trigger in sorted(sources) or [_ROOT]:
+                edges.append((trigger, action.lower(), weight, rule.id))
+
+    if edges:
+        result.horizon, result.chain, result.cycle = _longest_chain(edges)
+    return result
+
+
+def _longest_chain(edges: List[_Edge]) -> Tuple[int, List[str], List[str]]:
+    """Longest weighted path, collapsing each cycle into one node
+
+    Returns:
+        Length and rule ids of the path, and the rule ids with deadlines
+        inside cycles
+    """
+    graph: Dict[str, List[_Edge]] = {}
+    for edge in edges:
+        graph.setdefault(edge[0], []).append(edge)
+        graph.setdefault(edge[1], [])
+
+    component = _components(graph)
+
+    # A deadline inside a cycle can be used any number of times, so it bounds nothing
+    cycle: Dict[str, None] = {}
+    for source, target, weight, rule_id in edges:
+        if component[source] == component[target] and weight > 0:
+            cycle[rule_id] = None
+
+    # Components are numbered in reverse topological order, so relax edges
+    # from the highest numbered source component down
+    best = dict.fromkeys(component.values(), 0)
+    previous: Dict[int, Tuple[int, str]] = {}
+    for source, target, weight, rule_id in sorted(edges, key=lambda edge: -component[edge[0]]):
+        source, target = component[source], component[target]
+        if source == target:
+            continue
+        length = best[source] + weight
+        if length > best[target]:
+            best[target] = length
+            previous[target] = (source, rule_id)
+
+    number = end = max(best, key=lambda key: (best[key], -key))
+    chain = []
+    while number in previous:
+        number, rule_id = previous[number]
+        chain.append(rule_id)
+    chain.reverse()
+    return best[end], chain, list(cycle)
+
+
+def _components(graph: Dict[str, List[_Edge]]) -> Dict[str, int]:
+    """Strongly connected components (iterative Tarjan), numbered in reverse topological order"""
+    index_of: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack = set()
+    stack: List[str] = []
+    component: Dict[str, int] = {}
+    components = 0
+
+    for start in graph:
+        if start in index_of:
+            continue
+        work = [(start, 0)]
+        while work:
+            node, position = work.pop()
+            if position == 0:
+                index_of[node] = lowlink[node] = len(index_of)
+                stack.append(node)
+                on_stack.add(node)
+            successors = graph[node]
+            if position < len(successors):
+                work.append((node, position + 1))
+                target = successors[position][1]
+                if target not in index_of:
+                    work.append((target, 0))
+                elif target in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[target])
+                continue
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index_of[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component[member] = components
+                    if member == node:
+                        break
+                components += 1
+    return component
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+SLEEC Incremental Encoding
+==========================
+
+This module rewrites a generated program into the program parts of clingo's
+multi-shot solving, so that the time horizon can grow one step at a time
+without regrounding what is already ground:
+
+    #program base.      facts that do not depend on time
+    #program step(t).   everything about time point t
+    #program check(t).  obligations whose deadline is still open at horizon t
+
+A rule instance at time T can only be checked once its deadline has passed,
+because its consequent looks ahead to T+k. Its consequent and satisfaction
+atoms are therefore derived in step T+k (delay(R, k) facts tell the shared
+schemas about the delay), and check(t) checks the instances still open at
+horizon t against the time points up to t, exactly as a fixed time(0..t)
+program truncates them. The external query(t) activates check(t) for the
+current horizon only.
+
+converter.multishot drives such a program.
+
+Functions:
+    split_statements: Split program text into statements, dropping comments
+    incremental_program: Rewrite a generated program into base/step/check parts
+"""
+
+import re
+from typing import Dict, List
+
+_STATEMENT_END = re.compile(r"(?<!\.)\.(?=\s|$)")
+_TIME_VARIABLE = re.compile(r"\bT\d?\b")
+_SCHEMA = re.compile(r"\bexp\(([A-Z]\w*)\)")
+_DELAYED = re.compile(r"^(consequent|holds_nv|holds_v)\((\w+), T\)")
+_CONSEQUENT = re.compile(r"^consequent\((\w+), T\) :- (.*)$")
+
+
+def split_statements(text: str) -> List[str]:
+    """Split program text into statements on one line each, dropping comments"""
+    code = " ".join(line for line in text.splitlines() if not line.lstrip().startswith("%"))
+    return [" ".join(part.split()) + "." for part in _STATEMENT_END.split(code) if part.strip()]
+
+
+def _with_binding(statement: str, binding: str) -> str:
+    """Append a literal to the body (or condition) of a statement"""
+    return f"{statement[:-1]}, {binding}."
+
+
+def _step_variable(statement: str) -> str:
+    """Time variable that identifies the time point a statement is about"""
+    head = statement.split(":-")[0] if ":-" in statement else statement
+    variables = set(_TIME_VARIABLE.findall(head)) or set(_TIME_VARIABLE.findall(statement))
+    for variable in ("T2", "T", "T1"):
+        if variable in variables:
+            return variable
+    raise ValueError(f"❌ Cannot place statement in the incremental encoding: {statement}")
+
+
+def incremental_program(program: str, delays: Dict[str, int]) -> str:
+    """Rewrite a generated program into #program base/step(t)/check(t) parts
+
+    Args:
+        program: Generated program (any time domain; time/1 facts are replaced)
+        delays: Rule ids whose consequent looks ahead, mapped to how many steps
+
+    Raises:
+        ValueError: If a rule needs time points after its own that are not
+            covered by a delay, e.g. an unless condition on a within event
+    """
+    base, step, check = [], [], []
+    rule_ids: List[str] = []
+    delayed = False
+
+    for statement in split_statements(program):
+        if statement.startswith("time("):
+            continue
+        if statement.startswith("#show") or not _TIME_VARIABLE.search(statement):
+            base.append(statement)
+            if statement.startswith("exp("):
+                rule_ids.append(statement[4:-2])
+            continue
+
+        schema = _SCHEMA.search(statement)
+        if schema:
+            # Shared satisfaction schemas check each rule id after its delay
+            step.append(_with_binding(statement, f"delay({schema.group(1)}, D), T = t-D"))
+            delayed = True
+            continue
+
+        variable = _step_variable(statement)
+        if statement.startswith("#project"):
+            step.append(re.sub(rf"\b{variable}\b", "t", statement))
+            continue
+
+        target = _DELAYED.match(statement)
+        delay = delays.get(target.group(2), 0) if target else 0
+        if delay:
+            step.append(_with_binding(statement, f"T = t-{delay}"))
+            continue
+        if variable == "T" and "T2" in statement and not target and not statement.startswith("{"):
+            raise ValueError("❌ The incremental encoding cannot express conditions that wait for a within "
+                             f"event after their own time point: {statement}")
+        step.append(_with_binding(statement, f"{variable} = t"))
+
+    for statement in step:
+        consequent = _CONSEQUENT.match(statement)
+        if not consequent or not delays.get(consequent.group(1)):
+            continue
+        rule_id, delay = consequent.group(1), delays[consequent.group(1)]
+        body = consequent.group(2)[:-len(f", T = t-{delay}.")]
+        check.extend([
+            f"consequent_by({rule_id}, T, t) :- {body}, T > t-{delay}.",
+            f":- query(t), time(T), T > t-{delay}, antecedent({rule_id}, T), not consequent_by({rule_id}, T, t).",
+            f":- query(t), time(T), T > t-{delay}, consequent_by({rule_id}, T, t), not antecedent({rule_id}, T).",
+        ])
+
+    if delayed:
+        base.extend(f"delay({rule_id}, {delays.get(rule_id, 0)})." for rule_id in rule_ids)
+
+    parts = ["#program base.", *base, "", "#program step(t).", "time(t).", *step, "",
+             "#program check(t).", "#external query(t).", *check]
+    return "\n".join(parts) + "\n"
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+SLEEC Lexer
+===========
+
+This module turns SLEEC source text into a flat list of tokens in a single
+linear pass. Every token records its line, column and character offset so the
+parser can report exact source positions without rescanning the document.
+
+Classes:
+    TokenType: Enumeration of token kinds
+    Token: A single lexical token with its source position
+    SleecLexer: Tokenizer for SLEEC source text
+"""
+
+import re
+from enum import Enum
+from typing import List, NamedTuple
+
+
+class TokenType(Enum):
+    WORD = "word"
+    NUMBER = "number"
+    LBRACE = "{"
+    RBRACE = "}"
+    LPAREN = "("
+    RPAREN = ")"
+    COLON = ":"
+    COMMA = ","
+    OPERATOR = "operator"
+    NEWLINE = "newline"
+    SYMBOL = "symbol"
+
+
+class Token(NamedTuple):
+    type: TokenType
+    value: str
+    line: int
+    column: int
+    offset: int
+
+    @property
+    def end(self) -> int:
+        """Offset just past the last character of the token"""
+        return self.offset + len(self.value)
+
+
+class SleecLexer:
+    """Single-pass tokenizer for SLEEC source text"""
+
+    # Order matters: comments must win over operators, multi-character
+    # operators over single-character ones.
+    _TOKEN_PATTERN = re.compile(r"""
+        (?P<NEWLINE>\n)
+      | (?P<SKIP>[ \t\r\f\v]+)
+      | (?P<COMMENT>//[^\n]*)
+      | (?P<NUMBER>\d+(?:\.\d+)?)
+      | (?P<WORD>[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<OPERATOR><=|>=|<>|!=|==|<|>|=)
+      | (?P<LBRACE>\{)
+      | (?P<RBRACE>\})
+      | (?P<LPAREN>\()
+      | (?P<RPAREN>\))
+      | (?P<COLON>:)
+      | (?P<COMMA>,)
+      | (?P<SYMBOL>.)
+    """, re.VERBOSE)
+
+    def tokenize(self, content: str, first_line: int = 1, base_offset: int = 0) -> List[Token]:
+        """Tokenize SLEEC content, dropping whitespace and comments
+
+        first_line and base_offset position a fragment that starts at the
+        beginning of a line inside a larger document.
+        """
+        tokens = []
+        line = first_line
+        line_start = 0
+
+        for match in self._TOKEN_PATTERN.finditer(content):
+            kind = match.lastgroup
+            offset = match.start()
+
+            if kind == "SKIP" or kind == "COMMENT":
+                continue
+
+            tokens.append(Token(TokenType[kind], match.group(), line, offset - line_start + 1, base_offset + offset))
+
+            if kind == "NEWLINE":
+                line += 1
+                line_start = offset + 1
+
+        return tokens
+
+    @staticmethod
+    def join(tokens: List[Token]) -> str:
+        """Rebuild source text from tokens, collapsing any whitespace gap to one space"""
+        parts = []
+        previous_end = None
+
+        for token in tokens:
+            if previous_end is not None and token.offset > previous_end:
+                parts.append(" ")
+            parts.append(token.value)
+            previous_end = token.end
+
+        return "".join(parts)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+SLEEC Time Locality Analysis
+============================
+
+Rules without within constraints only relate events and measures at the same
+time point, and every time point offers the same choices. The answer sets of
+such a rule set over a horizon 0..H are exactly the combinations of H+1
+answer sets of a single time step, so one step is enough to check
+consistency, and answer sets over the horizon can be assembled from step
+answer sets on demand.
+
+Rules that share no event or measure form independent parts; a part whose
+rules have no within constraints is time-local even when the rest of the
+rule set is not. The converter only reports such parts: single-step
+programs are generated for fully time-local rule sets.
+
+Classes:
+    Locality: Independent parts of a rule set and which of them are time-local
+    TimeLocalityWarning: Warning raised when single-step solving is not possible
+
+Functions:
+    analyse_locality: Split a rule set into independent parts and classify them
+    expand_to_horizon: Assemble an answer set over the horizon from step answer sets
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence
+
+from converter.analysis import SymbolIndex
+from converter.conditions import EventRef, MeasureRef, walk
+from converter.parser import Rule
+
+
+class TimeLocalityWarning(UserWarning):
+    """Raised when single-step solving is requested for rules that need time"""
+
+
+@dataclass
+class Locality:
+    """Independent parts of a rule set, as lists of rule ids in rule order"""
+    local_parts: List[List[str]] = field(default_factory=list)
+    """Parts whose rules only relate atoms at the same time point"""
+    timed_parts: List[List[str]] = field(default_factory=list)
+    """Parts with at least one within constraint"""
+    timed_rules: List[str] = field(default_factory=list)
+    """Rule ids with a within constraint"""
+
+    @property
+    def time_local(self) -> bool:
+        """Whether the whole rule set can be solved in a single time step"""
+        return not self.timed_rules
+
+    def describe(self) -> str:
+        """Human readable summary, e.g. 'time-local parts: R1, R2 | R3'"""
+        parts = [("time-local parts", self.local_parts), ("parts with within constraints", self.timed_parts)]
+        return "; ".join(f"{kind}: {' | '.join(', '.join(part) for part in groups)}"
+                         for kind, groups in parts if groups)
+
+
+def analyse_locality(rules: List[Rule], index: SymbolIndex) -> Locality:
+    """Split the rules into parts that share no event or measure and classify each part"""
+    parent: Dict[str, str] = {}
+
+    def find(symbol: str) -> str:
+        root = symbol
+        while parent.setdefault(root, root) != root:
+            root = parent[root]
+        while parent[symbol] != root:
+            parent[symbol], symbol = root, parent[symbol]
+        return root
+
+    rule_symbols: List[str] = []
+    for rule in rules:
+        # Rules are nodes too, so rules without symbols still form their own part
+        symbols = [f"rule:{rule.id}"]
+        conditions = [index.condition_of(rule)]
+        conditions.extend(index.condition_of(clause) for clause in rule.unless_clauses or ())
+        for node in (node for condition in conditions for node in walk(condition)):
+            if isinstance(node, (EventRef, MeasureRef)):
+                symbols.append(node.name.lower())
+        actions = [rule.action, rule.otherwise_action]
+        actions.extend(clause.action for clause in rule.unless_clauses or ())
+        symbols.extend(action.split()[-1].lower() for action in actions if action and action.split())
+
+        root = find(symbols[0])
+        for symbol in symbols[1:]:
+            parent[find(symbol)] = root
+        rule_symbols.append(symbols[0])
+
+    parts: Dict[str, List[Rule]] = {}
+    for rule, symbol in zip(rules, rule_symbols):
+        parts.setdefault(find(symbol), []).append(rule)
+
+    result = Locality(timed_rules=[rule.id for rule in rules if rule.within_constraint])
+    for part in parts.values():
+        ids = [rule.id for rule in part]
+        if any(rule.within_constraint for rule in part):
+            result.timed_parts.append(ids)
+        else:
+            result.local_parts.append(ids)
+    return result
+
+
+_ATOM = re.compile(r"^(happens|holds_at)\((.*)\)$")
+
+
+def expand_to_horizon(steps: Sequence[Iterable[str]]) -> List[str]:
+    """Place the answer set steps[t] of a single-step program at time point t
+
+    Each step answer set contains atoms at time point 0 as printed by clingo,
+    e.g. "happens(alarm,0,0)" or "holds_at(level,3,0)". Because the steps of
+    a time-local rule set are independent, any choice of step answer sets
+    gives an answer set over the horizon 0..len(steps)-1; repeating one
+    answer set gives the answer set in which nothing changes over time.
+    Atoms of other predicates, such as value_class/4 facts, are kept once.
+    """
+    expanded: Dict[str, None] = {}
+    for time_point, atoms in enumerate(steps):
+        for atom in atoms:
+            match = _ATOM.match(atom)
+            if not match:
+                expanded[atom] = None
+                continue
+            name, arguments = match.groups()
+            arguments = arguments.split(",")
+            # happens(E, T1, T2) carries two time points, holds_at only the last argument
+            times = 2 if name == "happens" else 1
+            arguments[-times:] = [str(time_point)] * times
+            expanded[f"{name}({','.join(arguments)})"] = None
+    return list(expanded)
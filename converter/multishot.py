@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+SLEEC Multi-Shot Driver
+=======================
+
+This module grows the time horizon of a rule set one step at a time with the
+incremental encoding (see converter.incremental) instead of regenerating and
+regrounding time(0..max_time) for every horizon. Each step grounds step(t)
+and check(t) into the same clingo.Control, so earlier grounding and learnt
+clauses are kept, and solves with query(t) active.
+
+Classes:
+    HorizonResult: Outcome of growing the horizon
+    IncrementalSolver: Grows the horizon of a rule set one step at a time
+
+Usage:
+    solver = IncrementalSolver(sleec_content)
+    result = solver.run(max_steps=20)
+    print(result.outcome, result.horizon)
+"""
+
+import time
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Sequence
+
+from converter.config import ConverterConfig
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+except ImportError:  # pragma: no cover - depends on the environment
+    clingo = None
+
+
+@dataclass
+class HorizonResult:
+    """Outcome of growing the horizon one step at a time"""
+    outcome: str
+    """"inconsistent" (no answer set at this horizon), "sufficient" (consistent
+    at the horizon every deadline chain needs) or "limit" (step limit reached,
+    always the case for cycles of deadlines)"""
+    horizon: int
+    """Last time point that was ground and solved"""
+    model: Optional[List[str]] = None
+    """Shown atoms of an answer set at the final horizon, if there is one"""
+    step_seconds: List[float] = field(default_factory=list)
+    """Ground plus solve time of each step"""
+
+
+class IncrementalSolver:
+    """Grows the time horizon of a SLEEC rule set one step at a time
+
+    Args:
+        content: SLEEC source
+        config: Converter configuration; incremental is always enabled
+        arguments: Extra clingo command line options
+    """
+
+    def __init__(self, content: str, config: Optional[ConverterConfig] = None, arguments: Sequence[str] = ()):
+        if clingo is None:
+            raise RuntimeError("❌ The clingo Python module is not installed")
+        self.config = replace(config or ConverterConfig.create_default(), incremental=True)
+        self.converter = SleecToClingoConverter(self.config)
+        self.program = self.converter.convert_sleec_string(content)
+        horizon = self.converter._get_horizon()
+        self.sufficient_horizon: Optional[int] = None if horizon.cycle else horizon.horizon
+        """Horizon that fits every chain of triggers and deadlines, or None if
+        rules with deadlines trigger each other in a cycle"""
+
+        self._control = clingo.Control(list(arguments), logger=lambda code, message: None)
+        self._control.add("base", [], self.program)
+        self._control.ground([("base", [])])
+        self.horizon = -1
+
+    @classmethod
+    def from_file(cls, filename: str, config: Optional[ConverterConfig] = None,
+                  arguments: Sequence[str] = ()) -> "IncrementalSolver":
+        """Create a solver for a SLEEC file"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            return cls(f.read(), config, arguments)
+
+    def step(self) -> Optional[List[str]]:
+        """Ground the next time point and solve at the new horizon
+
+        Returns:
+            Shown atoms of an answer set, or None if there is none
+        """
+        self.horizon += 1
+        horizon = clingo.Number(self.horizon)
+        self._control.ground([("step", [horizon]), ("check", [horizon])])
+        if self.horizon > 0:
+            self._control.release_external(clingo.Function("query", [clingo.Number(self.horizon - 1)]))
+        self._control.assign_external(clingo.Function("query", [horizon]), True)
+
+        model: Optional[List[str]] = None
+        with self._control.solve(yield_=True) as handle:
+            for answer in handle:
+                model = [str(symbol) for symbol in answer.symbols(shown=True)]
+                break
+        return model
+
+    def run(self, max_steps: int) -> HorizonResult:
+        """Grow the horizon until the rules are inconsistent, the horizon is sufficient, or max_steps is reached"""
+        step_seconds = []
+        while True:
+            start = time.perf_counter()
+            model = self.step()
+            step_seconds.append(time.perf_counter() - start)
+            if model is None:
+                return HorizonResult("inconsistent", self.horizon, None, step_seconds)
+            if self.sufficient_horizon is not None and self.horizon >= self.sufficient_horizon:
+                return HorizonResult("sufficient", self.horizon, model, step_seconds)
+            if self.horizon >= max_steps:
+                return HorizonResult("limit", self.horizon, model, step_seconds)
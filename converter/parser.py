@@ -6,6 +6,11 @@ Shared SLEEC Parser
 This module provides  SLEEC parsing functionality used by
 the converter.
 
+The parser consumes the token list produced by SleecLexer in a single linear
+pass, so every definition and rule carries its exact line, column and offset.
+Rule and unless conditions are also parsed into expression trees
+(see converter.conditions) at this point.
+
 Classes:
     MeasureType: Enumeration of measure types (boolean, numeric, scale)
     Measure: Data class for measure definitions
@@ -13,13 +18,18 @@ Classes:
     Constant: Data class for constant definitions
     Rule: Data class for rule definitions
     SleecParser: Parser for SLEEC files
+    SleecSyntaxWarning: Warning for constructs that are parsed but not modelled as written
 """
 
 import re
+import warnings
 from typing import List, Dict, Tuple, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 
+from converter.lexer import SleecLexer, Token, TokenType
+from converter.conditions import Condition, ConditionParser
+
 class MeasureType(Enum):
     BOOLEAN = "boolean"
     NUMERIC = "numeric"
@@ -31,22 +41,29 @@ class Measure:
     type: MeasureType
     line_number: int
     scale_values: Optional[List[str]] = None
+    column: Optional[int] = None
+    offset: Optional[int] = None
     
 @dataclass
 class Event:
     name: str
     line_number: int
+    column: Optional[int] = None
+    offset: Optional[int] = None
 
 @dataclass
 class Constant:
     name: str
     value: str
     line_number: int
+    column: Optional[int] = None
+    offset: Optional[int] = None
 
 @dataclass
 class UnlessClause:
     condition: str
     action: str
+    condition_expr: Optional[Condition] = None
 
 @dataclass
 class Rule:
@@ -57,6 +74,43 @@ class Rule:
     otherwise_action: Optional[str] = None
     unless_clauses: Optional[List[UnlessClause]] = None
     within_constraint: Optional[str] = None
+    column: Optional[int] = None
+    offset: Optional[int] = None
+    condition_expr: Optional[Condition] = None
+
+
+class SleecSyntaxWarning(UserWarning):
+    """Warns about SLEEC constructs that are parsed but not modelled as written"""
+
+
+class _TokenCursor:
+    """Forward-only cursor over a token list"""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.index = 0
+
+    def at_end(self) -> bool:
+        return self.index >= len(self.tokens)
+
+    def peek(self, ahead: int = 0) -> Optional[Token]:
+        position = self.index + ahead
+        return self.tokens[position] if position < len(self.tokens) else None
+
+    def advance(self) -> Token:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def at_word(self, *values: str, ahead: int = 0) -> bool:
+        token = self.peek(ahead)
+        return token is not None and token.type is TokenType.WORD and token.value in values
+
+    def at_rule_start(self) -> bool:
+        """A rule starts with an identifier immediately followed by 'when'"""
+        token = self.peek()
+        return token is not None and token.type is TokenType.WORD and self.at_word("when", ahead=1)
+
 
 class SleecParser:
     """Shared SLEEC parser for extracting definitions and rules"""
@@ -66,6 +120,8 @@ class SleecParser:
         self.measures: List[Measure] = []
         self.constants: List[Constant] = []
         self.rules: List[Rule] = []
+        self.lexer = SleecLexer()
+        self.condition_parser = ConditionParser()
     
     def parse_file(self, filename: str) -> Tuple[List[Event], List[Measure], List[Constant], List[Rule]]:
         """Parse a SLEEC file and return all definitions and rules"""
@@ -88,158 +144,309 @@ class SleecParser:
     
     def _parse_sleec(self, content: str):
         """Parse SLEEC content and extract definitions and rules"""
-        # Keep original content for line number tracking
-        original_lines = content.split('\n')
+        tokens = self.lexer.tokenize(content)
+        rule_sections = []
+        index = 0
         
-        # Remove comments only (don't normalize whitespace yet)
-        content_no_comments = re.sub(r'//.*$', '', content, flags=re.MULTILINE)
-        
-        # Extract definitions section
-        def_match = re.search(r'def_start(.*?)def_end', content_no_comments, re.DOTALL)
-        if def_match:
-            def_section = def_match.group(1)
-            def_section = re.sub(r'\s+$', '', def_section, flags=re.MULTILINE)  # Remove trailing whitespace
-            self._parse_definitions(def_section, original_lines)
+        # Anything outside def_start/def_end and rule_start/rule_end is ignored
+        while index < len(tokens):
+            token = tokens[index]
+            if token.type is TokenType.WORD and token.value == "def_start":
+                end = self._find_section_end(tokens, index, "def_end")
+                self._parse_definition_tokens(tokens[index + 1:end])
+                index = end + 1
+            elif token.type is TokenType.WORD and token.value == "rule_start":
+                end = self._find_section_end(tokens, index, "rule_end")
+                rule_sections.append([t for t in tokens[index + 1:end] if t.type is not TokenType.NEWLINE])
+                index = end + 1
+            else:
+                index += 1
         
-        # Extract rules section
-        rule_match = re.search(r'rule_start(.*?)rule_end', content_no_comments, re.DOTALL)
-        if rule_match:
-            rule_section = rule_match.group(1)
-            rule_section = re.sub(r'\s+$', '', rule_section, flags=re.MULTILINE)  # Remove trailing whitespace
-            self._parse_rules(rule_section, original_lines)
+        # Rules are parsed once all definitions are known so that conditions
+        # can tell events apart from other names
+        for rule_tokens in rule_sections:
+            self._parse_rule_tokens(rule_tokens)
+        self.check_rule_ids(self.rules)
     
-    def _find_line_number(self, text: str, original_lines: List[str]) -> int:
-        """Find the line number where text appears in original content"""
-        text_clean = text.strip()
-        for i, line in enumerate(original_lines, 1):
-            if text_clean in line and line.strip():
-                return i
-        return 1  # Fallback to line 1 if not found
+    def _find_section_end(self, tokens: List[Token], start: int, keyword: str) -> int:
+        """Return the index of the token closing the section opened at start"""
+        for index in range(start + 1, len(tokens)):
+            token = tokens[index]
+            if token.type is TokenType.WORD and token.value == keyword:
+                return index
+        raise self._syntax_error(tokens[start], f"'{tokens[start].value}' has no matching '{keyword}'")
     
-    def _parse_definitions(self, def_content: str, original_lines: List[str]):
-        """Parse the definitions section"""
-        lines = [line.strip() for line in def_content.split('\n') if line.strip()]
+    def _syntax_error(self, token: Token, message: str, expected: Optional[str] = None) -> ValueError:
+        """Build a syntax error pointing at the given token"""
+        error = f"❌ Syntax Error at line {token.line}, column {token.column}: {message}"
+        if expected:
+            error += f"\n\nExpected format:\n{expected}"
+        return ValueError(error)
+    
+    def _parse_definition_tokens(self, tokens: List[Token]):
+        """Parse the definitions section, one definition per source line"""
+        line_tokens = []
+        for token in tokens:
+            if token.type is TokenType.NEWLINE:
+                if line_tokens:
+                    self._parse_definition(line_tokens)
+                    line_tokens = []
+            else:
+                line_tokens.append(token)
         
-        for line in lines:
-            # Parse events
-            event_match = re.match(r'event\s+(\w+)', line)
-            if event_match:
-                line_num = self._find_line_number(line, original_lines)
-                self.events.append(Event(event_match.group(1), line_num))
-                continue
-            
-            # Parse measures
-            measure_match = re.match(r'measure\s+(\w+):\s*(.+)', line)
-            if measure_match:
-                name, type_def = measure_match.groups()
-                line_num = self._find_line_number(line, original_lines)
-                self._parse_measure(name, type_def, line_num)
-                continue
-            
-            # Parse constants
-            constant_match = re.match(r'constant\s+(\w+)\s*=\s*(.+)', line)
-            if constant_match:
-                name, value = constant_match.groups()
-                line_num = self._find_line_number(line, original_lines)
-                self.constants.append(Constant(name, value.strip(), line_num))
-                continue
-            
-            # If we get here, the line wasn't recognized
-            line_num = self._find_line_number(line, original_lines)
-            raise ValueError(f"❌ Syntax Error at line {line_num}: Unrecognized definition '{line}'\n\n"
-                           f"Expected format:\n"
-                           f"  event <name>\n"
-                           f"  measure <name>: <type>\n"
-                           f"  constant <name> = <value>\n\n"
-                           f"Valid measure types: boolean, numeric, scale(value1, value2, ...)")
+        if line_tokens:
+            self._parse_definition(line_tokens)
+    
+    def _parse_definition(self, tokens: List[Token]):
+        """Parse a single definition line"""
+        first = tokens[0]
+        keyword = first.value if first.type is TokenType.WORD else None
+        name_token = tokens[1] if len(tokens) > 1 and tokens[1].type is TokenType.WORD else None
+        
+        # Parse events
+        if keyword == "event" and name_token:
+            self.events.append(Event(name_token.value, first.line, first.column, first.offset))
+            return
+        
+        # Parse measures
+        if keyword == "measure" and name_token and len(tokens) > 3 and tokens[2].type is TokenType.COLON:
+            type_def = SleecLexer.join(tokens[3:])
+            self._parse_measure(name_token.value, type_def, first.line, first.column, first.offset)
+            return
+        
+        # Parse constants
+        if (keyword == "constant" and name_token and len(tokens) > 3
+                and tokens[2].type is TokenType.OPERATOR and tokens[2].value == "="):
+            value = SleecLexer.join(tokens[3:])
+            self.constants.append(Constant(name_token.value, value, first.line, first.column, first.offset))
+            return
+        
+        # If we get here, the line wasn't recognized
+        raise ValueError(f"❌ Syntax Error at line {first.line}: Unrecognized definition '{SleecLexer.join(tokens)}'\n\n"
+                       f"Expected format:\n"
+                       f"  event <name>\n"
+                       f"  measure <name>: <type>\n"
+                       f"  constant <name> = <value>\n\n"
+                       f"Valid measure types: boolean, numeric, scale(value1, value2, ...)")
     
-    def _parse_measure(self, name: str, type_def: str, line_number: int):
+    def _parse_measure(self, name: str, type_def: str, line_number: int,
+                       column: Optional[int] = None, offset: Optional[int] = None):
         """Parse a measure definition"""
         type_def = type_def.strip()
         
         if type_def == "boolean":
-            self.measures.append(Measure(name, MeasureType.BOOLEAN, line_number))
+            self.measures.append(Measure(name, MeasureType.BOOLEAN, line_number, None, column, offset))
         elif type_def == "numeric":
-            self.measures.append(Measure(name, MeasureType.NUMERIC, line_number))
+            self.measures.append(Measure(name, MeasureType.NUMERIC, line_number, None, column, offset))
         elif type_def.startswith("scale(") and type_def.endswith(")"):
             # Extract scale values
             scale_content = type_def[6:-1]  # Remove "scale(" and ")"
             values = [v.strip() for v in scale_content.split(',')]
-            self.measures.append(Measure(name, MeasureType.SCALE, line_number, values))
+            self.measures.append(Measure(name, MeasureType.SCALE, line_number, values, column, offset))
         else:
             # Default to boolean if type unclear
-            self.measures.append(Measure(name, MeasureType.BOOLEAN, line_number))
+            self.measures.append(Measure(name, MeasureType.BOOLEAN, line_number, None, column, offset))
     
-    def _parse_rules(self, rules_content: str, original_lines: List[str]):
-        """Parse the rules section"""
-        # Split by rule boundaries (R1, R2, etc.)
-        rule_pattern = r'(R\d+)\s+when\s+(.*?)then\s+(.*?)(?=R\d+|$)'
-        matches = re.findall(rule_pattern, rules_content, re.DOTALL)
+    def _parse_rules(self, rules_content: str, original_lines: Optional[List[str]] = None):
+        """Parse the body of a rules section given as text
         
-        for rule_id, condition, action_part in matches:
-            # Parse within constraint first 
-            within_constraint = None
-            remaining_action = action_part.strip()
-            
-            # Extract within constraint using regex
-            within_match = re.search(r'(.*?)\s+within\s+(\d+\s+\w+)', remaining_action)
-            if within_match:
-                remaining_action = within_match.group(1).strip()
-                within_constraint = within_match.group(2).strip()
-            else:
-                # Also check for within constraints using constants (e.g., "within notifyDelay minutes")
-                within_match = re.search(r'(.*?)\s+within\s+(\w+\s+\w+)', remaining_action)
-                if within_match:
-                    remaining_action = within_match.group(1).strip()
-                    within_constraint = within_match.group(2).strip()
-            
-            # Parse unless clauses (they take precedence over otherwise)
-            unless_clauses = []
-            
-            # Extract all unless clauses using regex
-            unless_pattern = r'\s+unless\s+\(([^)]+)\)\s+then\s+(.*?)(?=\s+unless|$)'
-            unless_matches = re.findall(unless_pattern, remaining_action)
-            
-            if unless_matches:
-                # Extract primary action (everything before first unless)
-                primary_action_match = re.match(r'(.*?)\s+unless', remaining_action)
-                if primary_action_match:
-                    action = primary_action_match.group(1).strip()
-                else:
-                    action = remaining_action.strip()
-                
-                # Process unless clauses
-                for unless_condition, unless_action in unless_matches:
-                    unless_clauses.append(UnlessClause(
-                        condition=unless_condition.strip(),
-                        action=unless_action.strip()
-                    ))
-                
-                otherwise_action = None  # unless takes precedence over otherwise
-                
+        original_lines is accepted for backwards compatibility only; line
+        numbers are taken from the tokens and are relative to rules_content.
+        """
+        tokens = self.lexer.tokenize(rules_content)
+        self._parse_rule_tokens([t for t in tokens if t.type is not TokenType.NEWLINE])
+    
+    def parse_rules_string(self, content: str, first_line: int = 1, base_offset: int = 0) -> List[Rule]:
+        """Parse rules (the body of a rules section) against the current definitions
+
+        Used to re-parse part of a file; first_line and base_offset give the
+        fragment's position so rules and errors report file positions.
+        The parser's own rule list is left untouched.
+        """
+        tokens = self.lexer.tokenize(content, first_line, base_offset)
+        rules, self.rules = self.rules, []
+        try:
+            self._parse_rule_tokens([t for t in tokens if t.type is not TokenType.NEWLINE])
+            return self.rules
+        finally:
+            self.rules = rules
+    
+    def _parse_rule_tokens(self, tokens: List[Token]):
+        """Parse the rules section
+        
+        Grammar (newlines are insignificant):
+            rule    := <id> when <condition> then <action> [within <value> [<unit>]] clause*
+            clause  := unless <condition> [then <action>] | otherwise <action>
+            action  := [not] <event>
+        """
+        cursor = _TokenCursor(tokens)
+        self.condition_parser = ConditionParser(
+            (event.name for event in self.events),
+            (constant.name for constant in self.constants)
+        )
+        
+        while not cursor.at_end():
+            if not cursor.at_rule_start():
+                raise self._syntax_error(cursor.peek(), f"Unexpected '{cursor.peek().value}' in rules section",
+                                         "  <id> when <condition> then <action>")
+            self.rules.append(self._parse_rule(cursor))
+    
+    def _parse_rule(self, cursor: _TokenCursor) -> Rule:
+        """Parse a single rule starting at its identifier"""
+        id_token = cursor.advance()
+        cursor.advance()  # 'when'
+        
+        condition_tokens = self._collect_condition(cursor, ("then",))
+        if not condition_tokens:
+            raise self._syntax_error(id_token, f"Rule {id_token.value} has an empty condition")
+        if not cursor.at_word("then"):
+            raise self._syntax_error(cursor.peek() or condition_tokens[-1],
+                                     f"Expected 'then' after the condition of rule {id_token.value}")
+        cursor.advance()
+        
+        action = self._parse_action(cursor, id_token)
+        within_constraint = None
+        otherwise_action = None
+        unless_clauses = []
+        
+        if cursor.at_word("within"):
+            within_constraint = self._parse_within(cursor, id_token)
+        
+        while not cursor.at_end() and not cursor.at_rule_start():
+            if cursor.at_word("unless"):
+                unless_clauses.append(self._parse_unless_clause(cursor, id_token, action))
+            elif cursor.at_word("otherwise"):
+                cursor.advance()
+                otherwise_action = self._parse_action(cursor, id_token)
             else:
-                # Handle otherwise clause (only if no unless clauses)
-                otherwise_match = re.search(r'(.*?)\s+otherwise\s+(.*)', remaining_action, re.DOTALL)
-                if otherwise_match:
-                    action = otherwise_match.group(1).strip()
-                    otherwise_action = otherwise_match.group(2).strip()
-                else:
-                    action = remaining_action.strip()
-                    otherwise_action = None
-            
-            # Find line number for this rule
-            rule_text = f"{rule_id} when {condition} then {action}"
-            line_num = self._find_line_number(rule_text, original_lines)
-            
-            self.rules.append(Rule(
-                rule_id, 
-                condition.strip(), 
-                action, 
-                line_num, 
-                otherwise_action,
-                unless_clauses if unless_clauses else None,
-                within_constraint
-            ))
+                raise self._syntax_error(cursor.peek(), f"Unexpected '{cursor.peek().value}' after the action of rule {id_token.value}",
+                                         "  then <action> [within <value> <unit>] [otherwise <action> | unless (<condition>) then <action> ...]")
+        
+        if unless_clauses:
+            otherwise_action = None  # unless takes precedence over otherwise
+        
+        return Rule(
+            id_token.value,
+            SleecLexer.join(condition_tokens),
+            action,
+            id_token.line,
+            otherwise_action,
+            unless_clauses if unless_clauses else None,
+            within_constraint,
+            id_token.column,
+            id_token.offset,
+            self.condition_parser.parse(condition_tokens)
+        )
+    
+    def _collect_condition(self, cursor: _TokenCursor, stop_words: Tuple[str, ...]) -> List[Token]:
+        """Collect condition tokens up to a top-level stop word or the next rule"""
+        tokens = []
+        depth = 0
+        
+        while not cursor.at_end():
+            if depth == 0 and (cursor.at_word(*stop_words) or cursor.at_rule_start()):
+                break
+            token = cursor.advance()
+            if token.type is TokenType.LPAREN:
+                depth += 1
+            elif token.type is TokenType.RPAREN:
+                depth -= 1
+                if depth < 0:
+                    raise self._syntax_error(token, "Unbalanced ')' in condition")
+            tokens.append(token)
+        
+        if depth > 0:
+            raise self._syntax_error(tokens[0], "Unbalanced '(' in condition")
+        return tokens
+    
+    def _parse_action(self, cursor: _TokenCursor, id_token: Token) -> str:
+        """Parse '[not] <event>' and return it as text"""
+        negated = cursor.at_word("not")
+        if negated:
+            cursor.advance()
+        
+        token = cursor.peek()
+        if token is None or token.type is not TokenType.WORD or cursor.at_rule_start():
+            raise self._syntax_error(token or id_token, f"Expected an event name in rule {id_token.value}")
+        cursor.advance()
+        
+        return f"not {token.value}" if negated else token.value
+    
+    def _parse_within(self, cursor: _TokenCursor, id_token: Token) -> str:
+        """Parse 'within <value> [<unit>]' and return the constraint text"""
+        cursor.advance()  # 'within'
+        value = cursor.peek()
+        if value is None or value.type not in (TokenType.NUMBER, TokenType.WORD):
+            raise self._syntax_error(value or id_token, f"Expected a time value after 'within' in rule {id_token.value}")
+        cursor.advance()
+        
+        unit = cursor.peek()
+        if unit is not None and unit.type is TokenType.WORD and not cursor.at_rule_start() \
+                and not cursor.at_word("unless", "otherwise"):
+            cursor.advance()
+            return f"{value.value} {unit.value}"
+        return value.value
+    
+    def _parse_unless_clause(self, cursor: _TokenCursor, id_token: Token, primary_action: str) -> UnlessClause:
+        """Parse 'unless <condition> [then <action>]'"""
+        unless_token = cursor.advance()
+        condition_tokens = self._collect_condition(cursor, ("then", "unless", "otherwise"))
+        if not condition_tokens:
+            raise self._syntax_error(unless_token, f"Empty unless condition in rule {id_token.value}")
+        
+        # Drop a single pair of parentheses wrapping the whole condition
+        if condition_tokens[0].type is TokenType.LPAREN and self._closing_paren(condition_tokens) == len(condition_tokens) - 1:
+            condition_tokens = condition_tokens[1:-1]
+        
+        if cursor.at_word("then"):
+            cursor.advance()
+            action = self._parse_action(cursor, id_token)
+            if cursor.at_word("within"):
+                within_token = cursor.peek()
+                self._parse_within(cursor, id_token)
+                warnings.warn(f"Syntax Warning at line {within_token.line}, column {within_token.column}: "
+                              f"within deadlines of unless clauses are not supported; the unless action "
+                              f"of rule {id_token.value} must happen at once", SleecSyntaxWarning)
+        else:
+            # A bare unless waives the obligation, which the converter already
+            # expresses through a negated unless action
+            event_name = primary_action[4:] if primary_action.startswith("not ") else primary_action
+            action = f"not {event_name}"
+        
+        return UnlessClause(
+            condition=SleecLexer.join(condition_tokens),
+            action=action,
+            condition_expr=self.condition_parser.parse(condition_tokens)
+        )
+    
+    @staticmethod
+    def _closing_paren(tokens: List[Token]) -> int:
+        """Return the index of the parenthesis closing tokens[0]"""
+        depth = 0
+        for index, token in enumerate(tokens):
+            if token.type is TokenType.LPAREN:
+                depth += 1
+            elif token.type is TokenType.RPAREN:
+                depth -= 1
+                if depth == 0:
+                    return index
+        return -1
+
+    @staticmethod
+    def check_rule_ids(rules: List[Rule]) -> None:
+        """Warn about rule ids defined more than once
+        
+        Rule ids are lowercased in the generated program, so ids differing in
+        case collide too.
+        """
+        seen: Dict[str, Rule] = {}
+        for rule in rules:
+            first = seen.setdefault(rule.id.lower(), rule)
+            if first is not rule:
+                warnings.warn(f"Syntax Warning at line {rule.line_number}, column {rule.column}: "
+                              f"Duplicate rule id {rule.id} (rule {first.id} is already defined at line "
+                              f"{first.line_number}); the generated program treats both as one rule",
+                              SleecSyntaxWarning)
 
     @staticmethod
     def validate_definitions(events: List[Event], measures: List[Measure], rules: List[Rule]) -> None:
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+SLEEC Unused Definition Pruning
+===============================
+
+Declarations that no rule refers to still end up in the generated program:
+an unused event gets an event/1 fact and an unused measure gets a choice rule
+at every time point, multiplying the number of answer sets without affecting
+any rule. This module finds those declarations so the converter can leave
+them out.
+
+Classes:
+    UnusedSymbols: Events, measures and constants that no rule refers to
+
+Functions:
+    find_unused_symbols: Collect the declarations the rules never refer to
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from converter.analysis import SymbolIndex
+from converter.conditions import ConstantRef, EventRef, MeasureRef, walk
+from converter.parser import Rule
+
+
+@dataclass
+class UnusedSymbols:
+    """Declared names (lower case, in declaration order) that no rule refers to"""
+    events: List[str] = field(default_factory=list)
+    measures: List[str] = field(default_factory=list)
+    constants: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.events or self.measures or self.constants)
+
+    def describe(self) -> str:
+        """Human readable summary, e.g. 'events: a, b; measures: c'"""
+        groups = [("events", self.events), ("measures", self.measures), ("constants", self.constants)]
+        return "; ".join(f"{kind}: {', '.join(names)}" for kind, names in groups if names)
+
+
+def find_unused_symbols(rules: List[Rule], index: SymbolIndex,
+                        change_events: Optional[Dict[str, List[str]]] = None) -> UnusedSymbols:
+    """Return the events, measures and constants that no rule refers to
+
+    Events count as used when they appear in a condition or as any action,
+    including negated ones, or when they change a used measure (see
+    change_events, measure -> events); measures when they appear in a
+    condition or unless condition; constants when they appear in a condition
+    or a within constraint.
+    """
+    events: Set[str] = set()
+    measures: Set[str] = set()
+    constants: Set[str] = set()
+
+    for rule in rules:
+        actions = [rule.action, rule.otherwise_action]
+        actions.extend(clause.action for clause in rule.unless_clauses or ())
+        for action in actions:
+            words = action.split() if action else []
+            if words and words[0] == "not":
+                words = words[1:]
+            if words:
+                events.add(words[0].lower())
+
+        conditions = [index.condition_of(rule)]
+        conditions.extend(index.condition_of(clause) for clause in rule.unless_clauses or ())
+        for node in (node for condition in conditions for node in walk(condition)):
+            if isinstance(node, EventRef):
+                events.add(node.name.lower())
+            elif isinstance(node, MeasureRef):
+                measures.add(node.name.lower())
+            elif isinstance(node, ConstantRef):
+                constants.add(node.name.lower())
+        if rule.within_constraint:
+            constants.add(rule.within_constraint.split()[0].lower())
+
+    for measure, events_of_measure in (change_events or {}).items():
+        if measure in measures:
+            events.update(events_of_measure)
+
+    return UnusedSymbols(
+        events=[name for name in index.events if name not in events],
+        measures=[name for name in index.measures if name not in measures],
+        constants=[name for name in index.constants if name not in constants]
+    )
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+SLEEC Scenario Engine
+=====================
+
+This module answers "what does the policy require under this scenario?" for
+many scenarios against one rule set without reconverting or regrounding. The
+program is converted with external_inputs, so triggering events and measures
+are #external atoms, and grounded once. Each scenario becomes a list of
+assumptions over those atoms, and a cautious solve returns the action
+occurrences that every answer set shares.
+
+Classes:
+    Scenario: Triggering events and measure values of one question
+    ScenarioResult: Whether the scenario is consistent and what it requires
+    ScenarioEngine: Grounds a rule set once and answers scenarios against it
+
+Usage:
+    engine = ScenarioEngine(sleec_content, ConverterConfig(max_time=2))
+    result = engine.query(Scenario(events={"Motion": [0]}, measures={"isNight": True}))
+    print(result.required)
+"""
+
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from converter.config import ConverterConfig
+from converter.parser import MeasureType
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+except ImportError:  # pragma: no cover - depends on the environment
+    clingo = None
+
+Assumption = Tuple[Any, bool]
+"""A clingo symbol and the truth value it is assumed to have"""
+
+
+@dataclass
+class Scenario:
+    """Triggering events and measure values of one question"""
+    events: Dict[str, Sequence[int]] = field(default_factory=dict)
+    """Triggering events mapped to the time points at which they happen; the
+    other triggering events do not happen"""
+    measures: Dict[str, Any] = field(default_factory=dict)
+    """Measures mapped to one value for every time point, or to a list with a
+    value per time point; measures that are not listed stay free"""
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome of one scenario"""
+    consistent: bool
+    """Whether the rules can all be satisfied under the scenario"""
+    required: List[str] = field(default_factory=list)
+    """Action occurrences, e.g. "happens(alarm,0,0)", in every answer set"""
+
+
+class ScenarioEngine:
+    """Grounds a SLEEC rule set once and answers scenarios by solving under assumptions
+
+    Args:
+        content: SLEEC source
+        config: Converter configuration; external_inputs is always enabled
+        arguments: Extra clingo command line options
+    """
+
+    def __init__(self, content: str, config: Optional[ConverterConfig] = None, arguments: Sequence[str] = ()):
+        if clingo is None:
+            raise RuntimeError("❌ The clingo Python module is not installed")
+        self.config = replace(config or ConverterConfig.create_default(), external_inputs=True)
+        self.converter = SleecToClingoConverter(self.config)
+        program = self.converter.convert_sleec_string(content)
+
+        self.scenarios_solved = 0
+        self.solve_seconds = 0.0
+        start = time.perf_counter()
+        self._control = clingo.Control(["--enum-mode=cautious", "--models=0"] + list(arguments),
+                                       logger=lambda code, message: None)
+        self._control.add("base", [], program)
+        self._control.ground([("base", [])])
+        # Externals are false until assigned; free ones behave like the choices they replace
+        for atom in self._control.symbolic_atoms:
+            if atom.is_external:
+                self._control.assign_external(atom.symbol, None)
+        self.ground_seconds = time.perf_counter() - start
+
+        index = self.converter._get_symbol_index()
+        self._triggering_events = list(index.triggering_events)
+        self._action_events = {event for event in index.events if event not in self._triggering_events}
+        self._measures = index.measures
+        self._value_classes = self.converter._get_value_classes() if self.config.numeric_abstraction else {}
+        self._time_points = range(self.converter._max_time() + 1)
+
+    @classmethod
+    def from_file(cls, filename: str, config: Optional[ConverterConfig] = None,
+                  arguments: Sequence[str] = ()) -> "ScenarioEngine":
+        """Create an engine for a SLEEC file"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            return cls(f.read(), config, arguments)
+
+    @property
+    def throughput(self) -> float:
+        """Scenarios answered per second of solving so far"""
+        return self.scenarios_solved / self.solve_seconds if self.solve_seconds else 0.0
+
+    def query(self, scenario: Scenario) -> ScenarioResult:
+        """Answer one scenario
+
+        Raises:
+            ValueError: If the scenario names unknown symbols, values or time points
+        """
+        assumptions = self.assumptions(scenario)
+        start = time.perf_counter()
+        required: Optional[List[str]] = None
+        with self._control.solve(assumptions=assumptions, yield_=True) as handle:
+            for model in handle:
+                # In cautious mode each model narrows the consequences; the last one is final
+                required = [str(symbol) for symbol in model.symbols(shown=True)
+                            if symbol.name == "happens" and symbol.arguments[0].name in self._action_events]
+        self.solve_seconds += time.perf_counter() - start
+        self.scenarios_solved += 1
+        if required is None:
+            return ScenarioResult(consistent=False)
+        return ScenarioResult(consistent=True, required=sorted(required))
+
+    def query_all(self, scenarios: Iterable[Scenario]) -> List[ScenarioResult]:
+        """Answer scenarios one after the other against the same grounding"""
+        return [self.query(scenario) for scenario in scenarios]
+
+    def assumptions(self, scenario: Scenario) -> List[Assumption]:
+        """Translate a scenario into truth values of the program's input atoms"""
+        errors = []
+        pruned = self.converter.pruned
+        assumptions: List[Assumption] = []
+
+        events = {name.lower(): times for name, times in scenario.events.items()}
+        for name, times in events.items():
+            if name not in self._triggering_events and name not in pruned.events:
+                errors.append(f"'{name}' is not a triggering event")
+            errors.extend(f"Time point {time_point} of '{name}' is outside 0..{self._time_points[-1]}"
+                          for time_point in times if time_point not in self._time_points)
+        for event in self._triggering_events:
+            times = set(events.get(event, ()))
+            assumptions.extend((clingo.Function("happens", [clingo.Function(event), clingo.Number(t), clingo.Number(t)]),
+                                t in times) for t in self._time_points)
+
+        for name, values in scenario.measures.items():
+            name = name.lower()
+            if name in pruned.measures:
+                continue
+            measure = self._measures.get(name)
+            if measure is None:
+                errors.append(f"'{name}' is not a declared measure")
+                continue
+            if not isinstance(values, (list, tuple)):
+                values = [values] * len(self._time_points)
+            if len(values) != len(self._time_points):
+                errors.append(f"'{name}' needs one value per time point 0..{self._time_points[-1]}")
+                continue
+            for time_point, value in zip(self._time_points, values):
+                try:
+                    assumptions.extend(self._measure_assumptions(measure, value, time_point))
+                except ValueError as e:
+                    errors.append(str(e))
+
+        if errors:
+            raise ValueError("❌ Invalid scenario:\n" + "\n".join(dict.fromkeys(errors)))
+        return assumptions
+
+    def _measure_assumptions(self, measure, value, time_point: int) -> List[Assumption]:
+        """Fix the value of a measure at one time point"""
+        name = measure.name.lower()
+        moment = clingo.Number(time_point)
+        if measure.type == MeasureType.NUMERIC:
+            low, high = self.config.numeric_min, self.config.numeric_max
+            if not isinstance(value, int) or isinstance(value, bool) or not low <= value <= high:
+                raise ValueError(f"Value {value!r} of '{name}' is outside {low}..{high}")
+            for value_class in self._value_classes.get(name, ()):
+                if value_class.low <= value <= value_class.high:
+                    value = value_class.representative
+            return [(clingo.Function("holds_at", [clingo.Function(name), clingo.Number(v), moment]), v == value)
+                    for v in self._numeric_domain(name)]
+        if measure.type == MeasureType.SCALE and measure.scale_values:
+            scale = [scale_value.lower() for scale_value in measure.scale_values]
+            if str(value).lower() not in scale:
+                raise ValueError(f"Value {value!r} of '{name}' is not one of {', '.join(scale)}")
+            return [(clingo.Function("holds_at", [clingo.Function(name), clingo.Function(v), moment]),
+                     v == str(value).lower()) for v in scale]
+        return [(clingo.Function("holds_at", [clingo.Function(name), moment]), bool(value))]
+
+    def _numeric_domain(self, name: str) -> List[int]:
+        """Values a numeric measure's atoms are grounded for"""
+        if name in self._value_classes:
+            return [value_class.representative for value_class in self._value_classes[name]]
+        return list(range(self.config.numeric_min, self.config.numeric_max + 1))
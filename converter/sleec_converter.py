@@ -16,14 +16,31 @@ Usage:
 
 import re
 import textwrap
-from typing import List, Dict, Tuple, Optional, Set
+import warnings
+from itertools import count
+from typing import AbstractSet, List, Dict, Tuple, Optional, Set, Iterator, TextIO, Union
 
-from converter.parser import SleecParser, MeasureType, Measure, Event, Constant, Rule
+from converter.parser import SleecParser, MeasureType, Measure, Event, Constant, Rule, UnlessClause
+from converter.conditions import (
+    Condition, EventRef, MeasureRef, NameRef, ConstantRef,
+    Comparison, And, Or, Not, walk
+)
+from converter.abstraction import ValueClass, numeric_value_classes
+from converter.analysis import SymbolIndex
 from converter.config import ConverterConfig, DEFAULT_CONFIG
+from converter.horizon import Horizon, HorizonWarning, analyse_horizon
+from converter.incremental import incremental_program
+from converter.locality import Locality, TimeLocalityWarning, analyse_locality
+from converter.pruning import UnusedSymbols, find_unused_symbols
+from converter.timescale import TimeScale
 
 class SleecToClingoConverter:
     """Converts SLEEC rules to Clingo format using an antecedent/consequent approach"""
     
+    # SLEEC comparison operators that are spelled differently in Clingo
+    _COMPARISON_OPERATORS = {"==": "=", "<>": "!="}
+    _FLIPPED_OPERATORS = {"<": ">", ">": "<", "<=": ">=", ">=": "<="}
+    
     def __init__(self, config: Optional[ConverterConfig] = None):
         """Initialize converter with configuration
         
@@ -35,23 +52,248 @@ class SleecToClingoConverter:
         
         config.validate()
         self.config = config
+        self._symbol_index: Optional[SymbolIndex] = None
         self.events: List[Event] = []
         self.measures: List[Measure] = []
         self.constants: List[Constant] = []
         self.rules: List[Rule] = []
         self.parser = SleecParser()
+        self._condition_atoms: Dict[Condition, str] = {}
+        self._condition_rules: List[str] = []
+        self._horizon: Optional[Tuple[SymbolIndex, Horizon]] = None
+        self._time_scale: Optional[Tuple[SymbolIndex, TimeScale]] = None
+        self._value_classes: Optional[Tuple[SymbolIndex, Dict[str, List[ValueClass]]]] = None
+        self._locality: Optional[Tuple[SymbolIndex, Locality]] = None
+        self.pruned = UnusedSymbols()
+        """Definitions the last conversion left out because no rule refers to them"""
+        
+    # Replacing a definition list drops the symbol index, which the next
+    # generator rebuilds from the new lists
+    @property
+    def events(self) -> List[Event]:
+        return self._events
+
+    @events.setter
+    def events(self, events: List[Event]):
+        self._events = events
+        self._symbol_index = None
+
+    @property
+    def measures(self) -> List[Measure]:
+        return self._measures
+
+    @measures.setter
+    def measures(self, measures: List[Measure]):
+        self._measures = measures
+        self._symbol_index = None
+
+    @property
+    def constants(self) -> List[Constant]:
+        return self._constants
+
+    @constants.setter
+    def constants(self, constants: List[Constant]):
+        self._constants = constants
+        self._symbol_index = None
+
+    @property
+    def rules(self) -> List[Rule]:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: List[Rule]):
+        self._rules = rules
+        self._symbol_index = None
         
     def convert_file(self, filename: str) -> str:
         """Convert a SLEEC file to Clingo format"""
         self.events, self.measures, self.constants, self.rules = self.parser.parse_file(filename)
         SleecParser.validate_definitions(self.events, self.measures, self.rules)
+        self._index_definitions()
         return self._generate_clingo()
     
     def convert_sleec_string(self, content: str) -> str:
         """Convert SLEEC content string to Clingo format"""
         self.events, self.measures, self.constants, self.rules = self.parser.parse_sleec_string(content)
         SleecParser.validate_definitions(self.events, self.measures, self.rules)
+        self._index_definitions()
         return self._generate_clingo()
+
+    def iter_convert_file(self, filename: str) -> Iterator[str]:
+        """Convert a SLEEC file, yielding the Clingo program in chunks
+
+        The file is parsed and validated before the first chunk is yielded.
+        Rule-dependent sections are produced one rule at a time, so the
+        output never has to be held in memory as a whole.
+        """
+        self.events, self.measures, self.constants, self.rules = self.parser.parse_file(filename)
+        SleecParser.validate_definitions(self.events, self.measures, self.rules)
+        self._index_definitions()
+        yield from self._stream_clingo()
+
+    def iter_convert_sleec_string(self, content: str) -> Iterator[str]:
+        """Convert SLEEC content string, yielding the Clingo program in chunks"""
+        self.events, self.measures, self.constants, self.rules = self.parser.parse_sleec_string(content)
+        SleecParser.validate_definitions(self.events, self.measures, self.rules)
+        self._index_definitions()
+        yield from self._stream_clingo()
+
+    def convert_to_stream(self, source: str, writer: TextIO) -> int:
+        """Convert a SLEEC file and write the Clingo program to a file object
+
+        Chunks are written as soon as they are generated. Nothing is written
+        if the source fails to parse or validate.
+
+        Args:
+            source: Path of the SLEEC file to convert
+            writer: Text file object receiving the program
+
+        Returns:
+            Number of characters written
+        """
+        written = 0
+        for chunk in self.iter_convert_file(source):
+            writer.write(chunk)
+            written += len(chunk)
+        return written
+
+    def _index_definitions(self) -> SymbolIndex:
+        """Index the parsed definitions, leaving out those no rule refers to"""
+        index = self._build_symbol_index()
+        self._check_inertial_measures(index)
+        self._check_project_symbols(index)
+        self.pruned = UnusedSymbols()
+        if self.config.keep_unused_definitions:
+            return index
+        
+        self.pruned = find_unused_symbols(self.rules, index, self._inertial_measures())
+        if not self.pruned:
+            return index
+        events, measures, constants = set(self.pruned.events), set(self.pruned.measures), set(self.pruned.constants)
+        self.events = [event for event in self.events if event.name.lower() not in events]
+        self.measures = [measure for measure in self.measures if measure.name.lower() not in measures]
+        self.constants = [constant for constant in self.constants if constant.name.lower() not in constants]
+        return self._build_symbol_index()
+    
+    def _inertial_measures(self) -> Dict[str, List[str]]:
+        """Return the configured inertial measures and their change events, in lower case"""
+        return {name.lower(): [event.lower() for event in events]
+                for name, events in self.config.inertial_measures.items()}
+    
+    def _check_inertial_measures(self, index: SymbolIndex) -> None:
+        """Reject inertial measures and change events that are not declared"""
+        errors = []
+        for measure, events in self._inertial_measures().items():
+            if measure not in index.measures:
+                errors.append(f"Inertial measure '{measure}' is not declared")
+            errors.extend(f"Change event '{event}' of inertial measure '{measure}' is not declared"
+                          for event in events if event not in index.events)
+        if errors:
+            raise ValueError("❌ Invalid inertial_measures:\n" + "\n".join(errors))
+    
+    def _check_project_symbols(self, index: SymbolIndex) -> None:
+        """Reject projection symbols that are neither declared events nor measures"""
+        unknown = [name for name in self.config.project_symbols
+                   if name.lower() not in index.events and name.lower() not in index.measures]
+        if unknown:
+            raise ValueError(f"❌ Invalid project_symbols: {', '.join(unknown)} "
+                             f"{'is' if len(unknown) == 1 else 'are'} not a declared event or measure")
+    
+    def _build_symbol_index(self) -> SymbolIndex:
+        """Analyse the current definitions and rules once for all generators"""
+        self._symbol_index = SymbolIndex.build(self.events, self.measures, self.constants, self.rules)
+        return self._symbol_index
+    
+    def _get_symbol_index(self) -> SymbolIndex:
+        """Return the symbol index, building it if the definitions were replaced since"""
+        if self._symbol_index is None:
+            return self._build_symbol_index()
+        return self._symbol_index
+    
+    def _get_horizon(self) -> Horizon:
+        """Return the time horizon analysis of the current rules"""
+        index = self._get_symbol_index()
+        if self._horizon is None or self._horizon[0] is not index:
+            self._horizon = (index, analyse_horizon(self.rules, index, self._get_time_scale()))
+        return self._horizon[1]
+    
+    def _get_locality(self) -> Locality:
+        """Return the independent parts of the current rules and which of them are time-local"""
+        index = self._get_symbol_index()
+        if self._locality is None or self._locality[0] is not index:
+            self._locality = (index, analyse_locality(self.rules, index))
+        return self._locality[1]
+    
+    def _get_time_scale(self) -> TimeScale:
+        """Return the time step of the current rules and how deadlines map onto it"""
+        index = self._get_symbol_index()
+        if self._time_scale is None or self._time_scale[0] is not index:
+            self._time_scale = (index, TimeScale.build(self.rules, index, self.config.time_units))
+        return self._time_scale[1]
+    
+    def _get_value_classes(self) -> Dict[str, List[ValueClass]]:
+        """Return the value classes of the numeric measures that can be abstracted"""
+        index = self._get_symbol_index()
+        if self._value_classes is None or self._value_classes[0] is not index:
+            self._value_classes = (index, numeric_value_classes(self.rules, index, self.config.numeric_min,
+                                                                self.config.numeric_max))
+        return self._value_classes[1]
+    
+    def _within_value(self, within_constraint: str) -> str:
+        """Return the deadline of a within constraint as a Clingo term
+        
+        This is the deadline in time steps whenever it can be evaluated, with
+        numeric constants resolved to their value (e.g. "3 minutes" -> 3, or
+        "notifyDelay minutes" -> 2 for constant notifyDelay = 2). Without time
+        units one step is one unit, whatever the unit. Values that cannot be
+        evaluated are kept as written.
+        """
+        steps = self._get_time_scale().steps(within_constraint, self._get_symbol_index())
+        if steps is not None:
+            return str(steps)
+        return within_constraint.split()[0]
+    
+    def _single_step(self) -> bool:
+        """Whether the program covers one generic time step instead of the horizon"""
+        return (self.config.single_step and not self.config.incremental and self._get_locality().time_local
+                and not self._used_inertial_measures())
+    
+    def _used_inertial_measures(self) -> Dict[str, List[str]]:
+        """Return the inertial measures that are part of the generated program"""
+        index = self._get_symbol_index()
+        return {measure: events for measure, events in self._inertial_measures().items() if measure in index.measures}
+    
+    def _max_time(self) -> int:
+        """Return the last time point of the generated time domain"""
+        if self._single_step():
+            return 0
+        if self.config.auto_horizon and not self._get_horizon().cycle:
+            return self._get_horizon().horizon
+        return self.config.max_time
+    
+    def _check_horizon(self) -> None:
+        """Warn when the time domain cannot fit every rule's deadline chain"""
+        horizon = self._get_horizon()
+        if horizon.unresolved:
+            warnings.warn(f"Within constraints of {', '.join(horizon.unresolved)} are not numbers or numeric "
+                          f"constants; the time horizon analysis ignores them", HorizonWarning)
+        if self.config.single_step and not self._get_locality().time_local:
+            locality = self._get_locality()
+            warnings.warn(f"Single-step solving needs rules without within constraints, but "
+                          f"{', '.join(locality.timed_rules)} have them; using the full time horizon "
+                          f"({locality.describe()})", TimeLocalityWarning)
+        if self.config.single_step and self._get_locality().time_local and self._used_inertial_measures():
+            warnings.warn(f"Single-step solving is not possible with inertial measures "
+                          f"({', '.join(self._used_inertial_measures())}), which link consecutive time points; "
+                          f"using the full time horizon", TimeLocalityWarning)
+        if self.config.auto_horizon and horizon.cycle:
+            warnings.warn(f"Rules {horizon.describe_cycle()} trigger each other in a cycle of within deadlines, "
+                          f"so no time horizon fits every chain; auto_horizon keeps max_time={self.config.max_time}",
+                          HorizonWarning)
+        if not self.config.auto_horizon and not self.config.incremental and horizon.horizon > self.config.max_time:
+            warnings.warn(f"max_time={self.config.max_time} truncates within deadlines: a chain of "
+                          f"{len(horizon.chain)} rules ({horizon.describe()}) needs a time horizon of "
+                          f"{horizon.horizon}", HorizonWarning)
     
 
     
@@ -59,29 +301,67 @@ class SleecToClingoConverter:
     
     def _generate_clingo(self) -> str:
         """Generate the complete Clingo program"""
+        return "".join(self._stream_clingo())
+
+    def _stream_clingo(self) -> Iterator[str]:
+        """Generate the complete Clingo program as a sequence of text chunks
+
+        Sections that grow with the number of rules are produced one rule at a
+        time; empty sections are skipped together with their separator.
+        """
+        self._check_horizon()
+        
         sections = [
-            self._generate_header(),
-            self._generate_domain_definitions(),
-            self._generate_sleec_rule_definitions(),
-            self._generate_rule_satisfaction_logic(),
-            self._generate_action_generation_and_constraints(),
-            self._generate_output_specification()
+            self._stream_header,
+            lambda: [self._generate_domain_definitions()],
+            self._stream_sleec_rule_definitions,
+            self._stream_rule_satisfaction_logic,
+            lambda: [self._generate_action_generation_and_constraints()],
+            lambda: [self._generate_output_specification()]
         ]
+
+        if self.config.incremental:
+            yield from self._stream_header()
+            body = "\n".join(chunk for section in sections[1:] for chunk in section())
+            yield self.config.section_separator + self._generate_incremental_program(body)
+            return
+
+        emitted = False
+        for section in sections:
+            section_started = False
+            for chunk in section():
+                if not chunk:
+                    continue
+                if emitted and not section_started:
+                    yield self.config.section_separator
+                section_started = emitted = True
+                yield chunk
+
+        yield ' '
+
+    def _generate_incremental_program(self, program: str) -> str:
+        """Rewrite the generated program into base/step(t)/check(t) parts
         
-        return '\n\n'.join(filter(None, sections)) + ' '
+        Rules with a within constraint are checked once their deadline has
+        passed, so their consequents are delayed by the deadline in steps.
+        """
+        index = self._get_symbol_index()
+        delays = {}
+        for rule in self.rules:
+            if rule.within_constraint:
+                rule_id = f"{rule.id.lower()}_primary" if rule.unless_clauses else rule.id.lower()
+                delay = self._get_time_scale().steps(rule.within_constraint, index) or 0
+                # Rules sharing a duplicate id are checked after the longer deadline
+                delays[rule_id] = max(delays.get(rule_id, 0), delay)
+        return incremental_program(program, delays)
     
     def _generate_header(self) -> str:
         """Generate the file header"""
-        rule_desc = ""
-        for rule in self.rules:
-            if rule.within_constraint:
-                rule_desc += f"% {rule.id}: {rule.condition} -> {rule.action} within {rule.within_constraint}\n"
-            else:
-                rule_desc += f"% {rule.id}: {rule.condition} -> {rule.action}\n"
-            if rule.otherwise_action:
-                rule_desc += f"%   otherwise -> {rule.otherwise_action}\n"
-        
-        return f"""% =============================================================================
+        return "".join(self._stream_header())
+
+    def _stream_header(self) -> Iterator[str]:
+        """Generate the file header, one line group per rule"""
+        yield """% =============================================================================
 % SLEEC to Clingo Conversion (Dalal's Format with Within Support)
 % =============================================================================
 % 
@@ -89,14 +369,43 @@ class SleecToClingoConverter:
 % Format: Antecedent/consequent structure with temporal constraints
 % 
 % Rules Converted:
-{rule_desc.rstrip()}"""
+"""
+        for i, rule in enumerate(self.rules):
+            if rule.within_constraint:
+                rule_desc = f"% {rule.id}: {rule.condition} -> {rule.action} within {rule.within_constraint}"
+            else:
+                rule_desc = f"% {rule.id}: {rule.condition} -> {rule.action}"
+            if rule.otherwise_action:
+                rule_desc += f"\n%   otherwise -> {rule.otherwise_action}"
+            yield rule_desc if i == 0 else "\n" + rule_desc
+        
+        time_model = []
+        if self.config.time_units:
+            time_model.append(f"% Time step: {self._get_time_scale().describe()} "
+                              f"(greatest common divisor of the within deadlines)")
+        if self.config.incremental:
+            time_model.append("% Incremental encoding: #program base, step(t) and check(t) parts for "
+                              "multi-shot solving; the horizon grows one time point at a time")
+        if self._single_step():
+            time_model.append("% Single time step: no rule has a within constraint, so every time point "
+                              "has these answer sets independently")
+        elif self.config.auto_horizon and self._get_horizon().cycle:
+            time_model.append(f"% Time horizon: 0..{self.config.max_time} (max_time; rules "
+                              f"{self._get_horizon().describe_cycle()} form a cycle of within deadlines)")
+        elif self.config.auto_horizon:
+            horizon = self._get_horizon()
+            time_model.append(f"% Time horizon: 0..{horizon.horizon} (longest deadline chain: {horizon.describe()})")
+        if time_model:
+            yield "\n% \n" + "\n".join(time_model)
+        if self.pruned:
+            yield f"\n% \n% Unused definitions left out: {self.pruned.describe()}"
     
     def _generate_domain_definitions(self) -> str:
         """Generate domain definitions (events, measures, time)"""
         sections = []
         
         # Time domain
-        sections.append(self.config.time_domain)
+        sections.append(f"time(0..{self._max_time()}).")
         
         # Events - always use event() predicates
         event_lines = [f"event({event.name.lower()})." for event in self.events]
@@ -115,26 +424,47 @@ class SleecToClingoConverter:
     
     def _generate_sleec_rule_definitions(self) -> str:
         """Generate SLEEC rule definitions with antecedent/consequent structure"""
+        return "".join(self._stream_sleec_rule_definitions())
+
+    def _stream_sleec_rule_definitions(self) -> Iterator[str]:
+        """Generate SLEEC rule definitions one rule at a time
+
+        Helper predicates for disjunctions and negated sub-conditions follow
+        the rule that first needs them.
+        """
         if not self.rules:
-            return ""
-        
-        rule_definitions = []
-        
-        for rule in self.rules:
-            rule_id = rule.id.lower()
-            
-            if rule.unless_clauses:
-                # Handle unless clauses with cascading priority
-                self._generate_unless_rules(rule, rule_definitions)
-            else:
-                # Handle regular rules (with possible otherwise clause)
-                self._generate_regular_rule(rule, rule_definitions)
-        
-        return textwrap.dedent("""
+            return
+
+        self._condition_atoms = {}
+        self._condition_rules = []
+
+        yield textwrap.dedent("""
         % =============================================================================
         % SLEEC RULE DEFINITIONS
         % =============================================================================
-        """).strip() + "\n\n" + "\n\n".join(rule_definitions)
+        """).strip()
+
+        for rule in self.rules:
+            block = self._rule_definitions_block(rule)
+            if block:
+                yield "\n\n" + block
+
+    def _rule_definitions_block(self, rule: Rule) -> str:
+        """Generate the definitions of one rule and any condition helpers it introduces"""
+        rule_definitions = []
+
+        if rule.unless_clauses:
+            # Handle unless clauses with cascading priority
+            self._generate_unless_rules(rule, rule_definitions)
+        else:
+            # Handle regular rules (with possible otherwise clause)
+            self._generate_regular_rule(rule, rule_definitions)
+
+        if self._condition_rules:
+            rule_definitions.append("% Condition helpers\n" + "\n".join(self._condition_rules))
+            self._condition_rules = []
+
+        return "\n\n".join(rule_definitions)
     
     def _generate_unless_rules(self, rule, rule_definitions):
         """Generate multiple rules for unless statements with cascading priority"""
@@ -149,9 +479,9 @@ class SleecToClingoConverter:
         # Generate unless clause rules (each with cascading priority)
         self._generate_unless_clause_rules(rule, rule_id, unless_conditions, rule_definitions)
     
-    def _extract_unless_conditions(self, unless_clauses):
-        """Extract conditions from unless clauses for easier processing"""
-        return [unless_clause.condition for unless_clause in unless_clauses]
+    def _extract_unless_conditions(self, unless_clauses) -> List[Condition]:
+        """Extract parsed conditions from unless clauses for easier processing"""
+        return [self._condition_of(unless_clause) for unless_clause in unless_clauses]
     
     def _generate_primary_unless_rule(self, rule, rule_id, unless_conditions, rule_definitions):
         """Generate the primary rule with negated unless conditions"""
@@ -159,25 +489,23 @@ class SleecToClingoConverter:
         rule_definitions.append(f"exp({primary_id}).")
         
         # Build primary antecedent: base condition AND NOT unless1 AND NOT unless2 ...
-        primary_antecedent = self._build_primary_unless_antecedent(rule.condition, unless_conditions)
+        primary_antecedent = self._build_primary_unless_antecedent(self._condition_of(rule), unless_conditions)
         rule_definitions.append(f"antecedent({primary_id}, T) :- {primary_antecedent}.")
         
         # Generate primary consequent (skip if negated action)
-        if not rule.action.strip().startswith("not "):
-            consequent_action = self._build_consequent_action(rule.action, rule.within_constraint)
+        consequent_action = self._build_consequent_action(rule.action, rule.within_constraint)
+        if consequent_action:
             rule_definitions.append(f"consequent({primary_id}, T) :- time(T), {consequent_action}.")
     
     def _build_primary_unless_antecedent(self, base_condition, unless_conditions):
         """Build antecedent for primary rule by negating all unless conditions"""
-        primary_antecedent = self._convert_condition_to_antecedent(base_condition)
+        variables = count(1)
+        literals = self._condition_literals(base_condition, variables)
         
         for unless_condition in unless_conditions:
-            unless_antecedent = self._convert_condition_to_antecedent(unless_condition)
-            # Remove "time(T)" to avoid duplication
-            unless_antecedent_clean = unless_antecedent.replace(", time(T)", "")
-            primary_antecedent = primary_antecedent.replace(", time(T)", f", not {unless_antecedent_clean}, time(T)")
+            literals.extend(self._negated_condition_literals(unless_condition, variables))
         
-        return primary_antecedent
+        return self._antecedent_body(literals, base_condition, *unless_conditions)
     
     def _generate_unless_clause_rules(self, rule, rule_id, unless_conditions, rule_definitions):
         """Generate rules for each unless clause with cascading priority"""
@@ -191,7 +519,7 @@ class SleecToClingoConverter:
             
             # Build unless antecedent with cascading priority
             unless_antecedent = self._build_unless_clause_antecedent(
-                rule.condition, unless_clause, rule.unless_clauses, i
+                rule.condition_expr or rule.condition, unless_clause, rule.unless_clauses, i
             )
             rule_definitions.append(f"antecedent({unless_id}, T) :- {unless_antecedent}.")
             
@@ -201,28 +529,34 @@ class SleecToClingoConverter:
     
     def _build_unless_clause_antecedent(self, base_condition, unless_clause, all_unless_clauses, clause_index):
         """Build antecedent for unless clause with cascading priority logic"""
-        unless_antecedent = self._convert_condition_to_antecedent(base_condition)
+        base_condition = self._as_condition(base_condition)
+        this_condition = self._condition_of(unless_clause)
+        higher_conditions = [self._condition_of(clause) for clause in all_unless_clauses[clause_index:]]
+        
+        variables = count(1)
+        literals = self._condition_literals(base_condition, variables)
         
         # Add this unless condition
-        this_unless_condition = self._convert_condition_to_antecedent(unless_clause.condition)
-        this_unless_clean = this_unless_condition.replace(", time(T)", "")
-        unless_antecedent = unless_antecedent.replace(", time(T)", f", {this_unless_clean}, time(T)")
+        literals.extend(self._condition_literals(this_condition, variables))
         
         # Add negation of higher priority unless conditions (later in the list)
-        for j in range(clause_index, len(all_unless_clauses)):
-            higher_unless_condition = self._convert_condition_to_antecedent(all_unless_clauses[j].condition)
-            higher_unless_clean = higher_unless_condition.replace(", time(T)", "")
-            unless_antecedent = unless_antecedent.replace(", time(T)", f", not {higher_unless_clean}, time(T)")
+        for higher_condition in higher_conditions:
+            literals.extend(self._negated_condition_literals(higher_condition, variables))
         
-        return unless_antecedent
+        return self._antecedent_body(literals, base_condition, this_condition, *higher_conditions)
     
-    def _build_consequent_action(self, action, within_constraint):
-        """Build consequent action with optional within constraint"""
+    def _build_consequent_action(self, action, within_constraint) -> Optional[str]:
+        """Build consequent action with optional within constraint
+        
+        Negated actions ("not X") have no consequent, as in unless clauses,
+        so None is returned for them.
+        """
+        if action.strip().startswith("not "):
+            return None
         if within_constraint:
-            # Parse constraint to get value (e.g., "3 minutes" -> 3 or "notifyDelay minutes" -> notifyDelay)
-            constraint_parts = within_constraint.split()
-            constraint_value = constraint_parts[0]
-            # Use constraint value directly - it can be a constant name or number
+            constraint_value = self._within_value(within_constraint)
+            if self._has_deadline_predicate(action.lower(), within_constraint):
+                return f"satisfied_by_deadline({action.lower()}, T)"
             return f"happens({action.lower()}, T, T2), T <= T2, T2 <= T+{constraint_value}, time(T2)"
         else:
             return f"happens({action.lower()}, T, T)"
@@ -230,33 +564,22 @@ class SleecToClingoConverter:
     def _generate_regular_rule(self, rule, rule_definitions):
         """Generate regular rule (possibly with otherwise clause)"""
         rule_id = rule.id.lower()
+        condition = self._condition_of(rule)
         
         # Rule identifier
         rule_definitions.append(f"exp({rule_id}).")
         
-        # Antecedent logic
-        antecedent_condition = self._convert_condition_to_antecedent(rule.condition)
-        
         # Determine if this rule involves temporal events
-        within_events = self._get_within_events()
-        uses_temporal_events = any(event.name.lower() in within_events for event in self.events 
-                                   if event.name.lower() in rule.condition.lower())
+        head_variable = "T2" if self._uses_within_events(condition) else "T"
         
-        if uses_temporal_events:
-            rule_definitions.append(f"antecedent({rule_id}, T2) :- {antecedent_condition}.")
-        else:
-            rule_definitions.append(f"antecedent({rule_id}, T) :- {antecedent_condition}.")
-        
-        # Consequent logic
-        if rule.within_constraint:
-            # Parse constraint to get value (e.g., "3 minutes" -> 3 or "notifyDelay minutes" -> notifyDelay)
-            constraint_parts = rule.within_constraint.split()
-            constraint_value = constraint_parts[0]
-            # Use constraint value directly - it can be a constant name or number
-            consequent_action = f"happens({rule.action.lower()}, T, T2), T <= T2, T2 <= T+{constraint_value}, time(T2)"
-        else:
-            consequent_action = f"happens({rule.action.lower()}, T, T)"
-        rule_definitions.append(f"consequent({rule_id}, T) :- time(T), {consequent_action}.")
+        # Antecedent logic
+        antecedent_condition = self._convert_condition_to_antecedent(condition, head_variable)
+        rule_definitions.append(f"antecedent({rule_id}, {head_variable}) :- {antecedent_condition}.")
+        
+        # Consequent logic (skip if negated action)
+        consequent_action = self._build_consequent_action(rule.action, rule.within_constraint)
+        if consequent_action:
+            rule_definitions.append(f"consequent({rule_id}, T) :- time(T), {consequent_action}.")
         
         # Otherwise clause if present
         if rule.otherwise_action:
@@ -264,129 +587,222 @@ class SleecToClingoConverter:
             rule_definitions.append(f"exp({otherwise_id}).")
             
             # Negated antecedent
-            negated_antecedent = self._negate_antecedent(rule.condition)
+            negated_antecedent = self._negate_antecedent(condition)
             rule_definitions.append(f"antecedent({otherwise_id}, T) :- {negated_antecedent}.")
             
-            # Otherwise consequent
-            otherwise_consequent = f"happens({rule.otherwise_action.lower()}, T, T)"
-            rule_definitions.append(f"consequent({otherwise_id}, T) :- time(T), {otherwise_consequent}.")
+            # Otherwise consequent (skip if negated action)
+            otherwise_consequent = self._build_consequent_action(rule.otherwise_action, None)
+            if otherwise_consequent:
+                rule_definitions.append(f"consequent({otherwise_id}, T) :- time(T), {otherwise_consequent}.")
     
-    def _convert_condition_to_antecedent(self, condition: str) -> str:
-        """Convert a SLEEC condition to antecedent format"""
-        # Apply transformations in logical order
-        condition = self._normalize_condition_case(condition)
-        condition = self._replace_measure_references(condition)
-        condition = self._replace_logical_operators(condition)
-        condition = self._clean_parentheses(condition)
-        condition = self._replace_event_references(condition)
-        condition = self._add_time_constraints(condition)
-        
-        return condition
+    def _convert_condition_to_antecedent(self, condition: Union[str, Condition], head_variable: str = "T") -> str:
+        """Convert a SLEEC condition (text or parsed) to antecedent format"""
+        condition = self._as_condition(condition)
+        literals = self._condition_literals(condition, count(1))
+        return self._antecedent_body(literals, condition, head_variable=head_variable)
     
-    def _normalize_condition_case(self, condition: str) -> str:
-        """Convert condition to lowercase for consistent processing"""
-        return condition.lower()
+    def _negate_antecedent(self, condition: Union[str, Condition]) -> str:
+        """Negate an antecedent condition for otherwise clauses"""
+        condition = self._as_condition(condition)
+        literals = self._negated_condition_literals(condition, count(1))
+        return self._antecedent_body(literals, condition)
     
-    def _replace_measure_references(self, condition: str) -> str:
-        """Replace measure references with Clingo holds_at predicates"""
-        # Replace measure references {measureName} with holds_at(measureName, T)
-        condition = re.sub(r'\{(\w+)\}', r'holds_at(\1, T)', condition)
-        
-        # Replace measure comparisons {measureName} = value with holds_at(measureName, value, T)
-        condition = re.sub(r'holds_at\((\w+), T\)\s*=\s*(\w+)', r'holds_at(\1, \2, T)', condition)
-        
-        return condition
+    def _as_condition(self, condition: Union[str, Condition]) -> Condition:
+        """Parse condition text against the current definitions if needed"""
+        if not isinstance(condition, str):
+            return condition
+        return self._get_symbol_index().condition_parser.parse_string(condition)
     
-    def _replace_logical_operators(self, condition: str) -> str:
-        """Replace SLEEC logical operators with Clingo equivalents"""
-        # Replace logical operators
-        condition = condition.replace(' and ', ', ')
-        condition = condition.replace(' or ', '; ')
-        condition = condition.replace(' not ', 'not ')
-        
-        return condition
+    def _condition_of(self, item: Union[Rule, UnlessClause]) -> Condition:
+        """Return the parsed condition of a rule or unless clause"""
+        return self._get_symbol_index().condition_of(item)
     
-    def _clean_parentheses(self, condition: str) -> str:
-        """Clean up unnecessary parentheses for Clingo syntax"""
-        # Remove parentheses around 'not' expressions - fix for Clingo syntax
-        condition = re.sub(r'\(\s*not\s+([^)]+)\)', r'not \1', condition)
+    def _antecedent_body(self, literals: List[str], *conditions: Condition, head_variable: str = "T") -> str:
+        """Join body literals and append the time constraints they need
         
-        # Remove unnecessary parentheses around comma-separated expressions
-        condition = self._remove_logical_grouping_parentheses(condition)
+        With head_variable "T2" the rule head only depends on completion times.
+        If the request time T then appears in a single within event occurrence,
+        that occurrence is projected onto occurred_at/2 when deadline
+        predicates are enabled.
+        """
+        if self._uses_within_events(*conditions):
+            if head_variable == "T2" and self.config.within_deadline_predicates:
+                literals = self._project_occurrences(literals)
+                if literals is not None:
+                    return ", ".join(literals + ["time(T2)"])
+            return ", ".join(literals + ["time(T)", "time(T2)"])
+        return ", ".join(literals + ["time(T)"])
+    
+    _REQUEST_TIME = re.compile(r"\bT\b")
+    _OCCURRENCE = re.compile(r"happens\((\w+), T, T2\)")
+    
+    def _project_occurrences(self, literals: List[str]) -> Optional[List[str]]:
+        """Replace the only literal using the request time T by occurred_at/2
         
-        return condition
+        Returns None when T is used elsewhere too, or not by a positive
+        occurrence of a within event, as projecting T away would then change
+        the rule's meaning.
+        """
+        uses = [i for i, literal in enumerate(literals) if self._REQUEST_TIME.search(literal)]
+        if len(uses) != 1:
+            return None
+        occurrence = self._OCCURRENCE.fullmatch(literals[uses[0]])
+        if occurrence is None or occurrence.group(1) not in self._get_within_events():
+            return None
+        
+        projected = list(literals)
+        projected[uses[0]] = f"occurred_at({occurrence.group(1)}, T2)"
+        return projected
     
-    def _replace_event_references(self, condition: str) -> str:
-        """Replace event names with Clingo happens predicates"""
+    def _has_deadline_predicate(self, event: str, within_constraint: str) -> bool:
+        """Check whether satisfied_by_deadline/2 of an event encodes this constraint"""
+        return (self.config.within_deadline_predicates
+                and self._get_within_constraint(event) == within_constraint)
+    
+    def _uses_within_events(self, *conditions: Condition) -> bool:
+        """Check whether any condition refers to an event produced with a within constraint"""
         within_events = self._get_within_events()
-        
-        # Replace event references
-        for event in self.events:
-            event_name = event.name.lower()
-            if event_name in within_events:
+        return any(isinstance(node, EventRef) and node.name.lower() in within_events
+                   for condition in conditions for node in walk(condition))
+    
+    def _condition_literals(self, condition: Condition, variables: Iterator[int]) -> List[str]:
+        """Translate a condition into a conjunction of Clingo body literals"""
+        if isinstance(condition, And):
+            literals = []
+            for operand in condition.operands:
+                literals.extend(self._condition_literals(operand, variables))
+            return literals
+        
+        if isinstance(condition, EventRef):
+            event_name = condition.name.lower()
+            if event_name in self._get_within_events():
                 # Events with within constraints use temporal format
-                condition = re.sub(rf'\b{event_name}\b', f'happens({event_name}, T, T2)', condition)
-            else:
-                # Regular events use standard format
-                condition = re.sub(rf'\b{event_name}\b', f'happens({event_name}, T, T)', condition)
+                return [f"happens({event_name}, T, T2)"]
+            return [f"happens({event_name}, T, T)"]
         
-        return condition
-    
-    def _add_time_constraints(self, condition: str) -> str:
-        """Add appropriate time constraints based on events used"""
-        within_events = self._get_within_events()
+        if isinstance(condition, MeasureRef):
+            return [f"holds_at({condition.name.lower()}, T)"]
         
-        # Add time constraints
-        if any(event.name.lower() in within_events for event in self.events if event.name.lower() in condition):
-            condition += ", time(T), time(T2)"
-        else:
-            condition += ", time(T)"
+        if isinstance(condition, NameRef):
+            return [condition.name.lower()]
         
-        return condition
+        if isinstance(condition, Comparison):
+            return self._comparison_literals(condition, variables)
+        
+        if isinstance(condition, Not):
+            return self._negated_condition_literals(condition.operand, variables)
+        
+        # Disjunctions are not expressible inside a single rule body
+        return [self._condition_atom(condition)]
     
-    def _negate_antecedent(self, condition: str) -> str:
-        """Negate an antecedent condition for otherwise clauses"""
-        # Simple negation - wrap in not()
-        return f"not ({self._convert_condition_to_antecedent(condition)})"
+    def _negated_condition_literals(self, condition: Condition, variables: Iterator[int]) -> List[str]:
+        """Translate the negation of a condition into body literals"""
+        literals = self._condition_literals(condition, variables)
+        if len(literals) == 1:
+            literal = literals[0]
+            return [literal[4:]] if literal.startswith("not ") else [f"not {literal}"]
+        return [f"not {self._condition_atom(condition)}"]
+    
+    def _condition_atom(self, condition: Condition) -> str:
+        """Return a helper atom that holds exactly when the condition holds
+        
+        Identical sub-conditions share one helper predicate per conversion.
+        """
+        time_variable = "T2" if self._uses_within_events(condition) else "T"
+        name = self._condition_atoms.get(condition)
+        
+        if name is None:
+            name = f"c{len(self._condition_atoms) + 1}"
+            self._condition_atoms[condition] = name
+            disjuncts = condition.operands if isinstance(condition, Or) else (condition,)
+            for disjunct in disjuncts:
+                body = self._antecedent_body(self._condition_literals(disjunct, count(1)), condition,
+                                             head_variable=time_variable)
+                self._condition_rules.append(f"condition({name}, {time_variable}) :- {body}.")
+        
+        return f"condition({name}, {time_variable})"
+    
+    def _comparison_literals(self, comparison: Comparison, variables: Iterator[int]) -> List[str]:
+        """Translate a comparison between measures, constants and values"""
+        left, right = comparison.left, comparison.right
+        operator = self._COMPARISON_OPERATORS.get(comparison.operator, comparison.operator)
+        
+        # Keep the measure on the left-hand side
+        if isinstance(right, MeasureRef) and not isinstance(left, MeasureRef):
+            left, right = right, left
+            operator = self._FLIPPED_OPERATORS.get(operator, operator)
+        
+        if not isinstance(left, MeasureRef):
+            return [f"{self._operand_term(left)} {operator} {self._operand_term(right)}"]
+        
+        measure_name = left.name.lower()
+        
+        if isinstance(right, MeasureRef):
+            left_variable, right_variable = f"V{next(variables)}", f"V{next(variables)}"
+            return [f"holds_at({measure_name}, {left_variable}, T)",
+                    f"holds_at({right.name.lower()}, {right_variable}, T)",
+                    f"{left_variable} {operator} {right_variable}"]
+        
+        value = self._operand_term(right)
+        
+        # Scale values are ordered by declaration, not by their symbol
+        scale_values = self._get_symbol_index().scale_values(measure_name)
+        if value in scale_values and operator != "=":
+            target = scale_values.index(value)
+            return [f"not holds_at({measure_name}, {scale_value}, T)"
+                    for index, scale_value in enumerate(scale_values)
+                    if not self._compare(index, operator, target)]
+        
+        if operator == "=":
+            return [f"holds_at({measure_name}, {value}, T)"]
+        
+        variable = f"V{next(variables)}"
+        return [f"holds_at({measure_name}, {variable}, T)", f"{variable} {operator} {value}"]
+    
+    @staticmethod
+    def _compare(left: int, operator: str, right: int) -> bool:
+        """Evaluate a Clingo comparison operator on two integers"""
+        return {
+            "=": left == right, "!=": left != right,
+            "<": left < right, "<=": left <= right,
+            ">": left > right, ">=": left >= right,
+        }[operator]
+    
+    def _operand_term(self, operand) -> str:
+        """Render a comparison operand as a Clingo term"""
+        if isinstance(operand, ConstantRef):
+            # Constants are substituted so that comparisons stay numeric
+            constant = self._get_symbol_index().constants.get(operand.name.lower())
+            return constant.value if constant else operand.name.lower()
+        if isinstance(operand, MeasureRef):
+            return operand.name.lower()
+        return operand.text.lower()
     
     def _to_lower_camel_case(self, name: str) -> str:
         """Convert to lower camel case for consistency"""
         return name[0].lower() + name[1:] if name else name
     
-    def _remove_logical_grouping_parentheses(self, condition: str) -> str:
-        """Remove unnecessary logical grouping parentheses around comma-separated expressions"""
-        # Handle multiple patterns:
-        # 1. Remove outer parentheses around complete expressions like (a, b)
-        # 2. Remove inner parentheses around sub-expressions like a, (b, c), d
-        
-        # Pattern 1: Remove outer parentheses if entire expression is wrapped
-        if condition.startswith('(') and condition.endswith(')') and ';' not in condition:
-            # Check if removing outer parentheses leaves a valid comma-separated expression
-            inner = condition[1:-1]
-            if ',' in inner and not inner.startswith('('):
-                condition = inner
-        
-        # Pattern 2: Remove parentheses around specific sub-patterns
-        # (holds_at(...), holds_at(...)) -> holds_at(...), holds_at(...)
-        pattern = r'\((holds_at\([^)]+\),\s*holds_at\([^)]+\))\)'
-        condition = re.sub(pattern, r'\1', condition)
-        
-        # Pattern 3: Mixed patterns like a, (b, c), d
-        # Look for patterns like ", (expr, expr)," and remove the parentheses
-        pattern = r',\s*\(([^()]+,\s*[^()]+)\)\s*,'
-        condition = re.sub(pattern, r', \1,', condition)
-        
-        return condition
-    
     def _generate_rule_satisfaction_logic(self) -> str:
         """Generate rule satisfaction logic with holds_nv and holds_v"""
+        return "".join(self._stream_rule_satisfaction_logic())
+
+    def _stream_rule_satisfaction_logic(self) -> Iterator[str]:
+        """Generate rule satisfaction logic one rule at a time"""
         if not self.rules:
-            return ""
-        
-        satisfaction_logic = []
-        
+            return
+
+        yield textwrap.dedent("""
+        % =============================================================================
+        % RULE SATISFACTION LOGIC
+        % =============================================================================
+        """).strip()
+
+        if self.config.satisfaction_encoding == "compact":
+            yield "\n\n" + self._generate_satisfaction_schemas()
+            return
+
         # General holds logic
-        satisfaction_logic.append(textwrap.dedent("""
+        yield "\n\n" + textwrap.dedent("""
         % General holds logic
         holds(G, T):-
             time(T), 
@@ -397,29 +813,44 @@ class SleecToClingoConverter:
             time(T), 
             exp(G),
             holds_v(G, T).
-        """).strip())
-        
+        """).strip()
+
         # Specific holds logic for each rule
         for rule in self.rules:
-            rule_id = rule.id.lower()
-            
-            if rule.unless_clauses:
-                # Handle unless rules - generate satisfaction logic for all generated rules
-                self._generate_unless_satisfaction_logic(rule, satisfaction_logic)
-            else:
-                # Handle regular rules
-                self._generate_regular_satisfaction_logic(rule, satisfaction_logic)
-        
+            block = self._rule_satisfaction_block(rule)
+            if block:
+                yield "\n\n" + block
+
         # Hard constraint: every rule must be satisfied at every time point
-        satisfaction_logic.append("""% Hard constraint: every rule must be satisfied at every time point
-:- exp(R), time(T), not holds(R,T).""")
-        
+        yield """\n\n% Hard constraint: every rule must be satisfied at every time point
+:- exp(R), time(T), not holds(R,T)."""
+    
+    def _generate_satisfaction_schemas(self) -> str:
+        """Generate satisfaction logic shared by every rule id, independent of the rule count
+
+        A rule is satisfied exactly when its antecedent and consequent agree
+        (holds_nv or holds_v), so the schemas forbid disagreement directly
+        instead of deriving holds/2 first.
+        """
         return textwrap.dedent("""
-        % =============================================================================
-        % RULE SATISFACTION LOGIC
-        % =============================================================================
-        """).strip() + "\n\n" + "\n\n".join(satisfaction_logic)
+        % Satisfaction schemas (shared by every rule): antecedent and consequent agree at every time point
+        :- exp(R), time(T), antecedent(R, T), not consequent(R, T).
+        :- exp(R), time(T), consequent(R, T), not antecedent(R, T).
+        """).strip()
     
+    def _rule_satisfaction_block(self, rule: Rule) -> str:
+        """Generate the holds_nv/holds_v rules of one rule"""
+        satisfaction_logic = []
+
+        if rule.unless_clauses:
+            # Handle unless rules - generate satisfaction logic for all generated rules
+            self._generate_unless_satisfaction_logic(rule, satisfaction_logic)
+        else:
+            # Handle regular rules
+            self._generate_regular_satisfaction_logic(rule, satisfaction_logic)
+
+        return "\n\n".join(satisfaction_logic)
+
     def _generate_unless_satisfaction_logic(self, rule, satisfaction_logic):
         """Generate satisfaction logic for unless rules"""
         rule_id = rule.id.lower()
@@ -517,11 +948,14 @@ holds_v({otherwise_id}, T):-
     
     def _generate_triggering_events_section(self) -> str:
         """Generate triggering events with contextual comments"""
-        triggering_events = self._get_triggering_events()
+        triggering_events = self._get_symbol_index().triggering_events
         if not triggering_events:
             return ""
         
-        triggering_rules = [f"{{ happens({event}, T, T) }} :- time(T)." for event in triggering_events]
+        if self.config.external_inputs:
+            triggering_rules = [f"#external happens({event}, T, T) : time(T)." for event in triggering_events]
+        else:
+            triggering_rules = [f"{{ happens({event}, T, T) }} :- time(T)." for event in triggering_events]
         comment = self._get_triggering_events_comment()
         
         return comment + "\n" + "\n".join(triggering_rules)
@@ -557,8 +991,21 @@ holds_v({otherwise_id}, T):-
         action_rules.extend(self._generate_within_action_rules(action_events_with_within))
         
         comment = self._get_action_events_comment(action_events_with_within, action_events_without_within)
+        section = comment + "\n" + "\n".join(action_rules)
         
-        return comment + "\n" + "\n".join(action_rules)
+        if self.config.within_deadline_predicates and self._get_within_events():
+            section += "\n\n" + self._generate_deadline_predicates()
+        
+        return section
+    
+    def _generate_deadline_predicates(self) -> str:
+        """Generate per-event occurrence and deadline predicates for within events"""
+        rules = ["% Within event occurrences and deadlines"]
+        for event, constraint in self._get_symbol_index().within_events.items():
+            constraint_value = self._within_value(constraint)
+            rules.append(f"occurred_at({event}, T2) :- happens({event}, T1, T2).")
+            rules.append(f"satisfied_by_deadline({event}, T1) :- happens({event}, T1, T2), T2 <= T1+{constraint_value}.")
+        return "\n".join(rules)
     
     def _generate_regular_action_rules(self, action_events_without_within) -> List[str]:
         """Generate rules for regular (non-within) action events"""
@@ -568,10 +1015,13 @@ holds_v({otherwise_id}, T):-
         """Generate rules for action events with within constraints"""
         within_rules = []
         for event, constraint in action_events_with_within:
-            constraint_parts = constraint.split()
-            constraint_value = constraint_parts[0]
-            # Use constraint value directly - it can be a constant name or number
-            within_rules.append(f"{{ happens({event}, T1, T2) : T1 <= T2, T2 <= T1+{constraint_value} }} :- time(T1), time(T2).")
+            constraint_value = self._within_value(constraint)
+            if self.config.within_encoding == "window" and not self.config.incremental:
+                # Bound the end point arithmetically so only the window after T1 is instantiated
+                within_rules.append(f"{{ happens({event}, T1, T2) }} :- time(T1), T2 = T1..T1+{constraint_value}, "
+                                    f"T2 <= {self._max_time()}.")
+            else:
+                within_rules.append(f"{{ happens({event}, T1, T2) : T1 <= T2, T2 <= T1+{constraint_value} }} :- time(T1), time(T2).")
         return within_rules
     
     def _get_action_events_comment(self, action_events_with_within, action_events_without_within) -> str:
@@ -580,16 +1030,15 @@ holds_v({otherwise_id}, T):-
             return "% Action event instantiation "
         else:
             # Check if any constraint is large (might extend beyond time domain)
-            # Handle both numeric constraints and constant names
             has_large_constraint = False
             for _, constraint in action_events_with_within:
-                constraint_value = constraint.split()[0]
+                constraint_value = self._within_value(constraint)
                 try:
-                    if int(constraint_value) > self.config.max_time:
+                    if int(constraint_value) > self._max_time():
                         has_large_constraint = True
                         break
                 except ValueError:
-                    # Constraint uses a constant name, assume it could be large
+                    # Constraint could not be evaluated, assume it could be large
                     has_large_constraint = True
                     break
             
@@ -603,26 +1052,96 @@ holds_v({otherwise_id}, T):-
         if not self.measures:
             return ""
         
+        inertial_measures = self._used_inertial_measures()
         measure_rules = []
         for measure in self.measures:
-            measure_rules.append(self._generate_single_measure_rule(measure))
-        
-        return "% Measure instantiation\n" + "\n".join(measure_rules)
+            change_events = inertial_measures.get(measure.name.lower())
+            if change_events is None and self.config.external_inputs:
+                measure_rules.append(self._generate_external_measure_rule(measure))
+            elif change_events is None:
+                measure_rules.append(self._generate_single_measure_rule(measure))
+            else:
+                measure_rules.append(self._generate_inertial_measure_rule(measure, change_events))
+        
+        section = "% Measure instantiation\n" + "\n".join(measure_rules)
+        
+        # Change events that no rule triggers or produces still need to be able to happen
+        index = self._get_symbol_index()
+        generated = set(index.triggering_events) | set(index.action_events)
+        change_events = [event for events in inertial_measures.values() for event in events if event not in generated]
+        if change_events:
+            section = ("% Change event instantiation\n"
+                       + "\n".join(f"{{ happens({event}, T, T) }} :- time(T)." for event in dict.fromkeys(change_events))
+                       + "\n\n" + section)
+        return section
     
-    def _generate_single_measure_rule(self, measure) -> str:
-        """Generate instantiation rule for a single measure based on its type"""
+    def _generate_single_measure_rule(self, measure, body: str = "time(T)") -> str:
+        """Generate instantiation rule for a single measure based on its type
+        
+        The rule chooses the measure's value at every time point satisfying body.
+        """
         measure_name = measure.name.lower()
         
         if measure.type == MeasureType.BOOLEAN:
-            return f"{{ holds_at({measure_name}, T) }} :- time(T)."
+            return f"{{ holds_at({measure_name}, T) }} :- {body}."
         elif measure.type == MeasureType.NUMERIC:
-            return f"{{ holds_at({measure_name}, V, T) : {self.config.numeric_range} }} :- time(T)."
+            value_classes = self._get_value_classes().get(measure_name) if self.config.numeric_abstraction else None
+            if value_classes is not None:
+                # One representative per class of values the rules cannot tell apart
+                facts = " ".join(f"value_class({measure_name}, {value_class.representative}, "
+                                 f"{value_class.low}, {value_class.high})." for value_class in value_classes)
+                return f"{facts}\n{{ holds_at({measure_name}, V, T) : value_class({measure_name}, V, _, _) }} :- {body}."
+            return f"{{ holds_at({measure_name}, V, T) : {self.config.numeric_range} }} :- {body}."
         elif measure.type == MeasureType.SCALE and measure.scale_values:
             scale_options = " ; ".join([f"holds_at({measure_name}, {value.lower()}, T)" for value in measure.scale_values])
-            return f"1 {{ {scale_options} }} 1 :- time(T)."
+            return f"1 {{ {scale_options} }} 1 :- {body}."
         else:
             # Fallback for unknown types
-            return f"{{ holds_at({measure_name}, T) }} :- time(T)."
+            return f"{{ holds_at({measure_name}, T) }} :- {body}."
+    
+    def _generate_external_measure_rule(self, measure) -> str:
+        """Declare the atoms of a measure as externals that scenarios assign
+        
+        Scale measures keep exactly one value per time point through a
+        constraint, since externals cannot be bounded like a choice.
+        """
+        measure_name = measure.name.lower()
+        
+        if measure.type == MeasureType.NUMERIC:
+            value_classes = self._get_value_classes().get(measure_name) if self.config.numeric_abstraction else None
+            if value_classes is not None:
+                facts = " ".join(f"value_class({measure_name}, {value_class.representative}, "
+                                 f"{value_class.low}, {value_class.high})." for value_class in value_classes)
+                return f"{facts}\n#external holds_at({measure_name}, V, T) : time(T), value_class({measure_name}, V, _, _)."
+            return f"#external holds_at({measure_name}, V, T) : time(T), {self.config.numeric_range}."
+        elif measure.type == MeasureType.SCALE and measure.scale_values:
+            values = "; ".join(value.lower() for value in measure.scale_values)
+            return (f"#external holds_at({measure_name}, V, T) : time(T), V = ({values}).\n"
+                    f":- time(T), #count {{ V : holds_at({measure_name}, V, T) }} != 1.")
+        return f"#external holds_at({measure_name}, T) : time(T)."
+    
+    def _generate_inertial_measure_rule(self, measure, change_events: List[str]) -> str:
+        """Generate a measure that is chosen at time 0 and at change points, and kept in between"""
+        measure_name = measure.name.lower()
+        
+        if change_events:
+            comment = f"% Inertial measure {measure_name}: changes only when {' or '.join(change_events)} happens"
+        else:
+            comment = f"% Inertial measure {measure_name}: constant over the time horizon"
+        rules = [comment, f"change_point({measure_name}, 0)."]
+        rules.extend(f"change_point({measure_name}, T) :- happens({event}, _, T), T > 0." for event in change_events)
+        rules.append(self._generate_single_measure_rule(measure, f"change_point({measure_name}, T)"))
+        rules.append(f"{self._measure_atom(measure, 'T')} :- {self._measure_atom(measure, 'T-1')}, time(T), "
+                     f"not change_point({measure_name}, T).")
+        return "\n".join(rules)
+    
+    @staticmethod
+    def _measure_atom(measure, time_term: str) -> str:
+        """Return the holds_at atom of a measure with value variable V where the type has values"""
+        measure_name = measure.name.lower()
+        if measure.type == MeasureType.NUMERIC or (measure.type == MeasureType.SCALE and measure.scale_values):
+            return f"holds_at({measure_name}, V, {time_term})"
+        return f"holds_at({measure_name}, {time_term})"
     
     def _assemble_action_generation_sections(self, sections: List[str]) -> str:
         """Assemble all action generation sections with proper formatting"""
@@ -637,98 +1156,40 @@ holds_v({otherwise_id}, T):-
         
         return header + "\n\n" + "\n\n".join(sections)
     
-    def _extract_valid_actions_from_rule(self, rule) -> List[str]:
-        """Extract all valid action events from a rule (excluding negated actions)"""
-        actions = []
-        
-        # Primary action
-        if rule.action and not rule.action.strip().startswith("not "):
-            actions.append(rule.action.lower())
-        
-        # Otherwise action  
-        if rule.otherwise_action and not rule.otherwise_action.strip().startswith("not "):
-            actions.append(rule.otherwise_action.lower())
-        
-        # Unless clause actions
-        if rule.unless_clauses:
-            for unless_clause in rule.unless_clauses:
-                if unless_clause.action and not unless_clause.action.strip().startswith("not "):
-                    actions.append(unless_clause.action.lower())
-        
-        return actions
-    
     def _get_triggering_events(self) -> Set[str]:
         """Get events that appear in conditions but not in actions (triggering events)"""
-        condition_events = set()
-        action_events = set()
-        
-        for rule in self.rules:
-            # Extract events from conditions (simple pattern matching)
-            condition_lower = rule.condition.lower()
-            for event in self.events:
-                if event.name.lower() in condition_lower:
-                    condition_events.add(event.name.lower())
-            
-            # Extract events from actions
-            actions = self._extract_valid_actions_from_rule(rule)
-            action_events.update(actions)
-        
-        # Triggering events are those in conditions but not in actions
-        return condition_events - action_events
+        return set(self._get_symbol_index().triggering_events)
     
-    def _get_action_events_with_constraints(self) -> Tuple[List[Tuple[str, str]], Set[str]]:
+    def _get_action_events_with_constraints(self) -> Tuple[List[Tuple[str, str]], List[str]]:
         """Get action events separated by whether they have within constraints"""
-        action_events_with_within = []
-        action_events_without_within = set()
-        
-        for rule in self.rules:
-            # Handle primary action with possible within constraint
-            if rule.action and not rule.action.strip().startswith("not "):
-                if rule.within_constraint:
-                    action_events_with_within.append((rule.action.lower(), rule.within_constraint))
-                else:
-                    action_events_without_within.add(rule.action.lower())
-            
-            # Handle otherwise and unless actions (no within constraints)
-            if rule.otherwise_action and not rule.otherwise_action.strip().startswith("not "):
-                action_events_without_within.add(rule.otherwise_action.lower())
-            
-            if rule.unless_clauses:
-                for unless_clause in rule.unless_clauses:
-                    if unless_clause.action and not unless_clause.action.strip().startswith("not "):
-                        action_events_without_within.add(unless_clause.action.lower())
-        
-        return action_events_with_within, action_events_without_within
+        index = self._get_symbol_index()
+        return index.action_events_with_within, index.action_events_without_within
     
     def _get_action_events(self) -> Set[str]:
         """Get all action events as a simple set"""
-        action_events = set()
-        
-        for rule in self.rules:
-            actions = self._extract_valid_actions_from_rule(rule)
-            action_events.update(actions)
-        
-        return action_events
+        return set(self._get_symbol_index().action_events)
     
-    def _get_within_events(self) -> Set[str]:
+    def _get_within_events(self) -> AbstractSet[str]:
         """Get events that are produced with within constraints"""
-        within_events = set()
-        
-        for rule in self.rules:
-            if rule.action and rule.within_constraint:
-                within_events.add(rule.action.lower())
-        
-        return within_events
+        return self._get_symbol_index().within_events.keys()
+    
+    def _get_within_constraint(self, event: str) -> Optional[str]:
+        """Get the within constraint an event is produced with, if any"""
+        return self._get_symbol_index().within_events.get(event)
     
     def _generate_output_specification(self) -> str:
         """Generate output specification"""
         sections = []
         
         # Show statements based on what's actually in the SLEEC file
-        if self.measures:
-            sections.append("#show holds_at/2.")
+        for predicate in self.config.show_predicates:
+            if predicate == "holds_at/2" and not self.measures:
+                continue
+            sections.append(f"#show {predicate}.")
         
-        sections.append("#show happens/3.")
+        projection = self._generate_projection()
+        if projection:
+            sections.append(projection)
         
         return textwrap.dedent("""
         % =============================================================================
@@ -736,6 +1197,23 @@ holds_v({otherwise_id}, T):-
         % =============================================================================
         """).strip() + "\n\n" + "\n\n".join(sections)
     
+    def _generate_projection(self) -> str:
+        """Generate #project directives for the events and measures of interest"""
+        index = self._get_symbol_index()
+        directives = []
+        for name in dict.fromkeys(name.lower() for name in self.config.project_symbols):
+            if name in index.events:
+                atom = f"happens({name}, T1, T2)"
+            elif name in index.measures:
+                atom = self._measure_atom(index.measures[name], "T")
+            else:
+                # Left out of the program as unused
+                continue
+            directives.append(f"#project {atom} : {atom}.")
+        if not directives:
+            return ""
+        return "% Projected enumeration (clingo --project): answer sets differ only in these atoms\n" + "\n".join(directives)
+    
     def _generate_measure_comparisons(self) -> str:
         """Generate measure comparison logic for scale measures"""
         if not self.measures:
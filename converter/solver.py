@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+SLEEC Solver
+============
+
+This module solves generated Clingo programs in-process through the clingo
+Python API: the program text is added to a clingo.Control directly, models
+are passed to a callback as they are found and the solver statistics are
+returned with the result. Nothing is written to disk and no process is
+spawned, which matters when many small programs are solved in a row.
+
+When the clingo Python module is not installed, a clingo executable on the
+PATH is used instead. The program is piped to it on stdin and its JSON
+output is parsed into the same result.
+
+With a StatementCache, converted programs are added as clingo.ast statements
+parsed once per generated chunk (see converter.program_ast).
+
+Classes:
+    SolveResult: Outcome, models and statistics of one solve call
+    SleecSolver: Converts and solves SLEEC programs
+
+Usage:
+    solver = SleecSolver()
+    result = solver.solve_sleec(sleec_content, models=0)
+    for model in result.models:
+        print(model)
+"""
+
+import json
+import shutil
+import subprocess
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from converter.config import ConverterConfig
+from converter.program_ast import StatementCache, add_program
+from converter.sleec_converter import SleecToClingoConverter
+
+try:
+    import clingo
+except ImportError:  # pragma: no cover - depends on the environment
+    clingo = None
+
+SOLVER_BACKENDS = ("python", "subprocess")
+"""Supported solver backends: the clingo Python module or a clingo executable"""
+
+ModelCallback = Callable[[List[str]], Optional[bool]]
+"""Receives the shown atoms of each model; returning False stops the search"""
+
+
+@dataclass
+class SolveResult:
+    """Outcome, models and statistics of one solve call"""
+    satisfiable: Optional[bool] = None
+    """True or False, or None if the search was stopped before it could tell"""
+    exhausted: bool = False
+    """Whether the whole search space was explored"""
+    models: List[List[str]] = field(default_factory=list)
+    """Shown atoms of each model, in the order they were found"""
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    """clingo statistics (summary, problem, solving, ...) as nested dicts"""
+    seconds: float = 0.0
+    """Wall time of the whole call, including grounding"""
+    backend: str = "python"
+
+    def format(self) -> str:
+        """Render the result like clingo's text output"""
+        lines = []
+        for number, model in enumerate(self.models, 1):
+            lines.append(f"Answer: {number}")
+            lines.append(" ".join(model))
+        if self.satisfiable is None:
+            lines.append("UNKNOWN")
+        else:
+            lines.append("SATISFIABLE" if self.satisfiable else "UNSATISFIABLE")
+        return "\n".join(lines)
+
+
+class SleecSolver:
+    """Solves Clingo programs generated from SLEEC rules
+
+    Args:
+        config: Converter configuration, used for solve_sleec/solve_file and
+            for the default number of models
+        arguments: Extra clingo command line options, e.g. ["--project"]
+        backend: "python" or "subprocess"; by default the Python module is
+            used whenever it is installed
+        statement_cache: Add converted programs as cached clingo.ast
+            statements instead of text (python backend only)
+    """
+
+    def __init__(self, config: Optional[ConverterConfig] = None, arguments: Sequence[str] = (),
+                 backend: Optional[str] = None, statement_cache: Optional[StatementCache] = None):
+        self.config = config or ConverterConfig.create_default()
+        self.arguments = list(arguments)
+        self.statement_cache = statement_cache
+        if backend is None:
+            backend = "python" if clingo is not None else "subprocess"
+        if backend not in SOLVER_BACKENDS:
+            raise ValueError(f"❌ Unknown solver backend '{backend}' (expected one of {', '.join(SOLVER_BACKENDS)})")
+        if backend == "python" and clingo is None:
+            raise RuntimeError("❌ The clingo Python module is not installed")
+        if backend == "subprocess" and shutil.which("clingo") is None:
+            raise RuntimeError("❌ Neither the clingo Python module nor a clingo executable is available")
+        self.backend = backend
+
+    def solve_sleec(self, content: str, models: Optional[int] = None, on_model: Optional[ModelCallback] = None,
+                    time_limit: Optional[float] = None) -> SolveResult:
+        """Convert SLEEC content and solve the generated program"""
+        program = list(SleecToClingoConverter(self.config).iter_convert_sleec_string(content))
+        return self.solve(program, models, on_model, time_limit)
+
+    def solve_file(self, filename: str, models: Optional[int] = None, on_model: Optional[ModelCallback] = None,
+                   time_limit: Optional[float] = None) -> SolveResult:
+        """Convert a SLEEC file and solve the generated program"""
+        program = list(SleecToClingoConverter(self.config).iter_convert_file(filename))
+        return self.solve(program, models, on_model, time_limit)
+
+    def solve(self, program: Union[str, Sequence[str]], models: Optional[int] = None,
+              on_model: Optional[ModelCallback] = None, time_limit: Optional[float] = None) -> SolveResult:
+        """Ground and solve a Clingo program
+
+        Args:
+            program: Program text, or the chunks of a streamed conversion
+            models: Number of models to compute, 0 for all (default: config.default_models)
+            on_model: Called with the shown atoms of each model
+            time_limit: Seconds after which the search is stopped
+
+        Raises:
+            ValueError: If clingo rejects the program
+        """
+        if models is None:
+            models = self.config.default_models
+        start = time.perf_counter()
+        if isinstance(program, str):
+            program = [program]
+        if self.backend == "python":
+            result = self._solve_in_process(program, models, on_model, time_limit)
+        else:
+            result = self._solve_in_subprocess("".join(program), models, on_model, time_limit)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _solve_in_process(self, program: Sequence[str], models: int, on_model: Optional[ModelCallback],
+                          time_limit: Optional[float]) -> SolveResult:
+        messages = []
+        control = clingo.Control([f"--models={models}"] + self.arguments,
+                                 logger=lambda code, message: messages.append(message.strip()))
+        try:
+            if self.statement_cache is not None:
+                add_program(control, program, self.statement_cache)
+            else:
+                control.add("base", [], "".join(program))
+            control.ground([("base", [])])
+        except RuntimeError as e:
+            errors = [message for message in messages if "error" in message] or [str(e)]
+            raise ValueError("❌ clingo rejected the program:\n" + "\n".join(errors)) from e
+
+        result = SolveResult(backend="python")
+
+        def collect(model) -> bool:
+            atoms = [str(symbol) for symbol in model.symbols(shown=True)]
+            result.models.append(atoms)
+            return on_model(atoms) is not False if on_model else True
+
+        with control.solve(on_model=collect, async_=True) as handle:
+            if not handle.wait(time_limit):
+                handle.cancel()
+            outcome = handle.get()
+
+        result.satisfiable = True if outcome.satisfiable else (False if outcome.unsatisfiable else None)
+        result.exhausted = bool(outcome.exhausted)
+        result.statistics = control.statistics
+        return result
+
+    def _solve_in_subprocess(self, program: str, models: int, on_model: Optional[ModelCallback],
+                             time_limit: Optional[float]) -> SolveResult:
+        command = ["clingo", f"--models={models}", "--outf=2", "--stats"] + self.arguments
+        if time_limit is not None:
+            command.append(f"--time-limit={max(1, round(time_limit))}")
+        process = subprocess.run(command, input=program, capture_output=True, text=True)
+
+        # Exit codes combine 10 (satisfiable), 20 (unsatisfiable) and 1 (interrupted); 65 and up are errors
+        if process.returncode >= 65 or not process.stdout.strip():
+            raise ValueError("❌ clingo rejected the program:\n" + process.stderr.strip())
+        output = json.loads(process.stdout)
+
+        result = SolveResult(backend="subprocess")
+        for call in output.get("Call", []):
+            for witness in call.get("Witnesses", []):
+                result.models.append(witness.get("Value", []))
+        # The process has finished, so callbacks can only run afterwards
+        if on_model:
+            for number, atoms in enumerate(result.models):
+                if on_model(atoms) is False:
+                    del result.models[number + 1:]
+                    break
+
+        status = output.get("Result", "UNKNOWN")
+        result.satisfiable = {"SATISFIABLE": True, "OPTIMUM FOUND": True, "UNSATISFIABLE": False}.get(status)
+        result.exhausted = process.returncode & 20 == 20
+        result.statistics = output.get("Stats", {})
+        return result
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+SLEEC Time Scale
+================
+
+This module maps within constraints such as "2 minutes" or "30 seconds" onto
+time steps of the generated program. Unit-aware scales convert every deadline
+to seconds and make one time step the greatest common divisor of all of them,
+so the time domain and within windows are as small as the rules allow.
+Scales that ignore units keep the historical reading of a deadline as a plain
+number of time steps.
+
+Classes:
+    TimeScale: Length of one time step and the deadline conversion
+"""
+
+from dataclasses import dataclass
+from math import gcd
+from typing import List, Optional
+
+from converter.analysis import SymbolIndex
+from converter.parser import Rule
+
+UNIT_SECONDS = {
+    "second": 1, "seconds": 1, "sec": 1, "secs": 1, "s": 1,
+    "minute": 60, "minutes": 60, "min": 60, "mins": 60,
+    "hour": 3600, "hours": 3600, "h": 3600,
+    "day": 86400, "days": 86400,
+    "week": 604800, "weeks": 604800
+}
+"""Seconds per SLEEC time unit; deadlines without a unit are read as seconds"""
+
+
+@dataclass
+class TimeScale:
+    """Length of one time step and the conversion of deadlines into steps"""
+    step: int = 1
+    """Seconds per time step"""
+    unit_aware: bool = False
+
+    @classmethod
+    def build(cls, rules: List[Rule], index: SymbolIndex, unit_aware: bool = False) -> "TimeScale":
+        """Choose the coarsest step that still expresses every deadline exactly"""
+        scale = cls(unit_aware=unit_aware)
+        if unit_aware:
+            step = 0
+            for rule in rules:
+                if rule.within_constraint:
+                    step = gcd(step, scale.seconds(rule.within_constraint, index) or 0)
+            scale.step = step or 1
+        return scale
+
+    def seconds(self, within_constraint: str, index: SymbolIndex) -> Optional[int]:
+        """Return a deadline in seconds, or None for unknown values and units"""
+        parts = within_constraint.split()
+        value = _resolve(parts[0], index)
+        factor = UNIT_SECONDS.get(parts[1].lower()) if len(parts) > 1 else 1
+        if value is None or factor is None:
+            return None
+        return value * factor
+
+    def steps(self, within_constraint: str, index: SymbolIndex) -> Optional[int]:
+        """Return a deadline in time steps, or None if it cannot be evaluated"""
+        if not self.unit_aware:
+            return _resolve(within_constraint.split()[0], index)
+        seconds = self.seconds(within_constraint, index)
+        return seconds // self.step if seconds is not None else None
+
+    def describe(self) -> str:
+        """Human readable step length, e.g. '1 step = 60 seconds'"""
+        return f"1 step = {self.step} second{'s' if self.step != 1 else ''}"
+
+
+def _resolve(value: str, index: SymbolIndex) -> Optional[int]:
+    """Return a number or the value of a numeric constant"""
+    constant = index.constants.get(value.lower())
+    if constant is not None:
+        value = constant.value
+    try:
+        return int(value)
+    except ValueError:
+        return None
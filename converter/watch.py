@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+SLEEC Watch Mode
+================
+
+This module keeps parsed SLEEC state in memory between edits so that saving a
+file only re-parses the rules whose text changed and only regenerates the
+Clingo blocks of rules that changed. Everything else is spliced in from the
+previous conversion.
+
+Usage:
+    converter = IncrementalConverter()
+    clingo_code = converter.update(sleec_content)
+    clingo_code = converter.update(edited_content)   # cheap for small edits
+    print(converter.last_update)
+
+    watch_files(["example.sleec"])                   # runs until interrupted
+
+Classes:
+    UpdateStats: What an update had to redo
+    IncrementalConverter: Converter that reuses unchanged rules across updates
+"""
+
+import os
+import re
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from converter.batch import output_path
+from converter.conditions import Condition
+from converter.config import ConverterConfig
+from converter.parser import SleecParser, Rule
+from converter.sleec_converter import SleecToClingoConverter
+
+
+@dataclass
+class UpdateStats:
+    """What an update had to redo"""
+    rules: int = 0
+    reparsed_rules: int = 0
+    regenerated_rules: int = 0
+    full_parse: bool = True
+    seconds: float = 0.0
+
+
+class _Layout(NamedTuple):
+    """A source split into the text around its rules and one text block per rule"""
+    definitions: str
+    blocks: List[Tuple[str, int, int]]
+    """(text, first line, offset) of each rule block"""
+
+
+class IncrementalConverter(SleecToClingoConverter):
+    """Converter that reuses parsed rules and generated blocks across updates
+
+    A file is split into the text around its rules section and one block per
+    rule (a rule starts on a line beginning with '<id> when'). While the text
+    around the rules section is unchanged, only rule blocks whose text changed
+    are re-parsed; otherwise the whole file is parsed again. Generated rule
+    blocks are reused while the rule and the definitions it depends on are
+    unchanged.
+    """
+
+    _SECTION_LINE = r"^[ \t]*{}[ \t]*(?://[^\n]*)?$"
+    _RULE_START = re.compile(r"^[ \t]*[A-Za-z_][A-Za-z0-9_]*[ \t]+when\b", re.MULTILINE)
+
+    def __init__(self, config: Optional[ConverterConfig] = None):
+        super().__init__(config)
+        self.last_update: Optional[UpdateStats] = None
+        self._definitions_text: Optional[str] = None
+        self._parsed_blocks: Dict[str, Tuple[int, int, List[Rule]]] = {}
+        self._context_key: Optional[Tuple] = None
+        self._reusing = False
+        self._regenerated = 0
+        self._definition_blocks: Dict[Tuple, Tuple[str, Dict[Condition, str]]] = {}
+        self._satisfaction_blocks: Dict[Tuple, str] = {}
+        self._next_definition_blocks: Dict[Tuple, Tuple[str, Dict[Condition, str]]] = {}
+        self._next_satisfaction_blocks: Dict[Tuple, str] = {}
+
+    def update(self, content: str) -> str:
+        """Convert new SLEEC content, reusing whatever the previous update produced"""
+        start = time.perf_counter()
+        stats = UpdateStats()
+        layout = self._split(content)
+
+        if layout is not None and layout.definitions == self._definitions_text:
+            rules, stats.reparsed_rules = self._parse_changed_blocks(layout)
+            stats.full_parse = False
+            # Ids are checked across all blocks, as a full parse does
+            SleecParser.check_rule_ids(rules)
+        else:
+            # Definitions may have changed how every rule parses
+            self._definitions_text = None
+            rules = list(self.parser.parse_sleec_string(content)[3])
+            stats.reparsed_rules = len(rules)
+            self._parsed_blocks = self._group_by_block(rules, layout) if layout else {}
+
+        self.events, self.measures, self.constants = self.parser.events, self.parser.measures, self.parser.constants
+        self.rules = rules
+        SleecParser.validate_definitions(self.events, self.measures, self.rules)
+        self._definitions_text = layout.definitions if layout else None
+
+        index = self._index_definitions()
+        context_key = (
+            tuple(event.name for event in self.events),
+            tuple((measure.name, measure.type, tuple(measure.scale_values or ())) for measure in self.measures),
+            tuple((constant.name, constant.value) for constant in self.constants),
+            tuple(index.within_events.items()),
+            self._get_time_scale().step,
+            repr(self.config)
+        )
+        if context_key != self._context_key:
+            self._context_key = context_key
+            self._definition_blocks = {}
+
+        self._reusing = True
+        self._regenerated = 0
+        self._next_definition_blocks = {}
+        self._next_satisfaction_blocks = {}
+        try:
+            program = self._generate_clingo()
+        finally:
+            self._reusing = False
+
+        # Keep only the blocks of the current rules
+        self._definition_blocks = self._next_definition_blocks
+        self._satisfaction_blocks = self._next_satisfaction_blocks
+
+        stats.rules = len(rules)
+        stats.regenerated_rules = self._regenerated
+        stats.seconds = time.perf_counter() - start
+        self.last_update = stats
+        return program
+
+    def _rule_definitions_block(self, rule: Rule) -> str:
+        if not self._reusing:
+            return super()._rule_definitions_block(rule)
+
+        # Helper predicate names depend on the helpers introduced by earlier rules
+        key = (self._rule_key(rule), frozenset(self._condition_atoms.items()))
+        cached = self._definition_blocks.get(key)
+        if cached is None:
+            known = set(self._condition_atoms)
+            block = super()._rule_definitions_block(rule)
+            cached = (block, {condition: name for condition, name in self._condition_atoms.items()
+                              if condition not in known})
+            self._regenerated += 1
+        else:
+            self._condition_atoms.update(cached[1])
+
+        self._next_definition_blocks[key] = cached
+        return cached[0]
+
+    def _rule_satisfaction_block(self, rule: Rule) -> str:
+        if not self._reusing:
+            return super()._rule_satisfaction_block(rule)
+
+        key = self._rule_key(rule)
+        block = self._satisfaction_blocks.get(key)
+        if block is None:
+            block = super()._rule_satisfaction_block(rule)
+        self._next_satisfaction_blocks[key] = block
+        return block
+
+    def _split(self, content: str) -> Optional[_Layout]:
+        """Split content into the text around the rules section and rule blocks
+
+        Returns None for layouts this does not handle (several rules sections,
+        section keywords sharing a line with rules), which forces a full parse.
+        """
+        starts = list(re.finditer(self._SECTION_LINE.format("rule_start"), content, re.MULTILINE))
+        ends = list(re.finditer(self._SECTION_LINE.format("rule_end"), content, re.MULTILINE))
+        if len(starts) != 1 or len(ends) != 1 or content.count("rule_start") != 1 or content.count("rule_end") != 1:
+            return None
+
+        body_start = starts[0].end() + 1
+        body_end = ends[0].start()
+        if body_start > body_end:
+            return None
+
+        boundaries = sorted({body_start} | {match.start() for match in
+                                            self._RULE_START.finditer(content, body_start, body_end)})
+        boundaries.append(body_end)
+
+        first_line = content.count("\n", 0, body_start) + 1
+        blocks = []
+        for block_start, block_end in zip(boundaries, boundaries[1:]):
+            blocks.append((content[block_start:block_end], first_line, block_start))
+            first_line += content.count("\n", block_start, block_end)
+
+        return _Layout(content[:body_start] + "\0" + content[body_end:], blocks)
+
+    def _parse_changed_blocks(self, layout: _Layout) -> Tuple[List[Rule], int]:
+        """Parse the rule blocks whose text changed, reusing and repositioning the rest"""
+        rules = []
+        reparsed = 0
+        parsed_blocks = {}
+
+        for text, line, offset in layout.blocks:
+            cached = self._parsed_blocks.get(text)
+            if cached is None:
+                block_rules = self.parser.parse_rules_string(text, line, offset)
+                reparsed += len(block_rules)
+            else:
+                old_line, old_offset, block_rules = cached
+                if (old_line, old_offset) != (line, offset):
+                    block_rules = [self._moved(rule, line - old_line, offset - old_offset) for rule in block_rules]
+            parsed_blocks[text] = (line, offset, block_rules)
+            rules.extend(block_rules)
+
+        self._parsed_blocks = parsed_blocks
+        return rules, reparsed
+
+    @staticmethod
+    def _moved(rule: Rule, lines: int, characters: int) -> Rule:
+        """Copy of a rule whose block moved within the file"""
+        return replace(rule, line_number=rule.line_number + lines,
+                       offset=rule.offset + characters if rule.offset is not None else None)
+
+    @staticmethod
+    def _group_by_block(rules: List[Rule], layout: _Layout) -> Dict[str, Tuple[int, int, List[Rule]]]:
+        """Assign fully parsed rules to the blocks they start in"""
+        parsed_blocks = {}
+        remaining = iter(rules)
+        rule = next(remaining, None)
+        for text, line, offset in layout.blocks:
+            block_rules = []
+            while rule is not None and rule.offset is not None and rule.offset < offset + len(text):
+                block_rules.append(rule)
+                rule = next(remaining, None)
+            parsed_blocks[text] = (line, offset, block_rules)
+        return parsed_blocks
+
+    @staticmethod
+    def _rule_key(rule: Rule) -> Tuple:
+        """Everything about a rule that its generated code depends on"""
+        unless = tuple((clause.condition, clause.action) for clause in rule.unless_clauses or ())
+        return (rule.id, rule.condition, rule.action, rule.within_constraint, rule.otherwise_action, unless)
+
+
+def print_update(source: str, output: Optional[str], stats: Optional[UpdateStats], error: Optional[str]) -> None:
+    """Default watch report: one line per update, or the error"""
+    if error is not None:
+        print(f"❌ {source}:")
+        print(f"   {error}".replace("\n", "\n   "))
+        return
+
+    scope = "full parse" if stats.full_parse else f"{stats.reparsed_rules}/{stats.rules} rules re-parsed"
+    print(f"🔄 {source} → {output}: {scope}, {stats.regenerated_rules} regenerated "
+          f"({stats.seconds * 1000:.1f} ms)")
+
+
+def watch_files(paths: Iterable[str], output_dir: Optional[str] = None,
+                config: Optional[ConverterConfig] = None, interval: float = 0.25,
+                report: Callable[[str, Optional[str], Optional[UpdateStats], Optional[str]], None] = print_update) -> None:
+    """Reconvert SLEEC files whenever they change, until interrupted
+
+    Files are polled every interval seconds. Outputs are written where batch
+    mode would write them. A failed conversion is reported and leaves the
+    previous output in place.
+    """
+    sources = list(dict.fromkeys(os.path.normpath(path) for path in paths))
+    base_dir = os.path.commonpath([os.path.abspath(os.path.dirname(source)) for source in sources]) if sources else None
+    converters = {source: IncrementalConverter(config) for source in sources}
+    stamps: Dict[str, Optional[Tuple[int, int]]] = {source: () for source in sources}
+
+    while True:
+        for source in sources:
+            try:
+                stat = os.stat(source)
+                stamp = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                stamp = None
+            if stamp == stamps[source]:
+                continue
+            stamps[source] = stamp
+
+            if stamp is None:
+                report(source, None, None, f"Input file '{source}' not found")
+                continue
+
+            output = output_path(source, output_dir, base_dir)
+            try:
+                with open(source, 'r') as f:
+                    program = converters[source].update(f.read())
+                os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+                with open(output, 'w') as f:
+                    f.write(program)
+            except (OSError, ValueError) as e:
+                report(source, None, None, str(e))
+            else:
+                report(source, output, converters[source].last_update, None)
+
+        time.sleep(interval)
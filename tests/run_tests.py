@@ -57,7 +57,7 @@ def run_unit_tests():
     print("🧪 Running Unit Tests...")
     
     # Unit test method names
-    unit_test_filter = "test_convert_condition_to_antecedent or test_remove_logical_grouping_parentheses or test_get_triggering_events or test_get_action_events"
+    unit_test_filter = "test_convert_condition_to_antecedent or test_condition_expression or test_get_triggering_events or test_get_action_events"
     return run_pytest_command(unit_test_filter)
 
 def run_integration_tests():
@@ -12,6 +12,7 @@ Comprehensive tests covering:
 
 import pytest
 import os
+import json
 import re
 import tempfile
 import subprocess
@@ -25,6 +26,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from converter.sleec_converter import SleecToClingoConverter
 from converter.parser import SleecParser, Event, Measure, Rule, MeasureType
 from converter.config import ConverterConfig, DEFAULT_CONFIG
+from converter.solver import SleecSolver, SolveResult
 
 
 class TestSleecToClingoConverter:
@@ -102,23 +104,40 @@ class TestSleecToClingoConverter:
 
         assert result == expected
 
-    def test_remove_logical_grouping_parentheses(self):
-        """Test removal of logical grouping parentheses"""
-        test_cases = [
-            # Simple case
-            ("(holds_at(a, T), holds_at(b, T))", "holds_at(a, T), holds_at(b, T)"),
-            # With spaces
-            ("(holds_at(same, T),  holds_at(human, T))", "holds_at(same, T),  holds_at(human, T)"),
-            # Should preserve function parentheses
-            ("holds_at(test, T)", "holds_at(test, T)"),
-            # Mixed case
-            ("happens(event, T), (holds_at(a, T), holds_at(b, T)), time(T)",
-             "happens(event, T), holds_at(a, T), holds_at(b, T), time(T)")
-        ]
-        
-        for input_str, expected in test_cases:
-            result = self.converter._remove_logical_grouping_parentheses(input_str)
-            assert result == expected, f"Failed for input: {input_str}"
+    def test_condition_expression_flattens_grouping(self):
+        """Test that grouping parentheses disappear in the parsed condition tree"""
+        from converter.conditions import ConditionParser, And, EventRef, MeasureRef, Not
+
+        parser = ConditionParser(event_names=["DoorOpen"])
+        expected = And((EventRef("DoorOpen"), MeasureRef("a"), MeasureRef("b"), Not(MeasureRef("c"))))
+
+        assert parser.parse_string("DoorOpen and ({a} and ({b} and not {c}))") == expected
+        assert parser.parse_string("((DoorOpen AND {a}) and {b}) and (not (not (not {c})))") == expected
+
+    def test_convert_condition_to_antecedent_nested_logic(self):
+        """Test that disjunctions and negated groups become helper predicates"""
+        self.converter.events = [Event("OpenDoor", 1)]
+        self.converter.rules = [Rule("R1", "OpenDoor and (({isDaytime} or {isWeekend}) and not ({isRaining} and {isWindy}))", "OpenDoor", 1)]
+        result = self.converter._generate_sleec_rule_definitions()
+
+        assert "antecedent(r1, T) :- happens(opendoor, T, T), condition(c1, T), not condition(c2, T), time(T)." in result
+        assert "condition(c1, T) :- holds_at(isdaytime, T), time(T)." in result
+        assert "condition(c1, T) :- holds_at(isweekend, T), time(T)." in result
+        assert "condition(c2, T) :- holds_at(israining, T), holds_at(iswindy, T), time(T)." in result
+
+    def test_convert_condition_to_antecedent_comparisons(self):
+        """Test numeric, constant and scale comparisons"""
+        from converter.parser import Constant
+
+        self.converter.measures = self.test_measures
+        self.converter.constants = [Constant("maxLevel", "7", 1)]
+
+        result = self.converter._convert_condition_to_antecedent("({brightness} > maxLevel) and {mode} = high")
+        assert result == "holds_at(brightness, V1, T), V1 > 7, holds_at(mode, high, T), time(T)"
+
+        # Scale measures compare by declaration order, not by symbol
+        result = self.converter._convert_condition_to_antecedent("{mode} >= medium")
+        assert result == "not holds_at(mode, low, T), time(T)"
 
     def test_get_triggering_events(self):
         """Test identification of triggering events"""
@@ -145,6 +164,41 @@ class TestSleecToClingoConverter:
         
         assert actions == expected
 
+    def test_symbol_index_built_once_per_conversion(self):
+        """Test that one symbol index serves every generator of a conversion"""
+        from converter.analysis import SymbolIndex
+
+        sleec_content = """
+def_start
+    event ButtonPress
+    event LightOn
+    event AlarmSound
+    event RobotStop
+    measure isNight: boolean
+def_end
+
+rule_start
+    R1 when ButtonPress and {isNight} then LightOn within 2 minutes
+    R2 when LightOn then AlarmSound otherwise RobotStop
+rule_end
+"""
+        with patch.object(SymbolIndex, "build", wraps=SymbolIndex.build) as build:
+            self.converter.convert_sleec_string(sleec_content)
+            assert build.call_count == 1
+
+        index = self.converter._get_symbol_index()
+        assert index.triggering_events == ["buttonpress"]
+        assert dict(index.within_events) == {"lighton": "2 minutes"}
+        assert index.action_events == ["lighton", "alarmsound", "robotstop"]
+        assert index.rule_events["R1"] == frozenset({"buttonpress"})
+        assert index.rule_measures["R1"] == frozenset({"isnight"})
+
+        # Replacing the definitions invalidates the index, also for a list of the same length
+        self.converter.rules = [Rule("R1", "ButtonPress", "RobotStop", 1)]
+        assert self.converter._get_symbol_index().action_events == ["robotstop"]
+        self.converter.rules = [Rule("R1", "ButtonPress", "AlarmSound", 1)]
+        assert self.converter._get_symbol_index().action_events == ["alarmsound"]
+
     # ========================================================================
     # INTEGRATION TESTS - Complete Conversion Pipeline
     # ========================================================================
@@ -176,6 +230,49 @@ rule_end
         assert "antecedent(r1, T)" in result
         assert "consequent(r1, T)" in result
 
+    def test_convert_to_stream(self):
+        """Test that streamed output matches the string API chunk by chunk"""
+        import io
+
+        def sleec_with_rules(n):
+            rules = "\n".join(f"    R{i} when ButtonPress and {{isNight}} then LightOn" for i in range(n))
+            return f"""
+def_start
+    event ButtonPress
+    event LightOn
+    measure isNight: boolean
+def_end
+
+rule_start
+{rules}
+rule_end
+"""
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.sleec', delete=False) as f:
+            f.write(sleec_with_rules(3))
+            sleec_file = f.name
+
+        try:
+            expected = SleecToClingoConverter().convert_file(sleec_file)
+            writer = io.StringIO()
+            written = self.converter.convert_to_stream(sleec_file, writer)
+            assert writer.getvalue() == expected
+            assert written == len(expected)
+        finally:
+            os.unlink(sleec_file)
+
+        # Chunk size does not grow with the number of rules
+        small = list(self.converter.iter_convert_sleec_string(sleec_with_rules(5)))
+        large = list(self.converter.iter_convert_sleec_string(sleec_with_rules(200)))
+        assert len(large) > len(small)
+        assert max(map(len, large)) == max(map(len, small))
+
+        # Parse errors surface before anything is written
+        writer = io.StringIO()
+        with pytest.raises(FileNotFoundError):
+            self.converter.convert_to_stream("nonexistent_file.sleec", writer)
+        assert writer.getvalue() == ""
+
     def test_convert_sleec_string_with_measures(self):
         """Test conversion with measures"""
         sleec_content = """
@@ -216,27 +313,128 @@ rule_end
         
         result = self.converter.convert_sleec_string(sleec_content)
         
-        # Write to temp file and test with clingo
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lp', delete=False) as f:
-            f.write(result)
-            temp_file = f.name
-        
         try:
-            # Test syntax by running clingo --help on the file (syntax check only)
-            process = subprocess.run(['clingo', '--help'], 
-                                   input=result, text=True, capture_output=True)
-            # If clingo is available, test parsing with timeout
-            if process.returncode == 0:
-                # Use test configuration for syntax validation
-                syntax_check = subprocess.run(['clingo', temp_file, f'--models={DEFAULT_CONFIG.test_models}', f'--time-limit={DEFAULT_CONFIG.test_time_limit}'], 
-                                            capture_output=True, text=True, timeout=DEFAULT_CONFIG.test_timeout)
-                # Should not have parsing errors
-                assert "error:" not in syntax_check.stderr.lower()
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            # Clingo not available or timeout, skip syntax check
-            pytest.skip("Clingo not available or timeout for syntax validation")
-        finally:
-            os.unlink(temp_file)
+            solver = SleecSolver()
+        except RuntimeError:
+            pytest.skip("Clingo not available for syntax validation")
+        # Rejected programs raise ValueError with clingo's error messages
+        solution = solver.solve(result, DEFAULT_CONFIG.test_models, time_limit=DEFAULT_CONFIG.test_time_limit)
+        assert solution.satisfiable
+
+    def test_negated_actions_and_corpus_grounding(self):
+        """Test that negated actions get no consequent and every corpus file that parses grounds"""
+        sleec_content = """
+def_start
+    event Request
+    event Share
+    event Log
+    measure isAdmin: boolean
+def_end
+
+rule_start
+    R1 when Request and {isAdmin} then not Share within 2 minutes
+    R2 when Request then Log otherwise not Share
+rule_end
+"""
+        result = self.converter.convert_sleec_string(sleec_content)
+        assert "happens(not" not in result
+        assert "consequent(r1, T) :-" not in result and "consequent(r2_otherwise, T) :-" not in result
+        assert "consequent(r2, T) :- time(T), happens(log, T, T)." in result
+
+        pytest.importorskip("clingo")
+        solver = SleecSolver(ConverterConfig(max_time=2))
+        assert solver.solve(result, models=1).satisfiable
+        corpus = Path(__file__).resolve().parent.parent / "sleec_files"
+        grounded = []
+        for path in sorted(corpus.rglob("*.sleec")):
+            try:
+                program = SleecToClingoConverter(ConverterConfig(max_time=2)).convert_file(str(path))
+            except ValueError:
+                continue
+            # Raises ValueError with clingo's messages if the program is rejected
+            solver.solve(program, models=1)
+            grounded.append(path.name)
+        assert {"ALMI.sleec", "DAISY.sleec", "DPA.sleec"} <= set(grounded)
+
+    def test_sleec_solver(self):
+        """Test in-process solving, model callbacks, errors and the subprocess fallback"""
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    measure isNight: boolean
+def_end
+
+rule_start
+    R1 when Motion and {isNight} then Alarm
+rule_end
+"""
+        pytest.importorskip("clingo")
+        solver = SleecSolver(ConverterConfig(max_time=1))
+        result = solver.solve_sleec(sleec_content, models=0)
+        assert result.backend == "python" and result.satisfiable and result.exhausted
+        # Motion and isNight are free at both time points, Alarm follows from them
+        assert len(result.models) == 16 and result.statistics["summary"]["models"]["enumerated"] == 16
+        assert ["holds_at(isnight,0)", "happens(alarm,0,0)", "happens(motion,0,0)"] in result.models
+
+        seen = []
+        stopped = solver.solve("{ a; b; c }.", models=0, on_model=lambda atoms: seen.append(atoms) or False)
+        assert len(seen) == len(stopped.models) == 1 and not stopped.exhausted
+
+        unsat = solver.solve("a. :- a.")
+        assert unsat.satisfiable is False and unsat.format() == "UNSATISFIABLE"
+        with pytest.raises(ValueError, match="unsafe variables"):
+            solver.solve("p(X) :- q.")
+        with pytest.raises(ValueError, match="Unknown solver backend"):
+            SleecSolver(backend="gringo")
+
+        # Without the Python module, a clingo executable is run with JSON output
+        output = {"Call": [{"Witnesses": [{"Value": ["a"]}, {"Value": ["a", "b"]}]}],
+                  "Result": "SATISFIABLE", "Stats": {"summary": {"models": {"enumerated": 2}}}}
+        completed = subprocess.CompletedProcess([], 30, stdout=json.dumps(output), stderr="")
+        with patch("shutil.which", return_value="/usr/bin/clingo"), \
+                patch("subprocess.run", return_value=completed) as run:
+            fallback = SleecSolver(backend="subprocess").solve("{ b }. a.", models=0)
+        assert run.call_args.kwargs["input"] == "{ b }. a."
+        assert fallback.models == [["a"], ["a", "b"]] and fallback.satisfiable and fallback.exhausted
+        assert fallback.format() == SolveResult(True, True, [["a"], ["a", "b"]]).format()
+
+        with patch("shutil.which", return_value=None), pytest.raises(RuntimeError):
+            SleecSolver(backend="subprocess")
+
+    def test_statement_cache(self):
+        """Test that cached clingo.ast statements ground like the text and are parsed once per chunk"""
+        pytest.importorskip("clingo")
+        from converter.program_ast import StatementCache
+
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    event Door
+    event Lock
+    measure isNight: boolean
+def_end
+
+rule_start
+    R1 when Motion and {isNight} then Alarm
+    R2 when Door then Lock
+rule_end
+"""
+        config = ConverterConfig(max_time=1)
+        cache = StatementCache()
+        text = SleecSolver(config).solve_sleec(sleec_content, models=0)
+        cached = SleecSolver(config, statement_cache=cache).solve_sleec(sleec_content, models=0)
+        assert sorted(map(sorted, cached.models)) == sorted(map(sorted, text.models))
+        assert cached.statistics["problem"]["lp"]["rules"] == text.statistics["problem"]["lp"]["rules"]
+
+        # Editing R2 only parses the chunks that changed
+        misses = cache.misses
+        SleecSolver(config, statement_cache=cache).solve_sleec(sleec_content.replace("then Lock", "then Alarm"))
+        assert 0 < cache.misses - misses < misses
+
+        with pytest.raises(ValueError, match="syntax error"):
+            SleecSolver(statement_cache=cache).solve(["a.", "b :- a"])
 
     # ========================================================================
     # BEHAVIORAL TESTS - Rule Compliance and Logic
@@ -283,6 +481,492 @@ rule_end
         assert "{ happens(actionevent, T, T) }" in result
         assert "{ holds_at(testmeasure, T) }" in result
 
+    def test_within_window_encoding(self):
+        """Test that the window encoding of within choice rules grounds to the same program"""
+        sleec_content = """
+def_start
+    event Alarm
+    event Notify
+def_end
+
+rule_start
+    R1 when Alarm then Notify within 2 seconds
+rule_end
+"""
+        pairwise = SleecToClingoConverter(ConverterConfig(max_time=4)).convert_sleec_string(sleec_content)
+        window = SleecToClingoConverter(ConverterConfig(max_time=4, within_encoding="window")).convert_sleec_string(sleec_content)
+        assert "{ happens(notify, T1, T2) : T1 <= T2, T2 <= T1+2 } :- time(T1), time(T2)." in pairwise
+        assert "{ happens(notify, T1, T2) } :- time(T1), T2 = T1..T1+2, T2 <= 4." in window
+
+        with pytest.raises(ValueError):
+            ConverterConfig(within_encoding="quadratic").validate()
+
+        pytest.importorskip("clingo")
+
+        def ground(program):
+            result = TestUtils.solve_all(program)
+            lp = result.statistics["problem"]["lp"]
+            return lp["rules"], lp["atoms"], {frozenset(model) for model in result.models}
+
+        rules, atoms, models = ground(pairwise)
+        assert models and ground(window) == (rules, atoms, models)
+
+    def test_compact_satisfaction_encoding(self):
+        """Test that the compact satisfaction schemas replace per-rule holds logic with the same answer sets"""
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    event Log
+    event Flash
+    event Reset
+    measure isNight: boolean
+def_end
+
+rule_start
+    R1 when Motion then Alarm unless {isNight} then Log
+    R2 when Alarm then Flash otherwise Reset
+rule_end
+"""
+        expanded = SleecToClingoConverter(ConverterConfig(max_time=2)).convert_sleec_string(sleec_content)
+        compact = SleecToClingoConverter(ConverterConfig(max_time=2, satisfaction_encoding="compact")).convert_sleec_string(sleec_content)
+        assert "holds_nv(" not in compact and "holds_v(" not in compact
+        assert compact.count(":- exp(R), time(T), antecedent(R, T), not consequent(R, T).") == 1
+        assert compact.count(":- exp(R), time(T), consequent(R, T), not antecedent(R, T).") == 1
+        assert len(compact) < len(expanded)
+
+        with pytest.raises(ValueError):
+            ConverterConfig(satisfaction_encoding="schema").validate()
+
+        pytest.importorskip("clingo")
+
+        expected = set(TestUtils.answer_sets(expanded))
+        assert expected and set(TestUtils.answer_sets(compact)) == expected
+
+    def test_within_deadline_predicates(self):
+        """Test that deadline predicates keep answer sets and shrink grounding of shared within events"""
+        sleec_content = """
+def_start
+    event Alarm
+    event Notify
+    event Log
+    event Flash
+def_end
+
+rule_start
+    R1 when Alarm then Notify within 3 seconds
+    R2 when Notify then Log
+    R3 when Notify then Flash
+rule_end
+"""
+        plain = ConverterConfig(max_time=3, within_encoding="window")
+        deadlines = ConverterConfig(max_time=3, within_encoding="window", within_deadline_predicates=True)
+        result = SleecToClingoConverter(deadlines).convert_sleec_string(sleec_content)
+        assert "consequent(r1, T) :- time(T), satisfied_by_deadline(notify, T)." in result
+        assert "antecedent(r2, T2) :- occurred_at(notify, T2), time(T2)." in result
+        assert "satisfied_by_deadline(notify, T1) :- happens(notify, T1, T2), T2 <= T1+3." in result
+
+        pytest.importorskip("clingo")
+
+        def ground(config, models=0):
+            result = TestUtils.solve_all(SleecToClingoConverter(config).convert_sleec_string(sleec_content), models)
+            return result.statistics["problem"]["lp"]["rules"], {frozenset(model) for model in result.models}
+
+        assert ground(plain)[1] == ground(deadlines)[1]
+
+        # Two rules reading the same within event share one projection of its occurrences
+        plain.max_time = deadlines.max_time = 100
+        assert ground(deadlines, 1)[0] < ground(plain, 1)[0]
+
+    def test_auto_horizon(self):
+        """Test the derived time horizon and the warning when max_time truncates it"""
+        from converter.horizon import HorizonWarning
+
+        sleec_content = """
+def_start
+    event Alarm
+    event Notify
+    event Escalate
+    event Log
+    constant escalateDelay = 4
+def_end
+
+rule_start
+    R1 when Alarm then Notify within 3 seconds
+    R2 when Notify then Escalate within escalateDelay seconds
+    R3 when Escalate then Notify within 2 seconds
+    R4 when Alarm then Log within 5 seconds
+rule_end
+"""
+        # Alarm -> Notify (3) -> Escalate (4)
+        acyclic = sleec_content.replace("    R3 when Escalate then Notify within 2 seconds\n", "")
+        result = SleecToClingoConverter(ConverterConfig(auto_horizon=True)).convert_sleec_string(acyclic)
+        assert "time(0..7)." in result
+        assert "% Time horizon: 0..7 (longest deadline chain: R1 -> R2)" in result
+
+        with pytest.warns(HorizonWarning, match=r"max_time=6 truncates within deadlines: a chain of 2 rules \(R1 -> R2\)"):
+            SleecToClingoConverter(ConverterConfig(max_time=6)).convert_sleec_string(acyclic)
+
+        # Notify and Escalate can trigger each other without end, so no horizon is sufficient
+        with pytest.warns(HorizonWarning, match="Rules R2, R3 trigger each other in a cycle .* keeps max_time=12"):
+            result = SleecToClingoConverter(ConverterConfig(auto_horizon=True, max_time=12)).convert_sleec_string(sleec_content)
+        assert "time(0..12)." in result
+        assert "% Time horizon: 0..12 (max_time; rules R2, R3 form a cycle of within deadlines)" in result
+
+        # Long chains only show their ends
+        chain = "\n".join(f"    S{i} when E{i} then E{i + 1} within 1 seconds" for i in range(40))
+        events = "\n".join(f"    event E{i}" for i in range(41))
+        with pytest.warns(HorizonWarning, match=r"a chain of 40 rules \(S0 -> S1 -> S2 -> S3 -> \.\.\. \(32 more\) \.\.\. "
+                                                r"-> S36 -> S37 -> S38 -> S39\)"):
+            SleecToClingoConverter(ConverterConfig(max_time=8)).convert_sleec_string(
+                f"def_start\n{events}\ndef_end\nrule_start\n{chain}\nrule_end\n")
+
+    def test_time_units(self):
+        """Test that mixed within units share one time step of their greatest common divisor"""
+        sleec_content = """
+def_start
+    event Alarm
+    event Notify
+    event Escalate
+    constant escalateDelay = 2
+def_end
+
+rule_start
+    R1 when Alarm then Notify within 30 seconds
+    R2 when Notify then Escalate within escalateDelay minutes
+rule_end
+"""
+        config = ConverterConfig(time_units=True, auto_horizon=True)
+        result = SleecToClingoConverter(config).convert_sleec_string(sleec_content)
+
+        assert "% Time step: 1 step = 30 seconds (greatest common divisor of the within deadlines)" in result
+        assert "time(0..5)." in result
+        assert "consequent(r1, T) :- time(T), happens(notify, T, T2), T <= T2, T2 <= T+1, time(T2)." in result
+        assert "consequent(r2, T) :- time(T), happens(escalate, T, T2), T <= T2, T2 <= T+4, time(T2)." in result
+
+        # Without units every deadline is a number of time steps
+        result = SleecToClingoConverter(ConverterConfig(auto_horizon=True)).convert_sleec_string(sleec_content)
+        assert "time(0..32)." in result and "T2 <= T+2" in result
+
+    def test_within_constant_deadlines(self):
+        """Test that constant deadlines are emitted as their value so they fit the derived horizon"""
+        alarm = os.path.join(os.path.dirname(__file__), "..", "sleec_files", "uses_within", "alarm.sleec")
+        for encoding in ({}, {"within_encoding": "window"},
+                         {"within_encoding": "window", "within_deadline_predicates": True}):
+            result = SleecToClingoConverter(ConverterConfig(auto_horizon=True, **encoding)).convert_file(alarm)
+            assert "time(0..3)." in result and "+notifyDelay" not in result
+
+            pytest.importorskip("clingo")
+            # R2 is triggered at time 0 and its deadline ends inside the horizon
+            assert SleecSolver().solve(result + "\n:- not consequent(r2, 0).", models=1).satisfiable
+
+    def test_single_step_time_local_rules(self):
+        """Test that time-local rules are solved in one step whose answer sets expand to the horizon"""
+        from itertools import product
+        from converter.locality import TimeLocalityWarning, analyse_locality, expand_to_horizon
+
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    event Log
+    event Door
+    event Lock
+    measure isNight: boolean
+def_end
+
+rule_start
+    R1 when Motion then Alarm unless {isNight} then Log
+    R2 when Door then Lock
+rule_end
+"""
+        converter = SleecToClingoConverter(ConverterConfig(max_time=2, single_step=True))
+        result = converter.convert_sleec_string(sleec_content)
+        assert "time(0..0)." in result
+        assert "% Single time step" in result
+        locality = converter._get_locality()
+        assert locality.time_local and locality.local_parts == [["R1"], ["R2"]]
+
+        # A within constraint makes its part timed and keeps the full horizon
+        timed = sleec_content.replace("then Lock", "then Lock within 1 seconds")
+        converter = SleecToClingoConverter(ConverterConfig(max_time=2, single_step=True))
+        with pytest.warns(TimeLocalityWarning, match="R2"):
+            assert "time(0..2)." in converter.convert_sleec_string(timed)
+        parts = analyse_locality(converter.rules, converter._get_symbol_index())
+        assert parts.local_parts == [["R1"]] and parts.timed_parts == [["R2"]]
+
+        pytest.importorskip("clingo")
+
+        # Every combination of step answer sets is an answer set over the horizon, and nothing else
+        steps = set(TestUtils.answer_sets(result))
+        horizon = set(TestUtils.answer_sets(SleecToClingoConverter(ConverterConfig(max_time=2)).convert_sleec_string(sleec_content)))
+        assert {frozenset(expand_to_horizon(choice)) for choice in product(steps, repeat=3)} == horizon
+
+    def test_inertial_measures(self):
+        """Test that inertial measures keep their value except at their change events"""
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    event Dusk
+    measure isNight: boolean
+    measure mode: scale(low, high)
+def_end
+
+rule_start
+    R1 when Motion and {isNight} then Alarm
+    R2 when Motion and {mode} = high then Alarm
+rule_end
+"""
+        inertia = {"isNight": ["Dusk"], "mode": []}
+        config = ConverterConfig(max_time=2, inertial_measures=inertia)
+        result = SleecToClingoConverter(config).convert_sleec_string(sleec_content)
+        assert "{ happens(dusk, T, T) } :- time(T)." in result
+        assert "change_point(isnight, T) :- happens(dusk, _, T), T > 0." in result
+        assert "{ holds_at(isnight, T) } :- change_point(isnight, T)." in result
+        assert "holds_at(isnight, T) :- holds_at(isnight, T-1), time(T), not change_point(isnight, T)." in result
+        assert "% Inertial measure mode: constant over the time horizon" in result
+        assert "holds_at(mode, V, T) :- holds_at(mode, V, T-1), time(T), not change_point(mode, T)." in result
+
+        with pytest.raises(ValueError, match="Change event 'sunset'"):
+            SleecToClingoConverter(ConverterConfig(inertial_measures={"isNight": ["Sunset"]})).convert_sleec_string(sleec_content)
+
+        pytest.importorskip("clingo")
+
+        def models(program):
+            return TestUtils.answer_sets(program + "\n#show holds_at/3.")
+
+        inertial = models(result)
+        for model in inertial:
+            # mode never changes, isNight only changes when Dusk happens
+            assert len({atom.split(",")[1] for atom in model if atom.startswith("holds_at(mode,")}) == 1
+            for time_point in (1, 2):
+                changed = (f"holds_at(isnight,{time_point})" in model) != (f"holds_at(isnight,{time_point - 1})" in model)
+                assert not changed or f"happens(dusk,{time_point},{time_point})" in model
+
+        def trajectories(found):
+            return {frozenset(atom for atom in model if atom.startswith("holds_at")) for model in found}
+
+        free = models(SleecToClingoConverter(ConverterConfig(max_time=2)).convert_sleec_string(sleec_content))
+        assert trajectories(inertial) < trajectories(free)
+
+    def test_show_and_project_predicates(self):
+        """Test that show_predicates is used and #project restricts enumeration to the chosen symbols"""
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    measure isNight: boolean
+    measure level: numeric
+def_end
+
+rule_start
+    R1 when Motion and {isNight} then Alarm unless {level} > 1
+rule_end
+"""
+        config = ConverterConfig(max_time=1, numeric_max=2, show_predicates=["happens/3"],
+                                 project_symbols=["Motion", "Alarm", "isNight"])
+        result = SleecToClingoConverter(config).convert_sleec_string(sleec_content)
+        assert "#show happens/3." in result and "#show holds_at/2." not in result
+        assert "#project happens(motion, T1, T2) : happens(motion, T1, T2)." in result
+        assert "#project holds_at(isnight, T) : holds_at(isnight, T)." in result
+        assert "#project holds_at(level" not in result
+        assert config.clingo_suggestion == "--models=3 --project"
+        assert DEFAULT_CONFIG.clingo_suggestion == "--models=3"
+
+        with pytest.raises(ValueError, match="Siren"):
+            SleecToClingoConverter(ConverterConfig(project_symbols=["Siren"])).convert_sleec_string(sleec_content)
+
+        pytest.importorskip("clingo")
+
+        def models(program, project):
+            return TestUtils.answer_sets(program + "\n#show holds_at/2.", project=project)
+
+        # One answer set per distinct behaviour of Motion, Alarm and isNight, whatever level does
+        full = models(SleecToClingoConverter(ConverterConfig(max_time=1, numeric_max=2)).convert_sleec_string(sleec_content), False)
+        projected = models(result, True)
+        assert len(projected) == len(set(projected)) == len(set(full)) < len(full)
+
+    def test_numeric_abstraction(self):
+        """Test that numeric measures keep one value per threshold class and the same answer sets"""
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    measure motionCount: numeric
+    measure level: numeric
+    measure speed: numeric
+    constant maxMotions = 3
+def_end
+
+rule_start
+    R1 when Motion and ({motionCount} > maxMotions) then Alarm
+    R2 when Motion and (2 >= {motionCount}) then Alarm unless {level} > {speed}
+rule_end
+"""
+        abstract = ConverterConfig(max_time=0, numeric_max=5, numeric_abstraction=True)
+        result = SleecToClingoConverter(abstract).convert_sleec_string(sleec_content)
+        assert ("value_class(motioncount, 0, 0, 2). value_class(motioncount, 3, 3, 3). "
+                "value_class(motioncount, 4, 4, 5).") in result
+        # level is compared with another measure and keeps its full range
+        assert "{ holds_at(level, V, T) : V = 0..5 } :- time(T)." in result
+
+        clingo = pytest.importorskip("clingo")
+
+        def models(config):
+            program = (SleecToClingoConverter(config).convert_sleec_string(sleec_content)
+                       + "\n:- holds_at(level, _, _).\n:- holds_at(speed, _, _).\n#show holds_at/3.")
+            return {frozenset(map(clingo.parse_term, model)) for model in TestUtils.answer_sets(program)}
+
+        # Every concrete answer set maps onto an abstract one by replacing values with their class;
+        # level and speed are left unset to keep the enumeration small
+        def representative(symbol):
+            if symbol.name == "holds_at" and str(symbol.arguments[0]) == "motioncount":
+                value = symbol.arguments[1].number
+                value = 0 if value <= 2 else 3 if value == 3 else 4
+                return clingo.Function("holds_at", [symbol.arguments[0], clingo.Number(value), symbol.arguments[2]])
+            return symbol
+
+        concrete = models(ConverterConfig(max_time=0, numeric_max=5))
+        assert {frozenset(map(representative, model)) for model in concrete} == models(abstract)
+
+    def test_scenario_engine(self):
+        """Test that scenarios solved under assumptions match regrounding with the scenario as constraints"""
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    event Log
+    event Door
+    event Lock
+    measure isNight: boolean
+    measure level: numeric
+    measure mode: scale(low, high)
+def_end
+
+rule_start
+    R1 when Motion and {isNight} then Alarm unless {level} > 1 then Log
+    R2 when Door and {mode} = high then Lock
+rule_end
+"""
+        config = ConverterConfig(max_time=2, numeric_max=3, external_inputs=True)
+        result = SleecToClingoConverter(config).convert_sleec_string(sleec_content)
+        assert "#external happens(motion, T, T) : time(T)." in result
+        assert "#external holds_at(level, V, T) : time(T), V = 0..3." in result
+        assert ":- time(T), #count { V : holds_at(mode, V, T) } != 1." in result
+
+        pytest.importorskip("clingo")
+        from converter.scenarios import Scenario, ScenarioEngine
+
+        engine = ScenarioEngine(sleec_content, ConverterConfig(max_time=2, numeric_max=3))
+        scenarios = [
+            Scenario(events={"Motion": [0, 2]}, measures={"isNight": True, "level": [0, 0, 3]}),
+            Scenario(events={"Door": [1]}, measures={"mode": "high"}),
+            Scenario(events={"Motion": [1], "Door": [1]}, measures={"isNight": False, "mode": "low"}),
+        ]
+        answers = engine.query_all(scenarios)
+        assert answers[0].required == ["happens(alarm,0,0)", "happens(log,2,2)"]
+        assert answers[1].required == ["happens(lock,1,1)"]
+        assert answers[2].consistent and answers[2].required == []
+        assert engine.scenarios_solved == 3 and engine.throughput > 0
+
+        # The same questions asked by appending the scenario and grounding again
+        program = SleecToClingoConverter(ConverterConfig(max_time=2, numeric_max=3)).convert_sleec_string(sleec_content)
+        for scenario, answer in zip(scenarios, answers):
+            constraints = "\n".join(f":- {'not ' if value else ''}{symbol}." for symbol, value in engine.assumptions(scenario))
+            cautious = SleecSolver(arguments=["--enum-mode=cautious"]).solve(program + constraints, models=0)
+            expected = sorted(atom for atom in cautious.models[-1]
+                              if atom.startswith(("happens(alarm", "happens(log", "happens(lock")))
+            assert expected == answer.required
+
+        with pytest.raises(ValueError, match="'alarm' is not a triggering event"):
+            engine.query(Scenario(events={"Alarm": [0]}))
+        with pytest.raises(ValueError, match="outside 0..3"):
+            engine.query(Scenario(measures={"level": 7}))
+
+    def test_incremental_horizon(self):
+        """Test that each horizon of the incremental program has the answer sets of the fixed horizon"""
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    event Notify
+    measure isArmed: boolean
+def_end
+
+rule_start
+    R1 when Motion and {isArmed} then Alarm within 1 minutes
+    R2 when Alarm then Notify within 2 minutes
+rule_end
+"""
+        result = SleecToClingoConverter(ConverterConfig(incremental=True)).convert_sleec_string(sleec_content)
+        assert "#program step(t)." in result and "time(0.." not in result
+        assert "consequent(r2, T) :- time(T), happens(notify, T, T2), T <= T2, T2 <= T+2, time(T2), T = t-2." in result
+        assert ":- query(t), time(T), T > t-2, antecedent(r2, T), not consequent_by(r2, T, t)." in result
+
+        clingo = pytest.importorskip("clingo")
+        from converter.multishot import IncrementalSolver
+
+        control = clingo.Control(["--models=0", "--project"], logger=lambda code, message: None)
+        control.add("base", [], result)
+        control.ground([("base", [])])
+        for horizon in range(4):
+            control.ground([("step", [clingo.Number(horizon)]), ("check", [clingo.Number(horizon)])])
+            if horizon > 0:
+                control.release_external(clingo.Function("query", [clingo.Number(horizon - 1)]))
+            control.assign_external(clingo.Function("query", [clingo.Number(horizon)]), True)
+            models = set()
+            control.solve(on_model=lambda model: models.add(frozenset(map(str, model.symbols(shown=True)))))
+
+            fixed = SleecToClingoConverter(ConverterConfig(max_time=horizon)).convert_sleec_string(sleec_content)
+            assert models == set(TestUtils.answer_sets(fixed))
+
+        outcome = IncrementalSolver(sleec_content).run(max_steps=10)
+        assert (outcome.outcome, outcome.horizon) == ("sufficient", 3)
+        assert len(outcome.step_seconds) == 4
+
+    def test_conflict_analysis(self):
+        """Test that rule pairs checked under assumptions match one program per pair"""
+        sleec_content = """
+def_start
+    event Request
+    event Grant
+    event Deny
+    event Motion
+    event Alarm
+    measure isAdmin: boolean
+    measure level: numeric
+def_end
+
+rule_start
+    R1 when Request and {isAdmin} then Grant otherwise Deny
+    R2 when Request then Deny
+    R3 when Motion then Alarm
+    R4 when Motion and {level} > 5 then Alarm
+rule_end
+"""
+        pytest.importorskip("clingo")
+        from converter.conflicts import ConflictAnalyzer, activation_program
+
+        config = ConverterConfig(max_time=1, numeric_max=3)
+        analyzer = ConflictAnalyzer(sleec_content, config)
+        assert "exp(r1_otherwise) :- active(r1)." in analyzer.program
+        assert "triggered(r1) :- antecedent(r1, 0)." in analyzer.program
+
+        report = analyzer.analyse()
+        assert report.never_triggered == ["r4"] and report.unsatisfiable == []
+        assert report.pairs_checked == 3
+        assert [(conflict.rules, conflict.witness) for conflict in report.conflicts] == [
+            (("r1", "r2"), ["happens(request,0,0)", "holds_at(isadmin,0)"])]
+        assert "r1 conflicts with r2" in report.format()
+
+        # The same pairs checked with a program of their own
+        converter = SleecToClingoConverter(config)
+        program = activation_program(converter.convert_sleec_string(sleec_content), converter.rules)
+        for pair, conflicting in [(("r1", "r2"), True), (("r1", "r3"), False), (("r2", "r3"), False)]:
+            facts = "".join(f"active({rule_id}). :- not triggered({rule_id})." for rule_id in pair)
+            assert SleecSolver().solve(program + facts, models=1).satisfiable is not conflicting
+
     def test_multiple_rules_interaction(self):
         """Test conversion of multiple interacting rules"""
         sleec_content = """
@@ -376,6 +1060,172 @@ rule_end
         expected_antecedent = "antecedent(r1, T) :- happens(encounterhuman, T, T), holds_at(samelanguage, T), holds_at(humanunderstands, T), time(T)"
         assert expected_antecedent in result
 
+    def test_convert_batch(self):
+        """Test batch conversion over directories and globs with a process pool"""
+        from converter.batch import convert_batch
+
+        with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as output_dir:
+            nested = Path(source_dir, "nested")
+            nested.mkdir()
+            Path(source_dir, "lights.sleec").write_text(
+                "def_start\n event ButtonPress\n event LightOn\ndef_end\n"
+                "rule_start\n R1 when ButtonPress then LightOn\nrule_end\n")
+            Path(nested, "lights.sleec").write_text(
+                "def_start\n event DoorOpen\n event AlarmSound\ndef_end\n"
+                "rule_start\n R1 when DoorOpen then AlarmSound\nrule_end\n")
+            Path(nested, "broken.sleec").write_text("def_start\n event A\n")
+
+            report = convert_batch([source_dir, os.path.join(source_dir, "*.sleec")],
+                                   workers=2, output_dir=output_dir)
+
+            # Directories are searched recursively and duplicates from the glob dropped
+            assert len(report.results) == 3
+            assert report.workers == 2
+            assert [Path(result.source).name for result in report.failures] == ["broken.sleec"]
+            assert "def_end" in report.failures[0].error
+
+            # Equally named files in different directories do not collide
+            top = Path(output_dir, "lights_converted.lp").read_text()
+            inner = Path(output_dir, "nested", "lights_converted.lp").read_text()
+            assert "happens(lighton, T, T)" in top
+            assert "happens(alarmsound, T, T)" in inner
+            assert not Path(output_dir, "nested", "broken_converted.lp").exists()
+
+        # Unmatched paths are reported rather than ignored
+        report = convert_batch(["nonexistent_file.sleec"], workers=1)
+        assert report.failures[0].error == "Input file 'nonexistent_file.sleec' not found"
+
+    def test_incremental_update(self):
+        """Test that watch-mode updates only redo changed rules and match a full conversion"""
+        from converter.parser import SleecSyntaxWarning
+        from converter.watch import IncrementalConverter
+
+        sleec_content = """def_start
+    event ButtonPress
+    event LightOn
+    event AlarmSound
+    measure isNight: boolean
+def_end
+
+rule_start
+    R1 when ButtonPress and {isNight} then LightOn
+    R2 when LightOn then AlarmSound
+        unless {isNight}
+rule_end
+"""
+        converter = IncrementalConverter()
+        converter.update(sleec_content)
+        assert converter.last_update.full_parse
+
+        # Editing one rule re-parses and regenerates only that rule
+        edited = sleec_content.replace("R1 when ButtonPress and {isNight}", "\n\n    R1 when ButtonPress")
+        edited = edited.replace("unless {isNight}", "unless not {isNight}")
+        result = converter.update(edited)
+        stats = converter.last_update
+        assert not stats.full_parse
+        assert (stats.rules, stats.reparsed_rules, stats.regenerated_rules) == (2, 2, 2)
+        assert result == SleecToClingoConverter().convert_sleec_string(edited)
+
+        # Unchanged rules that moved keep correct source positions
+        moved = edited.replace("rule_start\n", "rule_start\n    R0 when ButtonPress then AlarmSound\n")
+        result = converter.update(moved)
+        assert converter.last_update.reparsed_rules == 1
+        assert [rule.line_number for rule in converter.rules] == [9, 12, 13]
+        assert result == SleecToClingoConverter().convert_sleec_string(moved)
+
+        # Renaming a rule to an id of an unchanged rule is reported like in a full parse
+        renamed = moved.replace("R2 when LightOn", "R1 when LightOn")
+        with pytest.warns(SleecSyntaxWarning, match=r"line 13, column 5: Duplicate rule id R1") as incremental:
+            result = converter.update(renamed)
+        assert not converter.last_update.full_parse
+        with pytest.warns(SleecSyntaxWarning) as full:
+            assert result == SleecToClingoConverter().convert_sleec_string(renamed)
+        assert [str(warning.message) for warning in incremental] == [str(warning.message) for warning in full]
+
+        # Changing definitions falls back to a full parse
+        converter.update(moved.replace("event AlarmSound", "event AlarmSound\n    event Unused"))
+        assert converter.last_update.full_parse
+
+    def test_benchmark_suite_flags_regressions(self):
+        """Test benchmark results on a real file and the baseline comparison"""
+        from benchmarks.suite import benchmark_file, compare, peak_memory_kib
+
+        lightswitch = os.path.join(os.path.dirname(__file__), "..", "sleec_files", "simple_rules", "lightswitch.sleec")
+        entry = benchmark_file(lightswitch, repeats=1)
+        assert entry["parse"]["seconds"] > 0 and entry["convert"]["peak_kib"] > 0
+        assert entry["output_bytes"] > 0
+        assert peak_memory_kib(lambda: bytearray(8 * 1024 * 1024)) >= 8 * 1024
+
+        baseline = {"files": {"a.sleec": {"parse": {"seconds": 0.010}, "output_bytes": 100},
+                              "b.sleec": {"parse": {"seconds": 0.010}}}}
+        results = {"files": {"a.sleec": {"parse": {"seconds": 0.011}, "output_bytes": 120},
+                             "b.sleec": {"parse": {"seconds": 0.020}},
+                             "c.sleec": {"parse": {"seconds": 1.0}}}}
+        regressions = compare(results, baseline)
+
+        # Small slowdowns are noise; growth in output size and large slowdowns are not
+        assert regressions == ["a.sleec: output_bytes 100 → 120",
+                               "b.sleec: parse 10.00 ms → 20.00 ms (2.00x)"]
+
+    def test_synthetic_workload(self):
+        """Test that synthetic workloads are reproducible, match their spec and convert"""
+        from benchmarks.synthetic import WorkloadSpec, generate_sleec
+
+        spec = WorkloadSpec(events=8, boolean_measures=2, numeric_measures=2, scale_measures=1, constants=2,
+                            rules=30, unless_rules=6, otherwise_rules=5, within_rules=4, seed=3)
+        content = generate_sleec(spec)
+        assert content == generate_sleec(spec)
+        assert content != generate_sleec(WorkloadSpec(**{**spec.__dict__, "seed": 4}))
+
+        parser = SleecParser()
+        events, measures, constants, rules = parser.parse_sleec_string(content)
+        assert (len(events), len(measures), len(constants), len(rules)) == (8, 5, 2, 30)
+        assert sum(1 for rule in rules if rule.unless_clauses) == 6
+        assert sum(1 for rule in rules if rule.otherwise_action) == 5
+        assert sum(1 for rule in rules if rule.within_constraint) == 4
+
+        assert "exp(r30)." in SleecToClingoConverter().convert_sleec_string(content)
+
+        with pytest.raises(ValueError):
+            generate_sleec(WorkloadSpec(rules=5, unless_rules=3, otherwise_rules=3))
+
+    def test_conversion_cache(self):
+        """Test cache keys, hits without parsing and LRU eviction"""
+        from converter.cache import ConversionCache
+
+        sleec_content = """
+def_start
+    event ButtonPress
+    event LightOn
+def_end
+
+rule_start
+    R1 when ButtonPress then LightOn
+rule_end
+"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ConversionCache(cache_dir)
+            first = cache.convert_sleec_string(sleec_content)
+            assert first == SleecToClingoConverter().convert_sleec_string(sleec_content)
+
+            # Line endings and trailing whitespace do not change the key; a hit skips parsing
+            with patch.object(SleecParser, "parse_sleec_string") as parse:
+                assert cache.convert_sleec_string(sleec_content.replace("\n", "  \r\n")) == first
+                parse.assert_not_called()
+            assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+            # Output-relevant configuration is part of the key
+            config = ConverterConfig(max_time=3)
+            assert "time(0..3)." in cache.convert_sleec_string(sleec_content, config)
+            assert cache.stats.misses == 2
+
+            # Least recently used entries are evicted beyond the size bound
+            cache.max_bytes = len(first.encode()) + 100
+            cache.convert_sleec_string(sleec_content.replace("LightOn", "LightOff"))
+            assert cache.stats.evictions == 2
+            assert "1 hits, 3 misses" in cache.report()
+            assert cache.stats.entries == 1
+
     # ========================================================================
     # ERROR HANDLING TESTS
     # ========================================================================
@@ -411,7 +1261,8 @@ rule_start
 rule_end
 """
         
-        result = self.converter.convert_sleec_string(sleec_content)
+        converter = SleecToClingoConverter(ConverterConfig(keep_unused_definitions=True))
+        result = converter.convert_sleec_string(sleec_content)
         
         # Should still generate basic structure
         assert "% DOMAIN DEFINITIONS" in result
@@ -449,13 +1300,49 @@ rule_start
 rule_end
 """
         
-        result = self.converter.convert_sleec_string(sleec_content)
+        # None of the measures is used by a rule, so keep them explicitly
+        converter = SleecToClingoConverter(ConverterConfig(keep_unused_definitions=True))
+        result = converter.convert_sleec_string(sleec_content)
         
         # Check measure instantiation
         assert "{ holds_at(boolmeasure, T) }" in result
         assert f"{{ holds_at(nummeasure, V, T) : {DEFAULT_CONFIG.numeric_range} }}" in result
         assert "holds_at(scalemeasure, low, T)" in result
 
+    def test_unused_definitions_pruned(self):
+        """Test that events, measures and constants no rule refers to are left out"""
+        sleec_content = """
+def_start
+    event Motion
+    event Alarm
+    event Reminder
+    measure isNight: boolean
+    measure level: numeric
+    constant delay = 2
+    constant unusedLimit = 9
+def_end
+
+rule_start
+    R1 when Motion and {isNight} then Alarm within delay seconds
+rule_end
+"""
+        converter = SleecToClingoConverter()
+        result = converter.convert_sleec_string(sleec_content)
+
+        assert converter.pruned.events == ["reminder"]
+        assert converter.pruned.measures == ["level"]
+        assert converter.pruned.constants == ["unusedlimit"]
+        assert "% Unused definitions left out: events: reminder; measures: level; constants: unusedlimit" in result
+        assert "event(reminder)." not in result
+        assert "holds_at(level" not in result
+        assert "event(motion)." in result and "{ holds_at(isnight, T) } :- time(T)." in result
+
+        kept = SleecToClingoConverter(ConverterConfig(keep_unused_definitions=True))
+        result = kept.convert_sleec_string(sleec_content)
+        assert not kept.pruned
+        assert "event(reminder)." in result
+        assert "{ holds_at(level, V, T)" in result
+
     # ========================================================================
     # UNLESS STATEMENT TESTS - TDD Implementation
     # ========================================================================
@@ -964,15 +1851,121 @@ rule_end
         assert r4.unless_clauses[1].action == "Vibrate"
         
         # Test R5: Rule with within constraint AND otherwise clause
-        # NOTE: Current parser doesn't support within+otherwise combination properly
         r5 = parser.rules[4]
         assert r5.id == "R5"
         assert r5.condition.strip() == "MotionDetected and {temperature} = hot"
         assert r5.action == "TurnOnFan"
         assert r5.within_constraint == "3 seconds"
-        assert r5.otherwise_action is None  # Current behavior: otherwise is ignored when within is present
+        assert r5.otherwise_action == "DoNothing"
         assert r5.unless_clauses is None
 
+    def test_parse_source_positions(self):
+        """Test that the single-pass parser records exact line, column and offset"""
+        sleec_content = """def_start
+    event MotionDetected // trailing comment
+  event TurnOnLight
+    measure isDaytime: boolean
+    constant maxLevel = 3
+def_end
+
+rule_start
+    R1 when MotionDetected then TurnOnLight
+      R2_1 when MotionDetected
+        and {isDaytime} then TurnOnLight
+    unless {isDaytime}
+rule_end
+"""
+        parser = SleecParser()
+        events, measures, constants, rules = parser.parse_sleec_string(sleec_content)
+
+        assert [(e.name, e.line_number, e.column) for e in events] == [("MotionDetected", 2, 5), ("TurnOnLight", 3, 3)]
+        assert (measures[0].line_number, measures[0].column) == (4, 5)
+        assert (constants[0].value, constants[0].line_number) == ("3", 5)
+        assert sleec_content[events[1].offset:].startswith("event TurnOnLight")
+
+        assert [(r.id, r.line_number, r.column) for r in rules] == [("R1", 9, 5), ("R2_1", 10, 7)]
+        assert sleec_content[rules[1].offset:].startswith("R2_1 when")
+
+        # Multi-line conditions are normalised and a bare unless waives the obligation
+        assert rules[1].condition == "MotionDetected and {isDaytime}"
+        assert rules[1].unless_clauses[0].condition == "{isDaytime}"
+        assert rules[1].unless_clauses[0].action == "not TurnOnLight"
+
+    def test_parse_syntax_error_reports_position(self):
+        """Test that syntax errors point at the offending token"""
+        sleec_content = """
+def_start
+    event ButtonPress
+    event LightOn
+def_end
+
+rule_start
+    R1 when ButtonPress then LightOn eventually
+rule_end
+"""
+        with pytest.raises(ValueError, match=r"line 8, column 38: Unexpected 'eventually'"):
+            SleecParser().parse_sleec_string(sleec_content)
+
+    def test_parse_clauses_after_within(self):
+        """Test that clauses after a within deadline are parsed and unless deadlines are reported"""
+        from converter.parser import SleecSyntaxWarning
+
+        sleec_content = """
+def_start
+    event Alarm
+    event Call
+    event Remind
+    event Log
+    measure busy: boolean
+def_end
+
+rule_start
+    R1 when Alarm then Call within 5 minutes
+    unless {busy} then Remind within 2 minutes
+    R2 when Alarm then Log within 1 minutes otherwise Remind
+rule_end
+"""
+        with pytest.warns(SleecSyntaxWarning, match=r"line 12, column 31: .*rule R1 must happen at once"):
+            _, _, _, rules = SleecParser().parse_sleec_string(sleec_content)
+        assert rules[0].within_constraint == "5 minutes"
+        assert [(clause.condition, clause.action) for clause in rules[0].unless_clauses] == [("{busy}", "Remind")]
+        assert (rules[1].within_constraint, rules[1].otherwise_action) == ("1 minutes", "Remind")
+
+        with pytest.raises(ValueError, match=r"line 13, column 45: Unexpected 'eventually'"):
+            SleecParser().parse_sleec_string(sleec_content.replace("otherwise Remind", "eventually"))
+
+    def test_parse_duplicate_rule_id(self):
+        """Test that a rule id used twice is reported at its second definition and the file still converts"""
+        from converter.parser import SleecSyntaxWarning
+
+        sleec_content = """
+def_start
+    event ButtonPress
+    event LightOn
+    event LightOff
+def_end
+
+rule_start
+    R1 when ButtonPress then LightOn
+rule_end
+
+rule_start
+    r1 when ButtonPress then LightOff
+rule_end
+"""
+        with pytest.warns(SleecSyntaxWarning, match=r"line 13, column 5: Duplicate rule id r1 \(rule R1 is already defined at line 9\)"):
+            rules = SleecParser().parse_sleec_string(sleec_content)[3]
+        assert [rule.id for rule in rules] == ["R1", "r1"]
+
+        # DressAssist defines Rule20_1 twice
+        dress_assist = os.path.join(os.path.dirname(__file__), "..", "sleec_files", "case_studies", "DressAssist.sleec")
+        with pytest.warns(SleecSyntaxWarning, match="Duplicate rule id Rule20_1"):
+            result = SleecToClingoConverter(ConverterConfig(max_time=2)).convert_file(dress_assist)
+        assert result.count("exp(rule20_1).") == 2
+
+        pytest.importorskip("clingo")
+        assert SleecSolver(ConverterConfig(max_time=2)).solve(result, models=1).satisfiable
+
 
 # ========================================================================
 # TEST UTILITIES
@@ -986,24 +1979,24 @@ class TestUtils:
         """Run clingo on generated code and return models"""
         if models is None:
             models = DEFAULT_CONFIG.utility_test_models
-            
+
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.lp', delete=False) as f:
-                f.write(clingo_code)
-                temp_file = f.name
-            
-            result = subprocess.run(['clingo', temp_file, f'--models={models}'], 
-                                  capture_output=True, text=True)
-            
-            os.unlink(temp_file)
-            
-            if result.returncode != 10:  # 10 is SAT in clingo
-                return None, result.stderr
-            
-            return result.stdout, None
-            
-        except Exception as e:
+            result = SleecSolver().solve(clingo_code, models)
+        except (ValueError, RuntimeError) as e:
             return None, str(e)
+        if not result.satisfiable:
+            return None, result.format()
+        return result.format(), None
+
+    @staticmethod
+    def solve_all(program, models=0, project=True):
+        """Solve a program with the clingo Python module; models=0 enumerates every answer set"""
+        return SleecSolver(arguments=["--project"] if project else [], backend="python").solve(program, models)
+
+    @staticmethod
+    def answer_sets(program, project=True):
+        """Every answer set of a program as a frozenset of its shown atoms"""
+        return [frozenset(model) for model in TestUtils.solve_all(program, project=project).models]
     
     @staticmethod
     def validate_rule_compliance(models_output, rules):
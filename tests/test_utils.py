@@ -6,11 +6,14 @@ Test Utilities for SLEEC to Clingo Converter
 Shared utility functions for testing the converter.
 """
 
-import tempfile
-import subprocess
 import os
+import sys
 from typing import Optional, Tuple
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from converter.solver import SleecSolver
+
 
 class TestUtils:
     """Utility functions for testing"""
@@ -19,22 +22,12 @@ class TestUtils:
     def run_clingo_on_result(clingo_code: str, models: int = 5) -> Tuple[Optional[str], Optional[str]]:
         """Run clingo on generated code and return models"""
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.lp', delete=False) as f:
-                f.write(clingo_code)
-                temp_file = f.name
-            
-            result = subprocess.run(['clingo', temp_file, f'--models={models}'], 
-                                  capture_output=True, text=True)
-            
-            os.unlink(temp_file)
-            
-            if result.returncode != 10:  # 10 is SAT in clingo
-                return None, result.stderr
-            
-            return result.stdout, None
-            
-        except Exception as e:
+            result = SleecSolver().solve(clingo_code, models)
+        except (ValueError, RuntimeError) as e:
             return None, str(e)
+        if not result.satisfiable:
+            return None, result.format()
+        return result.format(), None
     
     @staticmethod
     def validate_rule_compliance(models_output: str, rules) -> bool: